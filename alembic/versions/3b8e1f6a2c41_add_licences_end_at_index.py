@@ -0,0 +1,25 @@
+"""add licences end_at index
+
+Revision ID: 3b8e1f6a2c41
+Revises:
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e1f6a2c41'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Отчет по истекающим лицензиям: диапазон по end_at и курсор (end_at, id)
+    op.create_index('ix_licences_end_at_id', 'licences', ['end_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_licences_end_at_id', table_name='licences')
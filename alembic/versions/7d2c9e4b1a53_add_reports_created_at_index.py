@@ -0,0 +1,25 @@
+"""add reports created_at index
+
+Revision ID: 7d2c9e4b1a53
+Revises: 3b8e1f6a2c41
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2c9e4b1a53'
+down_revision = '3b8e1f6a2c41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Курсорный список отчетов: ORDER BY created_at DESC, id DESC
+    op.create_index('ix_reports_created_at_id', 'reports', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_created_at_id', table_name='reports')
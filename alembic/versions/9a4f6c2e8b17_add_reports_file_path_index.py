@@ -0,0 +1,25 @@
+"""add reports file_path index
+
+Revision ID: 9a4f6c2e8b17
+Revises: 7d2c9e4b1a53
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4f6c2e8b17'
+down_revision = '7d2c9e4b1a53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Проверка ссылок на файл хранилища отчетов перед его удалением
+    op.create_index('ix_reports_file_path', 'reports', ['file_path'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_file_path', table_name='reports')
@@ -3,6 +3,7 @@ Certificate Generation DTOs
 DTOs для генерации сертификата лицензии
 """
 from dataclasses import dataclass
+from typing import Dict, List
 
 
 @dataclass
@@ -22,3 +23,10 @@ class CertificateDataDTO:
     bg_image_en: str
     bg_image_kk: str
     sign_img: str
+
+
+@dataclass
+class CertificateBulkDTO:
+    """DTO для массовой генерации сертификатов"""
+    certificates: Dict[int, CertificateDataDTO]  # certificate_id -> данные, по возрастанию id
+    skipped_ids: List[int]  # сертификаты, по заявке которых нет решения
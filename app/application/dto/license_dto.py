@@ -176,3 +176,19 @@ class LicenseExpirationReportDTO:
     expired: list[LicenseShortDTO]  # Уже истекли
     upcoming: list[LicenseShortDTO]  # Будущие лицензии
     threshold_days: int  # Порог для "истекает скоро"
+
+
+@dataclass
+class ExpiringLicenseCertificateDTO:
+    """DTO строки отчета по истекающим лицензиям (лицензия и выданный по ней сертификат)"""
+    license_id: int
+    license_title: str
+    season_id: Optional[int]
+    end_at: date
+    days_until_expiry: int
+    # Поля сертификата пусты, если по лицензии не выдано сертификатов
+    certificate_id: Optional[int] = None
+    certificate_type: Optional[str] = None
+    club_id: Optional[int] = None
+    club_name: Optional[str] = None
+    club_bin: Optional[str] = None
@@ -50,6 +50,15 @@ class ReportListDTO:
     total_pages: int
 
 
+@dataclass
+class ReportCursorListDTO:
+    """DTO для списка отчетов с курсорной пагинацией"""
+    reports: list[ReportDTO]
+    page_size: int
+    next_cursor: Optional[str] = None  # None - страница последняя
+    total: Optional[int] = None  # заполняется по запросу, может отставать на REPORT_COUNT_CACHE_TTL
+
+
 @dataclass
 class GenerateReportResultDTO:
     """DTO для результата генерации отчета"""
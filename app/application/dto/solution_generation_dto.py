@@ -28,6 +28,14 @@ class SolutionCriteriaDTO:
     status: bool
 
 
+@dataclass
+class SolutionAggregateDTO:
+    """DTO с результатом агрегации документов решения"""
+    criteria: List[SolutionCriteriaDTO]
+    articles: List[SolutionArticleDTO]
+    experts: List[str]
+
+
 @dataclass
 class SolutionDataDTO:
     """DTO для данных решения по заявке"""
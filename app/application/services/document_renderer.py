@@ -0,0 +1,281 @@
+"""
+Document Renderer
+Рендеринг HTML шаблона в PDF одним потоком
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from app.core.instrumentation import observe_stage, stage_timer
+from app.domain.services.pdf_cache import IPdfCache
+from app.domain.services.pdf_generator import IPDFGenerator
+from app.domain.services.template_renderer import ITemplateRenderer
+
+
+# Режимы кеширования PDF
+PDF_CACHE_MODE_CONTENT = "content"      # ключ - данные шаблона (запросы к БД выполняются)
+PDF_CACHE_MODE_WATERMARK = "watermark"  # ключ - водяной знак updated_at (один запрос к БД)
+
+
+def build_document_cache_key(
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    template_names: List[str],
+    context: Dict[str, Any]
+) -> str:
+    """
+    Построить ключ кеша PDF документа
+
+    Ключ - хеш версий шаблонов, генератора PDF и данных шаблона: одинаковые
+    данные, отрендеренные теми же шаблонами, дают тот же документ.
+
+    Args:
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        template_names: Имена файлов шаблонов документа
+        context: Данные для шаблона
+
+    Returns:
+        Ключ документа (hex строка)
+
+    Raises:
+        FileNotFoundError: Если шаблон не найден
+    """
+    digest = _template_digest(template_renderer, pdf_generator, template_names)
+
+    # default=str - даты и прочие значения сериализуются так же, как выводятся в шаблоне
+    payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+    digest.update(b"|")
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _template_digest(
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    template_names: List[str]
+) -> Any:
+    """Начать хеш ключа с генератора PDF и версий шаблонов"""
+    digest = hashlib.sha256()
+    digest.update(type(pdf_generator).__name__.encode("utf-8"))
+    for template_name in template_names:
+        digest.update(f"|{template_name}:{template_renderer.get_template_version(template_name)}".encode("utf-8"))
+    return digest
+
+
+async def find_cached_by_watermark(
+    pdf_cache: Optional[IPdfCache],
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    template_names: List[str],
+    document_key: str,
+    get_watermark: Callable[[], Awaitable[Optional[str]]],
+    assets: List[str]
+) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Найти PDF в кеше по водяному знаку данных документа
+
+    Ключ строится без сборки данных документа: из водяного знака
+    (MAX(updated_at) и количество строк источников), версий шаблонов и
+    изображений. Сгенерированный при промахе PDF сохраняется под
+    возвращенным ключом.
+
+    Args:
+        pdf_cache: Кеш PDF (None - режим отключен)
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        template_names: Имена файлов шаблонов документа
+        document_key: Тип и ID документа (например, "solution:15")
+        get_watermark: Функция получения водяного знака данных
+        assets: Значения изображений, подставляемых в шаблон
+
+    Returns:
+        (ключ, PDF из кеша); ключ None если режим отключен или документ не найден
+    """
+    if pdf_cache is None:
+        return None, None
+
+    watermark = await get_watermark()
+    if watermark is None:
+        # Документ не найден - ошибку сформирует основной путь генерации
+        return None, None
+
+    digest = _template_digest(template_renderer, pdf_generator, template_names)
+    digest.update(f"|{document_key}|{watermark}".encode("utf-8"))
+    for asset in assets:
+        digest.update(b"|")
+        digest.update(asset.encode("utf-8"))
+
+    key = f"wm-{digest.hexdigest()}"
+    return key, await pdf_cache.get(key)
+
+
+async def render_document(
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    template_name: str,
+    context: Dict[str, Any],
+    pdf_cache: Optional[IPdfCache] = None
+) -> bytes:
+    """
+    Отрендерить шаблон и сгенерировать из него PDF
+
+    Если генератор принимает HTML потоком (streams_html), HTML передается
+    ему частями по мере рендеринга, иначе шаблон рендерится синхронно одной
+    строкой. Если передан кеш, повторная генерация документа с теми же
+    данными не выполняется.
+
+    Args:
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        template_name: Имя файла шаблона
+        context: Данные для шаблона
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
+
+    Returns:
+        Содержимое PDF файла
+
+    Raises:
+        FileNotFoundError: Если шаблон не найден
+        PdfGeneratorBusyError: Если генератор перегружен
+        Exception: Ошибки рендеринга и генерации PDF
+    """
+    if pdf_cache is not None:
+        key = build_document_cache_key(template_renderer, pdf_generator, [template_name], context)
+        return await pdf_cache.get_or_create(
+            key,
+            lambda: render_document(template_renderer, pdf_generator, template_name, context)
+        )
+
+    if not pdf_generator.streams_html:
+        # Генератор все равно соберет HTML целиком - синхронный рендеринг быстрее потокового
+        with stage_timer("template"):
+            html_content = template_renderer.render(template_name, context)
+        with stage_timer("pdf"):
+            return await pdf_generator.generate_pdf(html_content)
+
+    started = time.perf_counter()
+    template_seconds = [0.0]
+    html_chunks = _timed_chunks(template_renderer.render_stream(template_name, context), template_seconds)
+
+    # Первый фрагмент получаем заранее: ошибки поиска шаблона возникают
+    # до обращения к генератору, а не посреди отправки запроса.
+    # Пустой шаблон не дает ни одного фрагмента - генератор получает пустой HTML,
+    # как и при синхронном рендеринге
+    first_chunk = await anext(html_chunks, "")
+
+    pdf_content = await pdf_generator.generate_pdf_stream(_prepend(first_chunk, html_chunks))
+
+    # Шаблон рендерится по мере отправки HTML генератору: этап template - время
+    # получения фрагментов, этап pdf - остальное время генерации
+    observe_stage("template", template_seconds[0])
+    observe_stage("pdf", time.perf_counter() - started - template_seconds[0])
+    return pdf_content
+
+
+async def render_documents(
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    template_name: str,
+    contexts: List[Dict[str, Any]],
+    concurrency: int,
+    pdf_cache: Optional[IPdfCache] = None
+) -> List[bytes]:
+    """
+    Отрендерить несколько документов по одному шаблону параллельно
+
+    Одновременно генерируется не более concurrency документов; если один
+    документ не удался, остальные отменяются.
+
+    Args:
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        template_name: Имя файла шаблона
+        contexts: Данные шаблона для каждого документа
+        concurrency: Максимальное количество одновременных рендеров
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
+
+    Returns:
+        Содержимое PDF файлов в порядке contexts
+
+    Raises:
+        FileNotFoundError: Если шаблон не найден
+        PdfGeneratorBusyError: Если генератор перегружен
+        Exception: Ошибки рендеринга и генерации PDF
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def render(context: Dict[str, Any]) -> bytes:
+        async with semaphore:
+            return await render_document(template_renderer, pdf_generator, template_name, context, pdf_cache)
+
+    tasks = [asyncio.ensure_future(render(context)) for context in contexts]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def iter_rendered(
+    renders: Iterable[Callable[[], Awaitable[bytes]]],
+    concurrency: int
+) -> AsyncIterator[bytes]:
+    """
+    Выполнять рендеры документов параллельно и отдавать результаты по порядку
+
+    Одновременно выполняется не более concurrency рендеров, и готовых, но еще
+    не полученных потребителем документов тоже не более concurrency: память
+    не растет с размером пакета. При ошибке или закрытии итератора
+    незавершенные рендеры отменяются.
+
+    Args:
+        renders: Функции рендеринга документов в порядке выдачи
+        concurrency: Максимальное количество одновременных рендеров
+
+    Yields:
+        Содержимое PDF файлов в порядке renders
+    """
+    renders = iter(renders)
+    window: Deque[asyncio.Future] = deque()
+
+    def schedule() -> None:
+        while len(window) < max(1, concurrency):
+            render = next(renders, None)
+            if render is None:
+                return
+            window.append(asyncio.ensure_future(render()))
+
+    try:
+        schedule()
+        while window:
+            content = await window.popleft()
+            schedule()
+            yield content
+    finally:
+        for task in window:
+            task.cancel()
+
+
+async def _timed_chunks(html_chunks: AsyncIterator[str], elapsed: List[float]) -> AsyncIterator[str]:
+    """Передать фрагменты HTML дальше, накапливая в elapsed[0] время их получения"""
+    while True:
+        started = time.perf_counter()
+        try:
+            chunk = await html_chunks.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            elapsed[0] += time.perf_counter() - started
+        yield chunk
+
+
+async def _prepend(first_chunk: str, html_chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Вернуть полученный заранее фрагмент перед остальными"""
+    yield first_chunk
+    async for chunk in html_chunks:
+        yield chunk
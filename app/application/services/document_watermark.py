@@ -0,0 +1,47 @@
+"""
+Document Watermark
+Водяной знак данных документа: MAX(updated_at) и количество строк по таблицам-источникам
+"""
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Источник данных документа: (модель с TimestampMixin, условие отбора строк)
+WatermarkSource = Tuple[Any, Any]
+
+
+async def fetch_watermark(db: AsyncSession, sources: Sequence[WatermarkSource]) -> Optional[str]:
+    """
+    Получить водяной знак данных документа одним запросом
+
+    Для каждого источника выбираются MAX(updated_at) и COUNT(*): изменение
+    строки меняет максимум, удаление - количество. Первый источник - сама
+    запись документа; если она не найдена, возвращается None.
+
+    Args:
+        db: Сессия БД
+        sources: Источники данных документа, первый - корневая запись
+
+    Returns:
+        Строка водяного знака или None если документ не найден
+    """
+    parts = [
+        select(
+            literal(index).label("part"),
+            func.max(model.updated_at).label("updated_at"),
+            func.count().label("rows")
+        )
+        .select_from(model)
+        .where(criteria)
+        for index, (model, criteria) in enumerate(sources)
+    ]
+
+    result = await db.execute(union_all(*parts))
+    rows = sorted(result.all(), key=lambda row: row.part)
+
+    if not rows or not rows[0].rows:
+        return None
+
+    return ";".join(f"{row.updated_at}:{row.rows}" for row in rows)
@@ -0,0 +1,218 @@
+"""
+Document Job Queue
+Очередь фоновой генерации документов с приоритетами
+"""
+import asyncio
+import itertools
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.domain.entities.report import Report, ReportStatus, ReportType
+from app.domain.services.report_service import ReportDomainService
+
+
+class JobQueueFullError(Exception):
+    """Очередь фоновой генерации заполнена"""
+
+    def __init__(self, message: str, retry_after: int):
+        """
+        Args:
+            message: Сообщение об ошибке
+            retry_after: Через сколько секунд имеет смысл повторить отправку
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class DocumentJob:
+    """
+    Фоновая задача генерации документа
+
+    Жизненный цикл (PENDING -> PROCESSING -> COMPLETED/FAILED) ведется
+    сущностью Report.
+
+    Attributes:
+        id: Идентификатор задачи
+        report: Отчет с типом, параметрами и статусом генерации
+        priority: Приоритет в очереди (чем выше, тем раньше)
+        filename: Имя файла результата
+        run: Функция генерации документа (освобождается после выполнения)
+        result: Содержимое сгенерированного документа (None - результат сохранила сама задача)
+        finished_at: Время завершения (time.monotonic) для удаления по TTL
+    """
+    id: str
+    report: Report
+    priority: int
+    filename: str
+    run: Optional[Callable[[], Awaitable[Optional[bytes]]]] = None
+    result: Optional[bytes] = None
+    finished_at: Optional[float] = None
+
+
+class DocumentJobQueue:
+    """
+    Очередь фоновой генерации документов
+
+    Задачи выполняются пулом воркеров в порядке приоритета
+    (ReportDomainService.calculate_report_priority), при равном
+    приоритете - в порядке поступления. Результаты хранятся в памяти
+    процесса result_ttl секунд после завершения, поэтому статус и
+    результат задачи доступны только в процессе, который ее принял.
+    """
+
+    def __init__(self, workers: int, max_pending: int, result_ttl: int, retry_after: int):
+        """
+        Инициализация очереди
+
+        Args:
+            workers: Количество одновременно выполняемых задач
+            max_pending: Максимальное количество задач, ожидающих выполнения
+            result_ttl: Сколько секунд хранить завершенные задачи
+            retry_after: Через сколько секунд повторить отправку, если очередь заполнена
+        """
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.retry_after = retry_after
+        self._jobs: Dict[str, DocumentJob] = {}
+        self._sequence = itertools.count()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Запустить воркеры (вызывается при старте приложения)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Остановить воркеры; незавершенные задачи отмечаются как неудачные"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+        for job in self._jobs.values():
+            if job.report.status in (ReportStatus.PENDING, ReportStatus.PROCESSING):
+                job.report.mark_as_failed("Service is shutting down")
+
+    def submit(
+        self,
+        name: str,
+        report_type: ReportType,
+        parameters: Dict[str, Any],
+        filename: str,
+        run: Callable[[], Awaitable[Optional[bytes]]]
+    ) -> DocumentJob:
+        """
+        Поставить задачу генерации документа в очередь
+
+        Args:
+            name: Название задачи
+            report_type: Тип отчета (определяет приоритет)
+            parameters: Параметры генерации
+            filename: Имя файла результата
+            run: Функция генерации документа (возвращает содержимое или None)
+
+        Returns:
+            Созданная задача в статусе PENDING
+
+        Raises:
+            JobQueueFullError: Если очередь заполнена
+            RuntimeError: Если воркеры не запущены
+        """
+        if self._queue is None:
+            raise RuntimeError("Job queue is not started")
+
+        self._purge_expired()
+
+        if self._queue.qsize() >= self.max_pending:
+            raise JobQueueFullError(
+                f"Job queue is full ({self.max_pending} pending jobs)",
+                retry_after=self.retry_after
+            )
+
+        now = datetime.utcnow()
+        report = Report(
+            name=name,
+            report_type=report_type,
+            parameters=parameters,
+            created_at=now,
+            updated_at=now
+        )
+        job = DocumentJob(
+            id=uuid.uuid4().hex,
+            report=report,
+            priority=ReportDomainService.calculate_report_priority(report),
+            filename=filename,
+            run=run
+        )
+
+        self._jobs[job.id] = job
+        self._queue.put_nowait(self._queue_item(job))
+        return job
+
+    def get(self, job_id: str) -> Optional[DocumentJob]:
+        """
+        Получить задачу по ID
+
+        Args:
+            job_id: ID задачи
+
+        Returns:
+            Задача или None если не найдена или удалена по TTL
+        """
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Получить количество задач по статусам"""
+        self._purge_expired()
+        counts = {status.value: 0 for status in ReportStatus}
+        for job in self._jobs.values():
+            counts[job.report.status.value] += 1
+        return {"workers": self.workers, "max_pending": self.max_pending, **counts}
+
+    def _queue_item(self, job: DocumentJob) -> Tuple[int, int, str]:
+        """Элемент очереди: сначала высокий приоритет, затем порядок поступления"""
+        return -job.priority, next(self._sequence), job.id
+
+    async def _worker(self) -> None:
+        """Выполнять задачи из очереди"""
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.run is None:
+                continue
+
+            job.report.mark_as_processing()
+            try:
+                content = await job.run()
+            except asyncio.CancelledError:
+                job.report.mark_as_failed("Service is shutting down")
+                raise
+            except Exception as e:
+                job.report.mark_as_failed(str(e) or type(e).__name__)
+            else:
+                job.result = content
+                job.report.mark_as_completed(job.filename)
+            finally:
+                # Замыкание держит ссылки на сервисы и данные - освобождаем
+                job.run = None
+                job.finished_at = time.monotonic()
+
+    def _purge_expired(self) -> None:
+        """Удалить завершенные задачи старше result_ttl"""
+        deadline = time.monotonic() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < deadline
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
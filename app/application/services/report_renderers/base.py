@@ -0,0 +1,84 @@
+"""
+Template Report Renderer
+Базовый генератор отчета: данные из БД -> HTML шаблон -> PDF
+"""
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.document_renderer import render_document
+from app.domain.entities.report import Report
+from app.domain.services.pdf_cache import IPdfCache
+from app.domain.services.pdf_generator import IPDFGenerator
+from app.domain.services.report_renderer import IReportRenderer
+from app.domain.services.template_renderer import ITemplateRenderer
+
+
+class TemplateReportRenderer(IReportRenderer):
+    """
+    Базовый генератор отчета по HTML шаблону
+
+    Наследник задает template_name и собирает данные шаблона в build_context.
+    """
+
+    # Имя файла шаблона отчета
+    template_name: str = ""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        template_renderer: ITemplateRenderer,
+        pdf_generator: IPDFGenerator,
+        logo_base64: str,
+        pdf_cache: Optional[IPdfCache] = None
+    ):
+        """
+        Инициализация генератора
+
+        Args:
+            db: Сессия БД
+            template_renderer: Сервис рендеринга шаблонов
+            pdf_generator: Сервис генерации PDF
+            logo_base64: Логотип для шапки отчета
+            pdf_cache: Кеш сгенерированных PDF (None - без кеша)
+        """
+        self.db = db
+        self.template_renderer = template_renderer
+        self.pdf_generator = pdf_generator
+        self.logo_base64 = logo_base64
+        self.pdf_cache = pdf_cache
+
+    async def render(self, report: Report) -> bytes:
+        """Собрать данные отчета и сгенерировать PDF"""
+        context = await self.build_context(report.parameters or {})
+        context.update({
+            "report_name": report.name,
+            "date": datetime.now().strftime("%d.%m.%Y"),
+            "logo_base64": self.logo_base64,
+        })
+
+        return await render_document(
+            self.template_renderer,
+            self.pdf_generator,
+            self.template_name,
+            context,
+            pdf_cache=self.pdf_cache
+        )
+
+    @abstractmethod
+    async def build_context(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Собрать данные для шаблона отчета
+
+        Args:
+            parameters: Параметры отчета
+
+        Returns:
+            Словарь данных для шаблона
+
+        Raises:
+            ValueError: Если параметры некорректны или данные не найдены
+        """
+        pass
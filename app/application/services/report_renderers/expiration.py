@@ -0,0 +1,57 @@
+"""
+Expiration Report
+Отчет по истекающим лицензиям и выданным по ним сертификатам
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.application.services.report_renderers.base import TemplateReportRenderer
+from app.application.use_cases.list_expiring_licenses import MAX_PAGE_SIZE, ListExpiringLicensesUseCase
+
+
+class ExpirationReportRenderer(TemplateReportRenderer):
+    """Генератор отчета EXPIRATION_REPORT (параметр days_threshold)"""
+
+    template_name = "expiration_report_template.html"
+
+    async def build_context(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Собрать истекающие лицензии постранично по курсору"""
+        try:
+            days_threshold = int(parameters["days_threshold"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("days_threshold must be a positive integer")
+
+        today = date.today()
+        use_case = ListExpiringLicensesUseCase(self.db)
+        licenses: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+
+        while True:
+            page = await use_case.execute(days_threshold, limit=MAX_PAGE_SIZE, cursor=cursor, today=today)
+            for item in page.items:
+                # Строки отсортированы по лицензии - новая лицензия начинает новую группу
+                if not licenses or licenses[-1]["id"] != item.license_id:
+                    licenses.append({
+                        "id": item.license_id,
+                        "title": item.license_title,
+                        "end_at": item.end_at.strftime("%d.%m.%Y"),
+                        "days_until_expiry": item.days_until_expiry,
+                        "certificates": [],
+                    })
+                if item.certificate_id is not None:
+                    licenses[-1]["certificates"].append({
+                        "id": item.certificate_id,
+                        "club": item.club_name or "",
+                        "bin": item.club_bin or "",
+                        "type": item.certificate_type or "",
+                    })
+
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        return {
+            "days_threshold": days_threshold,
+            "date_to": (today + timedelta(days=days_threshold)).strftime("%d.%m.%Y"),
+            "licenses": licenses,
+        }
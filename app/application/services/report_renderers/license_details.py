@@ -0,0 +1,94 @@
+"""
+License Details Report
+Детальный отчет по лицензиям: сроки действия и выданные сертификаты
+"""
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.application.services.report_renderers.base import TemplateReportRenderer
+from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.license import LicenseModel
+from app.infrastructure.database.models.license_certificate import LicenseCertificateModel
+
+
+class LicenseDetailsReportRenderer(TemplateReportRenderer):
+    """Генератор отчета LICENSE_DETAILS (параметр license_ids)"""
+
+    template_name = "license_details_report_template.html"
+
+    async def build_context(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Собрать данные лицензий и их сертификатов"""
+        if "license_ids" not in parameters:
+            raise ValueError("License details report supports only license_ids parameter")
+
+        try:
+            license_ids = [int(license_id) for license_id in parameters["license_ids"]]
+        except (TypeError, ValueError):
+            raise ValueError("license_ids must be a list of integers")
+        if not license_ids:
+            raise ValueError("license_ids must not be empty")
+
+        licenses = await self._get_licenses(license_ids)
+        missing_ids = sorted(set(license_ids) - {license_entity.id for license_entity in licenses})
+        if missing_ids:
+            raise ValueError(f"Licenses not found: {missing_ids}")
+
+        certificates_by_license: Dict[int, List[Dict[str, Any]]] = {}
+        for row in await self._get_certificates(license_ids):
+            certificates_by_license.setdefault(row.license_id, []).append({
+                "id": row.id,
+                "club": row.full_name_ru,
+                "bin": row.bin,
+                "type": row.type_ru or "",
+            })
+
+        return {
+            "licenses": [
+                {
+                    "id": license_entity.id,
+                    "title": license_entity.title_ru,
+                    "season": license_entity.season.title_ru if license_entity.season else "",
+                    "league": license_entity.league.title_ru if license_entity.league else "",
+                    "start_at": license_entity.start_at.strftime("%d.%m.%Y") if license_entity.start_at else "",
+                    "end_at": license_entity.end_at.strftime("%d.%m.%Y") if license_entity.end_at else "",
+                    "is_active": license_entity.is_active,
+                    "certificates": certificates_by_license.get(license_entity.id, []),
+                }
+                for license_entity in licenses
+            ]
+        }
+
+    async def _get_licenses(self, license_ids: List[int]) -> List[LicenseModel]:
+        """Получить лицензии с сезоном и лигой"""
+        query = (
+            select(LicenseModel)
+            .where(LicenseModel.id.in_(license_ids))
+            .options(
+                selectinload(LicenseModel.season),
+                selectinload(LicenseModel.league)
+            )
+            .order_by(LicenseModel.id)
+        )
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _get_certificates(self, license_ids: List[int]) -> List[Any]:
+        """Получить сертификаты лицензий с клубами (только нужные колонки)"""
+        query = (
+            select(
+                LicenseCertificateModel.id,
+                LicenseCertificateModel.license_id,
+                LicenseCertificateModel.type_ru,
+                ClubModel.full_name_ru,
+                ClubModel.bin
+            )
+            .join(ClubModel, ClubModel.id == LicenseCertificateModel.club_id)
+            .where(LicenseCertificateModel.license_id.in_(license_ids))
+            .order_by(LicenseCertificateModel.license_id, ClubModel.full_name_ru, LicenseCertificateModel.id)
+        )
+
+        result = await self.db.execute(query)
+        return list(result.all())
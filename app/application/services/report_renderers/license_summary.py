@@ -0,0 +1,169 @@
+"""
+License Summary Report
+Сводный отчет по лицензированию за период: пройденные и непройденные документы и критерии
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy import case, func, select
+
+from app.application.services.report_renderers.base import TemplateReportRenderer
+from app.infrastructure.database.models.application import ApplicationModel
+from app.infrastructure.database.models.application_criteria import ApplicationCriteriaModel
+from app.infrastructure.database.models.application_document import ApplicationDocumentModel
+from app.infrastructure.database.models.category_document import CategoryDocumentModel
+from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.license import LicenseModel
+
+
+# Сколько строк результата запроса держать в памяти одновременно
+STREAM_BATCH_SIZE = 500
+
+# Счетчики строк отчета
+COUNTERS = ("documents_total", "documents_passed", "criteria_total", "criteria_passed")
+# Колонки с количествами (SUM в MySQL возвращает Decimal)
+COUNT_COLUMNS = ("applications",) + COUNTERS
+
+
+class LicenseSummaryReportRenderer(TemplateReportRenderer):
+    """
+    Генератор отчета LICENSE_SUMMARY (параметры date_from, date_to, необязательный season_id)
+
+    Все подсчеты выполняются в БД группировкой; в память приходят только
+    итоговые строки по клубам и категориям, которые читаются потоком. Объем
+    памяти зависит от количества клубов и категорий, а не документов.
+    """
+
+    template_name = "license_summary_report_template.html"
+
+    async def build_context(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Посчитать итоги по клубам и категориям за период"""
+        date_from = self._parse_date(parameters, "date_from")
+        date_to = self._parse_date(parameters, "date_to")
+        if date_from > date_to:
+            raise ValueError("date_from must not be later than date_to")
+
+        season_id = self._parse_season_id(parameters)
+        application_ids = self._application_ids(date_from, date_to, season_id)
+
+        clubs = [row async for row in self._stream(self._clubs_query(application_ids))]
+        categories = [row async for row in self._stream(self._categories_query(application_ids))]
+
+        totals = {counter: sum(row[counter] for row in clubs) for counter in COUNTERS}
+        totals["applications"] = sum(row["applications"] for row in clubs)
+
+        return {
+            "date_from": date_from.strftime("%d.%m.%Y"),
+            "date_to": date_to.strftime("%d.%m.%Y"),
+            "clubs": [self._with_failed(row) for row in clubs],
+            "categories": [self._with_failed(row) for row in categories],
+            "totals": self._with_failed(totals),
+        }
+
+    def _application_ids(self, date_from: date, date_to: date, season_id: Optional[int]):
+        """Подзапрос ID заявок, поданных за период (и сезон)"""
+        query = select(ApplicationModel.id).where(
+            ApplicationModel.created_at >= datetime.combine(date_from, time.min),
+            ApplicationModel.created_at < datetime.combine(date_to + timedelta(days=1), time.min)
+        )
+        if season_id is not None:
+            query = (
+                query
+                .join(LicenseModel, LicenseModel.id == ApplicationModel.license_id)
+                .where(LicenseModel.season_id == season_id)
+            )
+        return query
+
+    def _clubs_query(self, application_ids):
+        """Итоги по клубам и лицензиям: счетчики документов и критериев считаются по заявке, затем суммируются"""
+        documents = self._passed_counts(ApplicationDocumentModel, ApplicationDocumentModel.application_id, application_ids)
+        criteria = self._passed_counts(ApplicationCriteriaModel, ApplicationCriteriaModel.application_id, application_ids)
+
+        return (
+            select(
+                ClubModel.full_name_ru.label("club"),
+                LicenseModel.title_ru.label("license"),
+                func.count(ApplicationModel.id).label("applications"),
+                func.coalesce(func.sum(documents.c.total), 0).label("documents_total"),
+                func.coalesce(func.sum(documents.c.passed), 0).label("documents_passed"),
+                func.coalesce(func.sum(criteria.c.total), 0).label("criteria_total"),
+                func.coalesce(func.sum(criteria.c.passed), 0).label("criteria_passed")
+            )
+            .select_from(ApplicationModel)
+            .join(ClubModel, ClubModel.id == ApplicationModel.club_id)
+            .join(LicenseModel, LicenseModel.id == ApplicationModel.license_id)
+            .outerjoin(documents, documents.c.key == ApplicationModel.id)
+            .outerjoin(criteria, criteria.c.key == ApplicationModel.id)
+            .where(ApplicationModel.id.in_(application_ids))
+            .group_by(ClubModel.id, ClubModel.full_name_ru, LicenseModel.id, LicenseModel.title_ru)
+            .order_by(ClubModel.full_name_ru, LicenseModel.title_ru)
+        )
+
+    def _categories_query(self, application_ids):
+        """Итоги по категориям документов"""
+        documents = self._passed_counts(ApplicationDocumentModel, ApplicationDocumentModel.category_id, application_ids)
+        criteria = self._passed_counts(ApplicationCriteriaModel, ApplicationCriteriaModel.category_id, application_ids)
+
+        return (
+            select(
+                CategoryDocumentModel.title_ru.label("category"),
+                func.coalesce(documents.c.total, 0).label("documents_total"),
+                func.coalesce(documents.c.passed, 0).label("documents_passed"),
+                func.coalesce(criteria.c.total, 0).label("criteria_total"),
+                func.coalesce(criteria.c.passed, 0).label("criteria_passed")
+            )
+            .outerjoin(documents, documents.c.key == CategoryDocumentModel.id)
+            .outerjoin(criteria, criteria.c.key == CategoryDocumentModel.id)
+            .where((documents.c.total.is_not(None)) | (criteria.c.total.is_not(None)))
+            .order_by(CategoryDocumentModel.level, CategoryDocumentModel.title_ru)
+        )
+
+    @staticmethod
+    def _passed_counts(model, key_column, application_ids):
+        """Подзапрос: количество строк и прошедших финальную проверку по ключу группировки"""
+        return (
+            select(
+                key_column.label("key"),
+                func.count().label("total"),
+                func.sum(case((model.is_final_passed.is_(True), 1), else_=0)).label("passed")
+            )
+            .where(model.application_id.in_(application_ids))
+            .group_by(key_column)
+            .subquery()
+        )
+
+    async def _stream(self, query) -> AsyncIterator[Dict[str, Any]]:
+        """Читать строки результата порциями по STREAM_BATCH_SIZE"""
+        result = await self.db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for row in result.mappings():
+            yield {
+                key: int(value) if key in COUNT_COLUMNS else value
+                for key, value in row.items()
+            }
+
+    @staticmethod
+    def _with_failed(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Добавить количество непройденных документов и критериев"""
+        return {
+            **row,
+            "documents_failed": row["documents_total"] - row["documents_passed"],
+            "criteria_failed": row["criteria_total"] - row["criteria_passed"],
+        }
+
+    @staticmethod
+    def _parse_season_id(parameters: Dict[str, Any]) -> Optional[int]:
+        """Разобрать необязательный параметр season_id"""
+        if parameters.get("season_id") is None:
+            return None
+        try:
+            return int(parameters["season_id"])
+        except (TypeError, ValueError):
+            raise ValueError("season_id must be an integer")
+
+    @staticmethod
+    def _parse_date(parameters: Dict[str, Any], name: str) -> date:
+        """Разобрать дату параметра в формате YYYY-MM-DD"""
+        try:
+            return date.fromisoformat(str(parameters[name]))
+        except (KeyError, ValueError):
+            raise ValueError(f"{name} must be a date in YYYY-MM-DD format")
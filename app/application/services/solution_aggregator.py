@@ -0,0 +1,113 @@
+"""
+Solution Aggregator
+Агрегация документов решения за один проход: критерии, статьи и эксперты
+"""
+from typing import Any, Dict, Iterable, List
+
+from app.application.dto.solution_generation_dto import (
+    SolutionAggregateDTO,
+    SolutionArticleDTO,
+    SolutionCriteriaDTO,
+    SolutionDocItemDTO,
+)
+from app.application.dto.report_generation_dto import CategoryExpertMapping
+
+
+def aggregate_solution_documents(
+    application_documents: Iterable[Any],
+    criteria_by_category: Dict[int, Any],
+    expert_mapper: CategoryExpertMapping
+) -> SolutionAggregateDTO:
+    """
+    Сгруппировать документы решения по критериям за один проход
+
+    Чистая синхронная функция без обращений к БД: все связи документов
+    (category, document) и критерии должны быть загружены заранее.
+
+    Args:
+        application_documents: Документы заявки (ApplicationDocumentModel)
+        criteria_by_category: Критерии заявки, category_id -> ApplicationCriteriaModel
+        expert_mapper: Маппер должностей экспертов по категориям
+
+    Returns:
+        SolutionAggregateDTO с критериями, статьями и экспертами
+    """
+    # criteria.id -> {"title", "failed_titles", "failed_docs"}
+    grouped: Dict[int, Dict] = {}
+    # category.id -> строка эксперта
+    experts: Dict[int, str] = {}
+
+    for doc in application_documents:
+        criteria = criteria_by_category.get(doc.category_id)
+        if not criteria:
+            continue
+
+        category = doc.category
+
+        group = grouped.get(criteria.id)
+        if group is None:
+            group = grouped[criteria.id] = {
+                "title": category.title_ru if category else "Категория",
+                "failed_titles": [],
+                "failed_docs": []
+            }
+
+        # is_final_passed не заполнен => требование не выполнено
+        if doc.is_final_passed is None:
+            title = doc.document.title_ru or "Документ"
+            deadline_str = (
+                f"Устранить несоответствие в срок до {doc.deadline.strftime('%d.%m.%Y')}"
+                if doc.deadline
+                else "Устранить несоответствие в установленный срок"
+            )
+
+            group["failed_titles"].append(title)
+            group["failed_docs"].append(
+                SolutionDocItemDTO(
+                    title=title,
+                    comment=doc.control_comment if doc.control_comment else doc.industry_comment,
+                    deadline=deadline_str
+                )
+            )
+
+        # Эксперт - один на категорию, должность определяет маппер
+        if criteria.checked_by and category and category.id not in experts:
+            position = expert_mapper.get_position_for_solution(
+                category_value=category.value,
+                user_full_name=criteria.checked_by,
+                category_title_ru=category.title_ru
+            )
+            experts[category.id] = f"<b>{position}</b>"
+
+    criteria_list: List[SolutionCriteriaDTO] = []
+    articles: List[SolutionArticleDTO] = []
+
+    for group in grouped.values():
+        failed_titles = group["failed_titles"]
+        if failed_titles:
+            description = f"не выполнены требования  - {', '.join(failed_titles)};"
+        else:
+            description = "выполнены все требования;"
+
+        criteria_list.append(
+            SolutionCriteriaDTO(
+                title=group["title"],
+                description=description,
+                status=not failed_titles
+            )
+        )
+
+        # Статьи формируются только для групп с невыполненными требованиями
+        if group["failed_docs"]:
+            articles.append(
+                SolutionArticleDTO(
+                    title=group["title"],
+                    docs=group["failed_docs"]
+                )
+            )
+
+    return SolutionAggregateDTO(
+        criteria=criteria_list,
+        articles=articles,
+        experts=list(experts.values())
+    )
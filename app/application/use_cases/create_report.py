@@ -2,12 +2,14 @@
 Use Case: Create Report
 Сценарий использования: Создание отчета
 """
+from app.core.instrumentation import instrument_use_case
 from app.domain.entities.report import Report, ReportStatus
 from app.domain.repositories.report_repository import IReportRepository
 from app.domain.services.report_service import ReportDomainService
 from app.application.dto.report_dto import CreateReportDTO, ReportDTO
 
 
+@instrument_use_case
 class CreateReportUseCase:
     """
     Use Case для создания нового отчета
@@ -2,14 +2,18 @@
 Use Case: Delete Report
 Сценарий использования: Удаление отчета
 """
+from app.core.instrumentation import instrument_use_case
 from app.domain.repositories.report_repository import IReportRepository
+from app.domain.services.report_store import IReportStore
 
 
+@instrument_use_case
 class DeleteReportUseCase:
     """Use Case для удаления отчета"""
 
-    def __init__(self, report_repository: IReportRepository):
+    def __init__(self, report_repository: IReportRepository, report_store: IReportStore):
         self.report_repository = report_repository
+        self.report_store = report_store
 
     async def execute(self, report_id: int) -> bool:
         """
@@ -32,8 +36,8 @@ class DeleteReportUseCase:
         # Удаление отчета
         result = await self.report_repository.delete(report_id)
 
-        # TODO: Добавить удаление файла отчета, если он существует
-        # if report.file_path:
-        #     await delete_file(report.file_path)
+        # Файл с тем же содержимым может принадлежать другому отчету
+        if report.file_path and not await self.report_repository.is_file_referenced(report.file_path):
+            await self.report_store.delete(report.file_path)
 
         return result
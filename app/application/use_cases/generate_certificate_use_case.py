@@ -5,18 +5,22 @@ Use Case для генерации сертификата лицензии
 import os
 import tempfile
 from datetime import datetime
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from typing import Dict, List
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import contains_eager, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.instrumentation import instrument_use_case
 from app.infrastructure.database.models.license_certificate import LicenseCertificateModel
 from app.infrastructure.database.models.application_solution import ApplicationSolutionModel
 from app.infrastructure.database.models.application import ApplicationModel
 from app.infrastructure.database.models.license import LicenseModel
 from app.infrastructure.database.models.club import ClubModel
-from app.application.dto.certificate_dto import CertificateDataDTO
+from app.application.services.document_watermark import fetch_watermark
+from app.application.dto.certificate_dto import CertificateBulkDTO, CertificateDataDTO
 
 
+@instrument_use_case
 class GenerateCertificateUseCase:
     """Use Case для генерации сертификата лицензии"""
 
@@ -67,6 +71,115 @@ class GenerateCertificateUseCase:
         if not solution:
             raise ValueError(f"Solution not found for application {certificate.application_id}")
 
+        return self._build_certificate_data(
+            certificate,
+            solution,
+            logo_base64=logo_base64,
+            bg_image_en=bg_image_en,
+            bg_image_kk=bg_image_kk,
+            sign_img=sign_img
+        )
+
+    async def execute_bulk(
+        self,
+        logo_base64: str,
+        bg_image_en: str,
+        bg_image_kk: str,
+        sign_img: str,
+        season_id: int | None = None,
+        license_id: int | None = None
+    ) -> CertificateBulkDTO:
+        """
+        Выполнить генерацию данных всех сертификатов сезона или лицензии
+
+        Сертификаты с клубами и лицензиями загружаются одним запросом, первые
+        решения по заявкам - одним сгруппированным запросом. Сертификаты, по
+        заявке которых нет решения, пропускаются.
+
+        Args:
+            logo_base64: Логотип в формате base64
+            bg_image_en: Фон для английской версии в base64
+            bg_image_kk: Фон для казахской версии в base64
+            sign_img: Подпись в формате base64
+            season_id: ID сезона (сертификаты всех лицензий сезона)
+            license_id: ID лицензии
+
+        Returns:
+            CertificateBulkDTO с данными сертификатов по возрастанию ID
+
+        Raises:
+            ValueError: Если не указан ровно один из season_id и license_id
+                или сертификаты не найдены
+        """
+        if (season_id is None) == (license_id is None):
+            raise ValueError("Specify either season_id or license_id")
+
+        certificates = await self._get_certificates_with_relations(season_id, license_id)
+        if not certificates:
+            scope = f"season {season_id}" if season_id is not None else f"license {license_id}"
+            raise ValueError(f"Certificates not found for {scope}")
+
+        solutions = await self._get_first_solutions(
+            list({certificate.application_id for certificate in certificates})
+        )
+
+        certificates_data: Dict[int, CertificateDataDTO] = {}
+        skipped_ids: List[int] = []
+        for certificate in certificates:
+            solution = solutions.get(certificate.application_id)
+            if solution is None:
+                skipped_ids.append(certificate.id)
+                continue
+
+            certificates_data[certificate.id] = self._build_certificate_data(
+                certificate,
+                solution,
+                logo_base64=logo_base64,
+                bg_image_en=bg_image_en,
+                bg_image_kk=bg_image_kk,
+                sign_img=sign_img
+            )
+
+        return CertificateBulkDTO(certificates=certificates_data, skipped_ids=skipped_ids)
+
+    async def get_watermark(self, certificate_id: int) -> str | None:
+        """
+        Получить водяной знак данных сертификата (один запрос)
+
+        Учитываются сертификат, клуб, лицензия и решения заявки.
+
+        Args:
+            certificate_id: ID сертификата
+
+        Returns:
+            Строка водяного знака или None если сертификат не найден
+        """
+        def certificate_column(column):
+            return select(column).where(LicenseCertificateModel.id == certificate_id).scalar_subquery()
+
+        return await fetch_watermark(self.db, [
+            (LicenseCertificateModel, LicenseCertificateModel.id == certificate_id),
+            (ClubModel, ClubModel.id == certificate_column(LicenseCertificateModel.club_id)),
+            (LicenseModel, LicenseModel.id == certificate_column(LicenseCertificateModel.license_id)),
+            (
+                ApplicationSolutionModel,
+                ApplicationSolutionModel.application_id == certificate_column(LicenseCertificateModel.application_id)
+            ),
+        ])
+
+    def _build_certificate_data(
+        self,
+        certificate: LicenseCertificateModel,
+        solution: ApplicationSolutionModel,
+        logo_base64: str,
+        bg_image_en: str,
+        bg_image_kk: str,
+        sign_img: str
+    ) -> CertificateDataDTO:
+        """Сформировать DTO сертификата из загруженных клуба, лицензии и решения"""
+        club = certificate.club
+        license_entity = certificate.license
+
         # Форматируем дату окончания лицензии
         license_end_at = license_entity.end_at.strftime("%d/%m/%Y") if license_entity.end_at else ""
 
@@ -77,7 +190,7 @@ class GenerateCertificateUseCase:
         solution_year = sol.strftime("%Y")
 
         # Формируем DTO
-        certificate_data = CertificateDataDTO(
+        return CertificateDataDTO(
             type_en=certificate.type_ru if certificate.type_ru else "to participate in UEFA club tournaments",
             type_kk=certificate.type_kk if certificate.type_kk else "«Қазақстан Футбол федерациясы» Қауымдастығы <br> ЗТБ-мен ұйымдастырылатын жарыстарына қатысу үшін",
             club_full_name_kk=club.full_name_kk if club.full_name_kk else "",
@@ -94,8 +207,6 @@ class GenerateCertificateUseCase:
             sign_img=sign_img
         )
 
-        return certificate_data
-
     async def _get_certificate_with_relations(self, certificate_id: int) -> LicenseCertificateModel:
         """Получить сертификат со всеми связями"""
         query = (
@@ -126,3 +237,61 @@ class GenerateCertificateUseCase:
 
         result = await self.db.execute(query)
         return result.scalars().first()
+
+    async def _get_certificates_with_relations(
+        self,
+        season_id: int | None,
+        license_id: int | None
+    ) -> List[LicenseCertificateModel]:
+        """Получить сертификаты сезона или лицензии с клубами и лицензиями одним запросом"""
+        query = (
+            select(LicenseCertificateModel)
+            .join(LicenseCertificateModel.license)
+            .join(LicenseCertificateModel.club)
+            .options(
+                contains_eager(LicenseCertificateModel.license),
+                contains_eager(LicenseCertificateModel.club)
+            )
+            .order_by(LicenseCertificateModel.id)
+        )
+        if season_id is not None:
+            query = query.where(LicenseModel.season_id == season_id)
+        else:
+            query = query.where(LicenseCertificateModel.license_id == license_id)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _get_first_solutions(self, application_ids: List[int]) -> Dict[int, ApplicationSolutionModel]:
+        """Получить первое решение по каждой заявке одним сгруппированным запросом"""
+        if not application_ids:
+            return {}
+
+        first_created = (
+            select(
+                ApplicationSolutionModel.application_id,
+                func.min(ApplicationSolutionModel.created_at).label("created_at")
+            )
+            .where(ApplicationSolutionModel.application_id.in_(application_ids))
+            .group_by(ApplicationSolutionModel.application_id)
+            .subquery()
+        )
+        query = (
+            select(ApplicationSolutionModel)
+            .join(
+                first_created,
+                and_(
+                    ApplicationSolutionModel.application_id == first_created.c.application_id,
+                    ApplicationSolutionModel.created_at == first_created.c.created_at
+                )
+            )
+            .order_by(ApplicationSolutionModel.id)
+        )
+
+        result = await self.db.execute(query)
+
+        # При совпадении created_at берется решение с меньшим ID
+        solutions: Dict[int, ApplicationSolutionModel] = {}
+        for solution in result.scalars().all():
+            solutions.setdefault(solution.application_id, solution)
+        return solutions
@@ -2,23 +2,26 @@
 Generate Department Report Use Case
 Use Case для генерации отчета департамента
 """
-from typing import List, Dict
-from sqlalchemy import select, and_, desc
+from typing import List, Dict, Iterable
+from sqlalchemy import select, and_, desc, or_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.instrumentation import instrument_use_case
 from app.infrastructure.database.models.application_report import ApplicationReportModel
 from app.infrastructure.database.models.application_document import ApplicationDocumentModel
 from app.infrastructure.database.models.application_criteria import ApplicationCriteriaModel
 from app.infrastructure.database.models.application import ApplicationModel
 from app.infrastructure.database.models.club import ClubModel
 from app.infrastructure.database.models.user import UserModel
+from app.application.services.document_watermark import fetch_watermark
 from app.application.dto.department_report_dto import (
     DepartmentReportDataDTO,
     DepartmentReportItemDTO,
 )
 
 
+@instrument_use_case
 class GenerateDepartmentReportUseCase:
     """Use Case для генерации отчета департамента"""
 
@@ -56,11 +59,26 @@ class GenerateDepartmentReportUseCase:
         # Получаем все отчеты для данной заявки со статусом 1 и criteria_id не null
         reports = await self._get_application_reports(application_id)
 
-        # Получаем пользователя департамента (из первого документа с first_checked_by_id)
-        department_user = await self._get_department_user(application_id)
+        # ID пользователя департамента (из первого документа с first_checked_by_id)
+        department_user_id = await self._get_department_user_id(application_id)
 
-        # Строим список отчетов
-        reports_data = await self.build_reports(reports, application_id)
+        # Загружаем всех экспертов и пользователя департамента одним запросом
+        user_ids = {report.criteria.checked_by_id for report in reports}
+        if department_user_id:
+            user_ids.add(department_user_id)
+        users = await self._get_users_by_ids(user_ids)
+        department_user = users.get(department_user_id) if department_user_id else None
+
+        # Загружаем документы всех отчетов одним запросом
+        document_ids = {
+            int(doc_id)
+            for report in reports
+            for doc_id in (report.list_documents or [])
+        }
+        documents = await self._get_documents_by_ids(document_ids, application_id)
+
+        # Строим список отчетов (в памяти, без обращений к БД)
+        reports_data = self.build_reports(reports, users, documents)
 
         # Формируем DTO
         department_report_data = DepartmentReportDataDTO(
@@ -75,6 +93,47 @@ class GenerateDepartmentReportUseCase:
 
         return department_report_data
 
+    async def get_watermark(self, report_id: int) -> str | None:
+        """
+        Получить водяной знак данных отчета департамента (один запрос)
+
+        Учитываются отчет, клуб, отчеты, критерии и документы заявки,
+        а также эксперты и пользователь департамента.
+
+        Args:
+            report_id: ID отчета
+
+        Returns:
+            Строка водяного знака или None если отчет не найден
+        """
+        application_id = (
+            select(ApplicationReportModel.application_id)
+            .where(ApplicationReportModel.id == report_id)
+            .scalar_subquery()
+        )
+
+        return await fetch_watermark(self.db, [
+            (ApplicationReportModel, ApplicationReportModel.id == report_id),
+            (ClubModel, ClubModel.id == (
+                select(ApplicationModel.club_id)
+                .where(ApplicationModel.id == application_id)
+                .scalar_subquery()
+            )),
+            (ApplicationReportModel, ApplicationReportModel.application_id == application_id),
+            (ApplicationCriteriaModel, ApplicationCriteriaModel.application_id == application_id),
+            (ApplicationDocumentModel, ApplicationDocumentModel.application_id == application_id),
+            (UserModel, or_(
+                UserModel.id.in_(
+                    select(ApplicationCriteriaModel.checked_by_id)
+                    .where(ApplicationCriteriaModel.application_id == application_id)
+                ),
+                UserModel.id.in_(
+                    select(ApplicationDocumentModel.first_checked_by_id)
+                    .where(ApplicationDocumentModel.application_id == application_id)
+                )
+            )),
+        ])
+
     async def _get_report_with_relations(self, report_id: int) -> ApplicationReportModel | None:
         query = (
             select(ApplicationReportModel)
@@ -135,13 +194,20 @@ class GenerateDepartmentReportUseCase:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def _get_documents_by_ids(self, document_ids: List[str], application_id: int) -> List[ApplicationDocumentModel]:
-        """Получить документы по списку ID документов"""
-        if not document_ids:
-            return []
+    async def _get_documents_by_ids(
+        self,
+        document_ids: Iterable[int],
+        application_id: int
+    ) -> Dict[int, ApplicationDocumentModel]:
+        """
+        Получить документы заявки по ID записей application_documents
 
-        # Преобразуем строковые ID в целые числа
-        int_ids = [int(doc_id) for doc_id in document_ids]
+        Returns:
+            Словарь id -> документ
+        """
+        int_ids = list(document_ids)
+        if not int_ids:
+            return {}
 
         query = (
             select(ApplicationDocumentModel)
@@ -157,13 +223,13 @@ class GenerateDepartmentReportUseCase:
         )
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return {doc.id: doc for doc in result.scalars().all()}
 
-    async def _get_department_user(self, application_id: int) -> UserModel | None:
-        """Получить пользователя департамента из документов заявки"""
-        # Находим первый документ с first_checked_by_id
+    async def _get_department_user_id(self, application_id: int) -> int | None:
+        """Получить ID пользователя департамента из документов заявки"""
+        # Берем first_checked_by_id первого документа, где он заполнен
         query = (
-            select(ApplicationDocumentModel)
+            select(ApplicationDocumentModel.first_checked_by_id)
             .where(
                 and_(
                     ApplicationDocumentModel.application_id == application_id,
@@ -174,33 +240,43 @@ class GenerateDepartmentReportUseCase:
         )
 
         result = await self.db.execute(query)
-        document = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-        if document and document.first_checked_by_id:
-            return await self._get_user(document.first_checked_by_id)
+    async def _get_users_by_ids(self, user_ids: Iterable[int]) -> Dict[int, UserModel]:
+        """
+        Получить пользователей по списку ID одним запросом
 
-        return None
+        Returns:
+            Словарь id -> пользователь
+        """
+        int_ids = [user_id for user_id in user_ids if user_id]
+        if not int_ids:
+            return {}
 
-    async def _get_user(self, user_id: int) -> UserModel | None:
-        """Получить пользователя по ID"""
-        query = select(UserModel).where(UserModel.id == user_id)
+        query = select(UserModel).where(UserModel.id.in_(int_ids))
         result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return {user.id: user for user in result.scalars().all()}
 
-    async def build_reports(
+    def build_reports(
         self,
         reports: List[ApplicationReportModel],
-        application_id: int
+        users: Dict[int, UserModel],
+        documents: Dict[int, ApplicationDocumentModel]
     ) -> List[DepartmentReportItemDTO]:
         """
         Построить список отчетов с документами
         Для каждого отчета используется его list_documents
+
+        Args:
+            reports: Отчеты заявки
+            users: Пользователи (эксперты) по ID
+            documents: Документы заявки по ID записей application_documents
         """
         result = []
 
         for report in reports:
             # Получаем эксперта
-            expert = await self._get_user(report.criteria.checked_by_id)
+            expert = users.get(report.criteria.checked_by_id)
 
             # Формируем позицию эксперта
             expert_position = self._get_expert_position(expert, report.criteria)
@@ -210,21 +286,10 @@ class GenerateDepartmentReportUseCase:
 
             # Проверяем наличие list_documents в отчете
             if report.list_documents:
-                # Получаем документы по ID из list_documents (это ID записей application_documents)
-                report_documents = await self._get_documents_by_ids(
-                    report.list_documents,
-                    application_id
-                )
-
-                # Создаем словарь для быстрого доступа к документам по ID записи application_documents
-                docs_dict: Dict[int, ApplicationDocumentModel] = {
-                    doc.id: doc for doc in report_documents
-                }
-
                 # Обрабатываем документы в порядке list_documents
                 for doc_id_str in report.list_documents:
                     doc_id = int(doc_id_str)
-                    doc = docs_dict.get(doc_id)
+                    doc = documents.get(doc_id)
 
                     if doc:
                         status_value = "критерий выполнен;" if doc.is_industry_passed else f"критерий выполнен частично; ({doc.industry_comment})"
@@ -3,20 +3,25 @@ Generate Initial Report Use Case
 Use Case для генерации начального отчета - работает со SQLAlchemy моделями напрямую
 """
 from typing import List
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.instrumentation import instrument_use_case
 from app.infrastructure.database.models.application_initial_report import ApplicationInitialReportModel
 from app.infrastructure.database.models.application_criteria import ApplicationCriteriaModel
 from app.infrastructure.database.models.application_document import ApplicationDocumentModel
 from app.infrastructure.database.models.application import ApplicationModel
+from app.infrastructure.database.models.category_document import CategoryDocumentModel
+from app.infrastructure.database.models.club import ClubModel
+from app.application.services.document_watermark import fetch_watermark
 from app.application.dto.initial_report_dto import (
     InitialReportDataDTO,
     InitialReportDocumentDTO
 )
 
 
+@instrument_use_case
 class GenerateInitialReportUseCase:
     """
     Use Case для генерации данных начального отчета
@@ -93,6 +98,50 @@ class GenerateInitialReportUseCase:
 
         return report_data
 
+    async def get_watermark(self, report_id: int) -> str | None:
+        """
+        Получить водяной знак данных начального отчета (один запрос)
+
+        Учитываются отчет, критерии, категория, заявка, клуб и документы заявки.
+
+        Args:
+            report_id: ID начального отчета
+
+        Returns:
+            Строка водяного знака или None если отчет не найден
+        """
+        criteria_id = (
+            select(ApplicationInitialReportModel.criteria_id)
+            .where(ApplicationInitialReportModel.id == report_id)
+            .scalar_subquery()
+        )
+        # Заявка берется из отчета, а если ее нет - из критериев
+        application_id = func.coalesce(
+            select(ApplicationInitialReportModel.application_id)
+            .where(ApplicationInitialReportModel.id == report_id)
+            .scalar_subquery(),
+            select(ApplicationCriteriaModel.application_id)
+            .where(ApplicationCriteriaModel.id == criteria_id)
+            .scalar_subquery()
+        )
+
+        return await fetch_watermark(self.db, [
+            (ApplicationInitialReportModel, ApplicationInitialReportModel.id == report_id),
+            (ApplicationCriteriaModel, ApplicationCriteriaModel.id == criteria_id),
+            (CategoryDocumentModel, CategoryDocumentModel.id == (
+                select(ApplicationCriteriaModel.category_id)
+                .where(ApplicationCriteriaModel.id == criteria_id)
+                .scalar_subquery()
+            )),
+            (ApplicationModel, ApplicationModel.id == application_id),
+            (ClubModel, ClubModel.id == (
+                select(ApplicationModel.club_id)
+                .where(ApplicationModel.id == application_id)
+                .scalar_subquery()
+            )),
+            (ApplicationDocumentModel, ApplicationDocumentModel.application_id == application_id),
+        ])
+
     async def _get_report_with_relations(self, report_id: int) -> ApplicationInitialReportModel:
         """Получить начальный отчет со всеми связями"""
         query = (
@@ -2,13 +2,17 @@
 Use Case: Generate Report
 Сценарий использования: Генерация отчета
 """
-from typing import Optional
-from app.domain.entities.report import Report, ReportStatus
+from typing import Dict
+from app.core.instrumentation import instrument_use_case
+from app.domain.entities.report import Report, ReportStatus, ReportType
 from app.domain.repositories.report_repository import IReportRepository
+from app.domain.services.report_renderer import IReportRenderer
 from app.domain.services.report_service import ReportDomainService
-from app.application.dto.report_dto import GenerateReportResultDTO
+from app.domain.services.report_store import IReportStore
+from app.application.dto.report_dto import GenerateReportResultDTO, ReportDTO
 
 
+@instrument_use_case
 class GenerateReportUseCase:
     """
     Use Case для генерации отчета
@@ -18,10 +22,56 @@ class GenerateReportUseCase:
     def __init__(
         self,
         report_repository: IReportRepository,
-        report_service: ReportDomainService
+        report_service: ReportDomainService,
+        report_renderers: Dict[ReportType, IReportRenderer],
+        report_store: IReportStore
     ):
         self.report_repository = report_repository
         self.report_service = report_service
+        self.report_renderers = report_renderers
+        self.report_store = report_store
+
+    async def enqueue(self, report_id: int) -> ReportDTO:
+        """
+        Подготовить отчет к фоновой генерации
+
+        Отчет переводится в статус PENDING; саму генерацию выполняет execute
+        в фоновой задаче.
+
+        Args:
+            report_id: ID отчета для генерации
+
+        Returns:
+            DTO отчета в статусе PENDING
+
+        Raises:
+            ValueError: Если отчет не найден, уже генерируется или его тип не поддерживается
+        """
+        report = await self.report_repository.get_by_id(report_id)
+        if not report:
+            raise ValueError(f"Report with id {report_id} not found")
+
+        if report.is_processing():
+            raise ValueError(f"Report {report_id} is already being processed")
+
+        if report.report_type not in self.report_renderers:
+            raise ValueError(f"Report type {report.report_type.value} is not supported yet")
+
+        report.mark_as_pending()
+        report = await self.report_repository.update(report)
+
+        return ReportDTO(
+            id=report.id,
+            name=report.name,
+            report_type=report.report_type,
+            status=report.status,
+            parameters=report.parameters,
+            file_path=report.file_path,
+            created_at=report.created_at,
+            updated_at=report.updated_at,
+            completed_at=report.completed_at,
+            error_message=report.error_message
+        )
 
     async def execute(self, report_id: int) -> GenerateReportResultDTO:
         """
@@ -50,20 +100,14 @@ class GenerateReportUseCase:
             report.mark_as_processing()
             await self.report_repository.update(report)
 
-            # Генерация отчета (здесь будет вызов реального генератора)
+            # Генерация файла отчета генератором его типа
             file_path = await self._generate_report_file(report)
 
             # Отметить как завершенный
+            previous_file_path = report.file_path
             report.mark_as_completed(file_path)
             await self.report_repository.update(report)
 
-            return GenerateReportResultDTO(
-                report_id=report.id,
-                status=ReportStatus.COMPLETED,
-                message="Report generated successfully",
-                file_path=file_path
-            )
-
         except Exception as e:
             # Отметить как неудачный
             error_msg = str(e)
@@ -76,25 +120,46 @@ class GenerateReportUseCase:
                 message=f"Report generation failed: {error_msg}"
             )
 
+        # Файл предыдущей генерации удаляется, если на него больше никто не ссылается.
+        # Вне try: ошибка удаления не должна помечать готовый отчет неудачным
+        if previous_file_path and previous_file_path != file_path:
+            await self._release_file(previous_file_path)
+
+        return GenerateReportResultDTO(
+            report_id=report.id,
+            status=ReportStatus.COMPLETED,
+            message="Report generated successfully",
+            file_path=file_path
+        )
+
+    async def _release_file(self, file_path: str) -> None:
+        """
+        Удалить файл из хранилища, если на него не ссылается ни один отчет
+
+        Args:
+            file_path: Ключ файла в хранилище отчетов
+        """
+        if not await self.report_repository.is_file_referenced(file_path):
+            await self.report_store.delete(file_path)
+
     async def _generate_report_file(self, report: Report) -> str:
         """
-        Сгенерировать файл отчета
-        TODO: Реализовать реальную генерацию отчета
+        Сгенерировать файл отчета генератором его типа
 
         Args:
             report: Отчет для генерации
 
         Returns:
-            Путь к сгенерированному файлу
-        """
-        # Генерация имени файла
-        filename = self.report_service.generate_report_filename(report)
+            Ключ файла в хранилище отчетов
 
-        # TODO: Здесь будет реальная логика генерации отчета
-        # Например, генерация PDF, Excel и т.д.
-        # В зависимости от типа отчета вызывать соответствующий генератор
+        Raises:
+            ValueError: Если для типа отчета нет генератора или параметры некорректны
+        """
+        renderer = self.report_renderers.get(report.report_type)
+        if renderer is None:
+            raise ValueError(f"Report type {report.report_type.value} is not supported yet")
 
-        # Временная заглушка
-        file_path = f"reports/{filename}"
+        content = await renderer.render(report)
 
-        return file_path
+        # Одинаковые файлы хранятся один раз
+        return await self.report_store.put(content)
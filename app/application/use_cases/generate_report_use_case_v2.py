@@ -7,12 +7,16 @@ from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.instrumentation import instrument_use_case
 from app.infrastructure.database.models.application_report import ApplicationReportModel
 from app.infrastructure.database.models.application_criteria import ApplicationCriteriaModel
 from app.infrastructure.database.models.application_document import ApplicationDocumentModel
 from app.infrastructure.database.models.category_document import CategoryDocumentModel
 from app.infrastructure.database.models.application import ApplicationModel
 from app.infrastructure.database.models.license import LicenseModel
+from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.season import SeasonModel
+from app.application.services.document_watermark import fetch_watermark
 from app.application.dto.report_generation_dto import (
     ReportDataDTO,
     ArticleDTO,
@@ -21,6 +25,7 @@ from app.application.dto.report_generation_dto import (
 )
 
 
+@instrument_use_case
 class GenerateReportUseCaseV2:
     """
     Use Case для генерации данных отчета
@@ -121,6 +126,58 @@ class GenerateReportUseCaseV2:
 
         return report_data
 
+    async def get_watermark(self, report_id: int) -> str | None:
+        """
+        Получить водяной знак данных отчета (один запрос)
+
+        Учитываются отчет, критерии, категория, заявка, клуб, лицензия,
+        сезон и документы заявки.
+
+        Args:
+            report_id: ID отчета
+
+        Returns:
+            Строка водяного знака или None если отчет не найден
+        """
+        criteria_id = (
+            select(ApplicationReportModel.criteria_id)
+            .where(ApplicationReportModel.id == report_id)
+            .scalar_subquery()
+        )
+        application_id = (
+            select(ApplicationCriteriaModel.application_id)
+            .where(ApplicationCriteriaModel.id == criteria_id)
+            .scalar_subquery()
+        )
+        license_id = (
+            select(ApplicationModel.license_id)
+            .where(ApplicationModel.id == application_id)
+            .scalar_subquery()
+        )
+
+        return await fetch_watermark(self.db, [
+            (ApplicationReportModel, ApplicationReportModel.id == report_id),
+            (ApplicationCriteriaModel, ApplicationCriteriaModel.id == criteria_id),
+            (CategoryDocumentModel, CategoryDocumentModel.id == (
+                select(ApplicationCriteriaModel.category_id)
+                .where(ApplicationCriteriaModel.id == criteria_id)
+                .scalar_subquery()
+            )),
+            (ApplicationModel, ApplicationModel.id == application_id),
+            (ClubModel, ClubModel.id == (
+                select(ApplicationModel.club_id)
+                .where(ApplicationModel.id == application_id)
+                .scalar_subquery()
+            )),
+            (LicenseModel, LicenseModel.id == license_id),
+            (SeasonModel, SeasonModel.id == (
+                select(LicenseModel.season_id)
+                .where(LicenseModel.id == license_id)
+                .scalar_subquery()
+            )),
+            (ApplicationDocumentModel, ApplicationDocumentModel.application_id == application_id),
+        ])
+
     async def _get_report_with_relations(self, report_id: int) -> ApplicationReportModel:
         """Получить отчет со всеми связями"""
         query = (
@@ -2,12 +2,13 @@
 Generate Solution Use Case
 Use Case для генерации решения - работает со SQLAlchemy моделями напрямую
 """
-from typing import List, Dict
+from typing import List, Dict, Iterable
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
-from datetime import datetime
+from datetime import date, datetime
+from app.core.instrumentation import instrument_use_case
 from app.infrastructure.database.models.application_solution import ApplicationSolutionModel
 from app.infrastructure.database.models.application_criteria import ApplicationCriteriaModel
 from app.infrastructure.database.models.application_document import ApplicationDocumentModel
@@ -15,13 +16,15 @@ from app.infrastructure.database.models.application_step import ApplicationStepM
 from app.infrastructure.database.models.application import ApplicationModel
 from app.infrastructure.database.models.license import LicenseModel
 from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.season import SeasonModel
+from app.infrastructure.database.models.user import UserModel
 from app.application.dto.solution_generation_dto import (
     SolutionDataDTO,
-    SolutionCriteriaDTO,
     SolutionArticleDTO,
-    SolutionDocItemDTO,
 )
 from app.application.dto.report_generation_dto import CategoryExpertMapping
+from app.application.services.solution_aggregator import aggregate_solution_documents
+from app.application.services.document_watermark import fetch_watermark
 
 # Константы статусов (можно вынести в отдельный файл)
 APPLICATION_STATUS_APPROVED_ID = 6  # Утвержден
@@ -30,6 +33,19 @@ APPLICATION_STATUS_REVOKED_ID = 7   # Отозван
 APPLICATION_STEP_CONTROL_STATUS_ID = 4  # Контроль
 
 
+class BatchTooLargeError(Exception):
+    """В пакете больше решений, чем допускается"""
+
+    def __init__(self, max_items: int):
+        """
+        Args:
+            max_items: Максимальное количество решений в пакете
+        """
+        super().__init__(f"Too many solutions in batch (max {max_items})")
+        self.max_items = max_items
+
+
+@instrument_use_case
 class GenerateSolutionUseCase:
     """Use Case для генерации данных решения"""
 
@@ -61,6 +77,126 @@ class GenerateSolutionUseCase:
         if not application:
             raise ValueError(f"Application not found for solution {solution_id}")
 
+        # Получаем документы из list_documents решения
+        if solution.list_documents:
+            application_documents = await self._get_documents_by_ids(
+                solution.list_documents,
+                application.id
+            )
+        else:
+            application_documents = []
+
+        # Получаем шаг контроля
+        control_step = await self._get_control_step(application.id)
+
+        # Все критерии заявки одним запросом, сгруппированные по категории
+        criteria_by_category = await self._get_criteria_by_category(application.id)
+
+        return self._build_solution_data(
+            solution,
+            application_documents,
+            control_step,
+            criteria_by_category,
+            logo_base64
+        )
+
+    async def execute_batch(
+        self,
+        logo_base64: str,
+        solution_ids: List[int] | None = None,
+        meeting_date: date | None = None,
+        max_items: int | None = None
+    ) -> Dict[int, SolutionDataDTO]:
+        """
+        Выполнить генерацию данных нескольких решений
+
+        Данные всех решений загружаются постоянным числом запросов
+        (по множествам ID), а не отдельными запросами на каждое решение.
+        Размер пакета проверяется до загрузки данных: для даты заседания
+        сначала выбирается не более max_items + 1 ID решений.
+
+        Args:
+            logo_base64: Логотип в формате base64
+            solution_ids: ID решений
+            meeting_date: Дата заседания (если ID не переданы)
+            max_items: Максимальное количество решений в пакете (None - без ограничения)
+
+        Returns:
+            Словарь solution_id -> SolutionDataDTO в порядке solution_ids (или по ID)
+
+        Raises:
+            ValueError: Если решения не найдены
+            BatchTooLargeError: Если решений больше max_items
+        """
+        if not solution_ids:
+            solution_ids = await self._get_solution_ids_by_meeting_date(
+                meeting_date,
+                limit=max_items + 1 if max_items is not None else None
+            )
+            if not solution_ids:
+                raise ValueError(f"Solutions not found for meeting date {meeting_date}")
+
+        if max_items is not None and len(solution_ids) > max_items:
+            raise BatchTooLargeError(max_items)
+
+        solutions = await self._get_solutions_with_relations(solution_ids)
+
+        found_ids = {solution.id for solution in solutions}
+        missing_ids = [solution_id for solution_id in solution_ids if solution_id not in found_ids]
+        if missing_ids:
+            raise ValueError(f"Solutions not found: {', '.join(map(str, missing_ids))}")
+        # Сохраняем порядок, в котором решения были запрошены
+        order = {solution_id: index for index, solution_id in enumerate(solution_ids)}
+        solutions.sort(key=lambda solution: order[solution.id])
+
+        for solution in solutions:
+            if not solution.application:
+                raise ValueError(f"Application not found for solution {solution.id}")
+
+        application_ids = {solution.application_id for solution in solutions}
+
+        # Документы, шаги контроля и критерии всех заявок - по одному запросу
+        documents = await self._get_documents_for_solutions(solutions)
+        control_steps = await self._get_control_steps(application_ids)
+        criteria_by_application = await self._get_criteria_by_applications(application_ids)
+
+        return {
+            solution.id: self._build_solution_data(
+                solution,
+                documents[solution.id],
+                control_steps.get(solution.application_id),
+                criteria_by_application.get(solution.application_id, {}),
+                logo_base64
+            )
+            for solution in solutions
+        }
+
+    def _build_solution_data(
+        self,
+        solution: ApplicationSolutionModel,
+        application_documents: List[ApplicationDocumentModel],
+        control_step: ApplicationStepModel | None,
+        criteria_by_category: Dict[int, ApplicationCriteriaModel],
+        logo_base64: str
+    ) -> SolutionDataDTO:
+        """
+        Построить данные решения из загруженных записей (без обращений к БД)
+
+        Args:
+            solution: Решение с загруженными заявкой, клубом, лицензией и сезоном
+            application_documents: Документы из list_documents решения
+            control_step: Шаг контроля заявки
+            criteria_by_category: Критерии заявки, category_id -> запись
+            logo_base64: Логотип в формате base64
+
+        Returns:
+            SolutionDataDTO с данными для шаблона
+
+        Raises:
+            ValueError: Если у заявки нет клуба, лицензии или сезона
+        """
+        application = solution.application
+
         # Получаем клуб
         club = application.club
         if not club:
@@ -76,20 +212,8 @@ class GenerateSolutionUseCase:
         if not season:
             raise ValueError(f"Season not found for license {license_entity.id}")
 
-        # Получаем документы из list_documents решения
-        if solution.list_documents:
-            application_documents = await self._get_documents_by_ids(
-                solution.list_documents,
-                application.id
-            )
-        else:
-            application_documents = []
-
-        # Получаем шаг контроля
-        control_step = await self._get_control_step(application.id)
-
         # Получаем статус заявки из control_step (если есть) или из criteria
-        application_criteria = await self._get_application_criteria(application.id)
+        application_criteria = self._get_application_criteria(criteria_by_category)
         application_status_id = control_step.status_id if control_step else (application_criteria.status_id if application_criteria else 0)
 
         # Строим summary
@@ -97,14 +221,19 @@ class GenerateSolutionUseCase:
             f"Комиссия по лицензированию футбольных клубов (далее по тексту - КЛФК), "
             f"рассмотрев представленные Директором Департамента лицензирования "
             f"отчет и учетное дело «{club.full_name_ru}» для получения Лицензии «{license_entity.title_ru}», "
-            f"организуемый {solution.type if solution.type else "КФФ"} в сезоне "
+            f"организуемый {solution.type if solution.type else 'КФФ'} в сезоне "
             f"«{season.title_ru}» года (далее по тексту - «Лицензия»)"
         )
 
-        # Строим данные
-        experts = await self.build_experts(application_documents, application.id)
-        criteria = await self.build_criteria(application_documents, application.id)
-        articles = await self.build_articles(application_documents, application.id)
+        # Строим критерии, статьи и экспертов за один проход по документам
+        aggregate = aggregate_solution_documents(
+            application_documents,
+            criteria_by_category,
+            self.expert_mapper
+        )
+        experts = aggregate.experts
+        criteria = aggregate.criteria
+        articles = aggregate.articles
 
         conclusion = self.build_conclusion(
             solution=solution,
@@ -162,6 +291,53 @@ class GenerateSolutionUseCase:
 
         return solution_data
 
+    async def get_watermark(self, solution_id: int) -> str | None:
+        """
+        Получить водяной знак данных решения (один запрос)
+
+        Учитываются решение, заявка, клуб, лицензия, сезон, документы,
+        критерии и шаги заявки, а также ответственные по шагам.
+
+        Args:
+            solution_id: ID решения
+
+        Returns:
+            Строка водяного знака или None если решение не найдено
+        """
+        application_id = (
+            select(ApplicationSolutionModel.application_id)
+            .where(ApplicationSolutionModel.id == solution_id)
+            .scalar_subquery()
+        )
+        license_id = (
+            select(ApplicationModel.license_id)
+            .where(ApplicationModel.id == application_id)
+            .scalar_subquery()
+        )
+
+        return await fetch_watermark(self.db, [
+            (ApplicationSolutionModel, ApplicationSolutionModel.id == solution_id),
+            (ApplicationModel, ApplicationModel.id == application_id),
+            (ClubModel, ClubModel.id == (
+                select(ApplicationModel.club_id)
+                .where(ApplicationModel.id == application_id)
+                .scalar_subquery()
+            )),
+            (LicenseModel, LicenseModel.id == license_id),
+            (SeasonModel, SeasonModel.id == (
+                select(LicenseModel.season_id)
+                .where(LicenseModel.id == license_id)
+                .scalar_subquery()
+            )),
+            (ApplicationDocumentModel, ApplicationDocumentModel.application_id == application_id),
+            (ApplicationCriteriaModel, ApplicationCriteriaModel.application_id == application_id),
+            (ApplicationStepModel, ApplicationStepModel.application_id == application_id),
+            (UserModel, UserModel.id.in_(
+                select(ApplicationStepModel.responsible_id)
+                .where(ApplicationStepModel.application_id == application_id)
+            )),
+        ])
+
     async def _get_solution_with_relations(self, solution_id: int) -> ApplicationSolutionModel:
         """Получить решение со всеми связями"""
         query = (
@@ -181,6 +357,111 @@ class GenerateSolutionUseCase:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def _get_solution_ids_by_meeting_date(self, meeting_date: date, limit: int | None) -> List[int]:
+        """Получить ID решений заседания по возрастанию (не более limit)"""
+        query = (
+            select(ApplicationSolutionModel.id)
+            .where(ApplicationSolutionModel.meeting_date == meeting_date)
+            .order_by(ApplicationSolutionModel.id.asc())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _get_solutions_with_relations(self, solution_ids: List[int]) -> List[ApplicationSolutionModel]:
+        """Получить решения по списку ID со всеми связями"""
+        query = (
+            select(ApplicationSolutionModel)
+            .options(
+                selectinload(ApplicationSolutionModel.application)
+                .selectinload(ApplicationModel.club)
+            )
+            .options(
+                selectinload(ApplicationSolutionModel.application)
+                .selectinload(ApplicationModel.license)
+                .selectinload(LicenseModel.season)
+            )
+            .where(ApplicationSolutionModel.id.in_(solution_ids))
+            .order_by(ApplicationSolutionModel.id.asc())
+        )
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _get_documents_for_solutions(
+        self,
+        solutions: List[ApplicationSolutionModel]
+    ) -> Dict[int, List[ApplicationDocumentModel]]:
+        """
+        Получить документы из list_documents всех решений одним запросом
+
+        Returns:
+            Словарь solution_id -> документы решения (только документы его заявки)
+        """
+        document_ids = {
+            int(doc_id)
+            for solution in solutions
+            for doc_id in (solution.list_documents or [])
+        }
+
+        documents: Dict[int, ApplicationDocumentModel] = {}
+        if document_ids:
+            query = (
+                select(ApplicationDocumentModel)
+                .where(
+                    and_(
+                        ApplicationDocumentModel.id.in_(document_ids),
+                        ApplicationDocumentModel.application_id.in_(
+                            {solution.application_id for solution in solutions}
+                        )
+                    )
+                )
+                .options(selectinload(ApplicationDocumentModel.category), selectinload(ApplicationDocumentModel.document))
+                .order_by(ApplicationDocumentModel.id.asc())
+            )
+
+            result = await self.db.execute(query)
+            documents = {document.id: document for document in result.scalars().all()}
+
+        documents_by_solution: Dict[int, List[ApplicationDocumentModel]] = {}
+        for solution in solutions:
+            solution_document_ids = {int(doc_id) for doc_id in (solution.list_documents or [])}
+            # Поиск по ID решения, а не перебор документов всего пакета; порядок - по ID
+            documents_by_solution[solution.id] = [
+                documents[document_id]
+                for document_id in sorted(solution_document_ids)
+                if document_id in documents and documents[document_id].application_id == solution.application_id
+            ]
+
+        return documents_by_solution
+
+    async def _get_control_steps(self, application_ids: Iterable[int]) -> Dict[int, ApplicationStepModel]:
+        """
+        Получить шаги контроля нескольких заявок одним запросом
+
+        Returns:
+            Словарь application_id -> самый свежий шаг контроля заявки
+        """
+        query = (
+            select(ApplicationStepModel)
+            .where(
+                ApplicationStepModel.application_id.in_(set(application_ids)),
+                ApplicationStepModel.status_id.in_([9, 10, 11, 12])
+            )
+            .options(selectinload(ApplicationStepModel.responsible))
+            .order_by(ApplicationStepModel.created_at.desc())
+        )
+
+        result = await self.db.execute(query)
+
+        control_steps: Dict[int, ApplicationStepModel] = {}
+        for step in result.scalars().all():
+            control_steps.setdefault(step.application_id, step)
+
+        return control_steps
+
     async def _get_documents(self, application_id: int) -> List[ApplicationDocumentModel]:
         """Получить все документы заявки"""
         query = (
@@ -234,151 +515,47 @@ class GenerateSolutionUseCase:
         result = await self.db.execute(query)
         return result.scalars().first()
 
-    async def _get_application_criteria(self, application_id: int) -> ApplicationCriteriaModel | None:
-        """Получить критерии заявки (первую запись)"""
-        query = (
-            select(ApplicationCriteriaModel)
-            .where(ApplicationCriteriaModel.application_id == application_id)
-            .limit(1)
-        )
-
-        result = await self.db.execute(query)
-        return result.scalars().first()
-
-    async def build_criteria(
-        self,
-        application_documents: List[ApplicationDocumentModel],
-        application_id: int
-    ) -> List[SolutionCriteriaDTO]:
+    async def _get_criteria_by_category(self, application_id: int) -> Dict[int, ApplicationCriteriaModel]:
         """
-        Построить список критериев (выполненность требований по категориям)
-        """
-        grouped: Dict[int, Dict] = {}
-
-        for doc in application_documents:
-            # Получаем критерии для документа
-            criteria = await self._get_criteria_for_category(doc.category_id, application_id)
-            if not criteria:
-                continue
-
-            group = grouped.setdefault(
-                criteria.id,
-                {
-                    "title": doc.category.title_ru if doc.category else "Категория",
-                    "failed_titles": []
-                }
-            )
-
-            # Считаем, что control_comment => требование не выполнено
-            if doc.is_final_passed is None:
-                group["failed_titles"].append(doc.document.title_ru or "Документ")
-
-        # Финальная сборка
-        result = []
-        for group in grouped.values():
-            failed = group["failed_titles"]
-            status = False
-            if failed:
-                joined_titles = ", ".join(failed)
-                description = f"не выполнены требования  - {joined_titles};"
-            else:
-                description = "выполнены все требования;"
-                status = True
-
-            result.append(
-                SolutionCriteriaDTO(
-                    title=group["title"],
-                    description=description,
-                    status=status
-                )
-            )
+        Получить все критерии заявки одним запросом
 
-        return result
+        Returns:
+            Словарь category_id -> первая (по id) запись критериев категории
+        """
+        criteria_by_application = await self._get_criteria_by_applications([application_id])
+        return criteria_by_application.get(application_id, {})
 
-    async def build_articles(
+    async def _get_criteria_by_applications(
         self,
-        application_documents: List[ApplicationDocumentModel],
-        application_id: int
-    ) -> List[SolutionArticleDTO]:
+        application_ids: Iterable[int]
+    ) -> Dict[int, Dict[int, ApplicationCriteriaModel]]:
         """
-        Построить список статей с невыполненными требованиями
-        """
-        grouped: Dict[int, Dict] = {}
-
-        for doc in application_documents:
-            # Получаем критерии для документа
-            criteria = await self._get_criteria_for_category(doc.category_id, application_id)
-            if not criteria:
-                continue
-
-            group = grouped.setdefault(
-                criteria.id,
-                {
-                    "title": doc.category.title_ru if doc.category else "Категория",
-                    "failed_docs": []
-                }
-            )
+        Получить критерии нескольких заявок одним запросом
 
-            # control_comment => требование не выполнено
-            if doc.is_final_passed is None:
-                deadline_str = (
-                    f"Устранить несоответствие в срок до {doc.deadline.strftime('%d.%m.%Y')}"
-                    if doc.deadline
-                    else "Устранить несоответствие в установленный срок"
-                )
+        Returns:
+            Словарь application_id -> (category_id -> первая по id запись критериев категории)
+        """
+        query = (
+            select(ApplicationCriteriaModel)
+            .where(ApplicationCriteriaModel.application_id.in_(set(application_ids)))
+            .options(selectinload(ApplicationCriteriaModel.category))
+            .order_by(ApplicationCriteriaModel.id.asc())
+        )
 
-                group["failed_docs"].append(
-                    SolutionDocItemDTO(
-                        title=doc.document.title_ru or "Документ",
-                        comment=doc.control_comment if doc.control_comment else doc.industry_comment,
-                        deadline=deadline_str
-                    )
-                )
+        result = await self.db.execute(query)
 
-        # Формируем результат только для непустых docs
-        result = [
-            SolutionArticleDTO(
-                title=group["title"],
-                docs=group["failed_docs"]
-            )
-            for group in grouped.values()
-            if group["failed_docs"]  # фильтруем пустые списки
-        ]
+        criteria_by_application: Dict[int, Dict[int, ApplicationCriteriaModel]] = {}
+        for criteria in result.scalars().all():
+            criteria_by_application.setdefault(criteria.application_id, {}).setdefault(criteria.category_id, criteria)
 
-        return result
+        return criteria_by_application
 
-    async def build_experts(
+    def _get_application_criteria(
         self,
-        application_documents: List[ApplicationDocumentModel],
-        application_id: int
-    ) -> List[str]:
-        """Построить список экспертов с использованием CategoryExpertMapping"""
-        grouped = {}
-
-        for doc in application_documents:
-            # Получаем критерии для документа
-            criteria = await self._get_criteria_for_category(doc.category_id, application_id)
-            if not criteria or not criteria.checked_by:
-                continue
-
-            # Получаем категорию
-            category = doc.category
-            if not category:
-                continue
-
-            # Формируем ключ для группировки по категории
-            category_key = category.id
-
-            if category_key not in grouped:
-                # Используем маппер для определения должности эксперта
-                position = self.expert_mapper.get_position_for_solution(
-                    category_value=category.value,
-                    user_full_name=criteria.checked_by,
-                    category_title_ru=category.title_ru
-                )
-                grouped[category_key] = f"<b>{position}</b>"
-
-        return list(grouped.values())
+        criteria_by_category: Dict[int, ApplicationCriteriaModel]
+    ) -> ApplicationCriteriaModel | None:
+        """Получить критерии заявки (первую запись)"""
+        return min(criteria_by_category.values(), key=lambda criteria: criteria.id, default=None)
 
     def build_conclusion(
         self,
@@ -471,25 +648,6 @@ class GenerateSolutionUseCase:
 
         return "".join(lines)
 
-    async def _get_criteria_for_category(
-        self,
-        category_id: int,
-        application_id: int
-    ) -> ApplicationCriteriaModel | None:
-        """Получить критерии для категории"""
-        query = (
-            select(ApplicationCriteriaModel)
-            .where(
-                ApplicationCriteriaModel.category_id == category_id,
-                ApplicationCriteriaModel.application_id == application_id
-            )
-            .options(selectinload(ApplicationCriteriaModel.category))
-            .limit(1)  # Добавляем ограничение, чтобы избежать множественных записей
-        )
-
-        result = await self.db.execute(query)
-        return result.scalars().first()
-
     def _get_user_full_name(self, user) -> str:
         """Получить полное имя пользователя"""
         if not user:
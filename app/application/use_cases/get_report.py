@@ -3,10 +3,12 @@ Use Case: Get Report
 Сценарий использования: Получение отчета
 """
 from typing import Optional
+from app.core.instrumentation import instrument_use_case
 from app.domain.repositories.report_repository import IReportRepository
 from app.application.dto.report_dto import ReportDTO
 
 
+@instrument_use_case
 class GetReportUseCase:
     """Use Case для получения отчета по ID"""
 
@@ -0,0 +1,122 @@
+"""
+Use Case: List Expiring Licenses
+Сценарий использования: Получение лицензий и сертификатов, срок действия которых истекает
+"""
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import CursorPage, decode_cursor, encode_cursor, keyset_condition
+from app.core.instrumentation import instrument_use_case
+from app.application.dto.license_dto import ExpiringLicenseCertificateDTO
+from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.license import LicenseModel
+from app.infrastructure.database.models.license_certificate import LicenseCertificateModel
+
+
+# Максимальный размер страницы
+MAX_PAGE_SIZE = 500
+
+# Типы значений ключа сортировки: (licences.end_at, licences.id, license_certificates.id)
+CURSOR_TYPES = (date, int, int)
+
+
+@instrument_use_case
+class ListExpiringLicensesUseCase:
+    """
+    Use Case для получения истекающих лицензий с выданными сертификатами
+
+    Лицензии выбираются диапазоном по индексу licences(end_at, id) и
+    соединяются с сертификатами и клубами в одном запросе. Страницы
+    отдаются по курсору (end_at, license_id, certificate_id), поэтому
+    стоимость страницы не зависит от ее номера и размера истории лицензий.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def execute(
+        self,
+        days_threshold: int,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        today: Optional[date] = None
+    ) -> CursorPage[ExpiringLicenseCertificateDTO]:
+        """
+        Получить страницу лицензий, истекающих в ближайшие days_threshold дней
+
+        Args:
+            days_threshold: Горизонт в днях (лицензии с end_at от сегодня до сегодня + days_threshold)
+            limit: Размер страницы (не более MAX_PAGE_SIZE)
+            cursor: Курсор следующей страницы из предыдущего ответа
+            today: Дата отсчета (по умолчанию текущая)
+
+        Returns:
+            Страница строк (лицензия + сертификат), отсортированных по дате окончания
+
+        Raises:
+            ValueError: Если days_threshold не положителен или курсор некорректен
+        """
+        if days_threshold <= 0:
+            raise ValueError("days_threshold must be positive")
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        today = today or date.today()
+
+        # Сертификатов у лицензии может не быть - в ключе сортировки считаем id = 0
+        certificate_key = func.coalesce(LicenseCertificateModel.id, 0)
+        sort_key = (LicenseModel.end_at, LicenseModel.id, certificate_key)
+
+        query = (
+            select(
+                LicenseModel.id.label("license_id"),
+                LicenseModel.title_ru.label("license_title"),
+                LicenseModel.season_id,
+                LicenseModel.end_at,
+                LicenseCertificateModel.id.label("certificate_id"),
+                LicenseCertificateModel.type_ru.label("certificate_type"),
+                ClubModel.id.label("club_id"),
+                ClubModel.full_name_ru.label("club_name"),
+                ClubModel.bin.label("club_bin")
+            )
+            .outerjoin(LicenseCertificateModel, LicenseCertificateModel.license_id == LicenseModel.id)
+            .outerjoin(ClubModel, ClubModel.id == LicenseCertificateModel.club_id)
+            .where(
+                LicenseModel.end_at >= today,
+                LicenseModel.end_at <= today + timedelta(days=days_threshold)
+            )
+            .order_by(*sort_key)
+            # Лишняя строка показывает, есть ли следующая страница
+            .limit(limit + 1)
+        )
+        if cursor:
+            query = query.where(keyset_condition(sort_key, decode_cursor(cursor, CURSOR_TYPES)))
+
+        result = await self.db.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor((last.end_at, last.license_id, last.certificate_id or 0))
+
+        return CursorPage(
+            items=[
+                ExpiringLicenseCertificateDTO(
+                    license_id=row.license_id,
+                    license_title=row.license_title,
+                    season_id=row.season_id,
+                    end_at=row.end_at,
+                    days_until_expiry=(row.end_at - today).days,
+                    certificate_id=row.certificate_id,
+                    certificate_type=row.certificate_type,
+                    club_id=row.club_id,
+                    club_name=row.club_name,
+                    club_bin=row.club_bin
+                )
+                for row in rows
+            ],
+            next_cursor=next_cursor
+        )
@@ -2,18 +2,27 @@
 Use Case: List Reports
 Сценарий использования: Получение списка отчетов
 """
+from datetime import datetime
 from typing import Optional
-from app.domain.entities.report import ReportStatus, ReportType
+from app.core.pagination import CountCache, decode_cursor, encode_cursor
+from app.core.instrumentation import instrument_use_case
+from app.domain.entities.report import Report, ReportStatus, ReportType
 from app.domain.repositories.report_repository import IReportRepository
-from app.application.dto.report_dto import ReportListDTO, ReportDTO
+from app.application.dto.report_dto import ReportCursorListDTO, ReportListDTO, ReportDTO
 from math import ceil
 
 
+# Типы значений курсора: (created_at, id)
+CURSOR_TYPES = (datetime, int)
+
+
+@instrument_use_case
 class ListReportsUseCase:
     """Use Case для получения списка отчетов с фильтрацией и пагинацией"""
 
-    def __init__(self, report_repository: IReportRepository):
+    def __init__(self, report_repository: IReportRepository, count_cache: Optional[CountCache] = None):
         self.report_repository = report_repository
+        self.count_cache = count_cache
 
     async def execute(
         self,
@@ -60,21 +69,7 @@ class ListReportsUseCase:
         )
 
         # Конвертация в DTO
-        report_dtos = [
-            ReportDTO(
-                id=report.id,
-                name=report.name,
-                report_type=report.report_type,
-                status=report.status,
-                parameters=report.parameters,
-                file_path=report.file_path,
-                created_at=report.created_at,
-                updated_at=report.updated_at,
-                completed_at=report.completed_at,
-                error_message=report.error_message
-            )
-            for report in reports
-        ]
+        report_dtos = [self._to_dto(report) for report in reports]
 
         # Расчет общего количества страниц
         total_pages = ceil(total / page_size) if total > 0 else 0
@@ -86,3 +81,96 @@ class ListReportsUseCase:
             page_size=page_size,
             total_pages=total_pages
         )
+
+    async def execute_cursor(
+        self,
+        page_size: int = 10,
+        cursor: Optional[str] = None,
+        status: Optional[ReportStatus] = None,
+        report_type: Optional[ReportType] = None,
+        include_total: bool = False
+    ) -> ReportCursorListDTO:
+        """
+        Получить страницу отчетов по курсору
+
+        Страница читается с позиции курсора по (created_at, id), поэтому ее
+        стоимость не зависит от глубины. Общее количество считается только
+        по запросу и берется из count_cache, пока не устарело.
+
+        Args:
+            page_size: Размер страницы
+            cursor: Курсор next_cursor из предыдущей страницы
+            status: Фильтр по статусу
+            report_type: Фильтр по типу отчета
+            include_total: Вернуть общее количество отчетов
+
+        Returns:
+            DTO со списком отчетов и курсором следующей страницы
+
+        Raises:
+            ValueError: Если курсор некорректен
+        """
+        # Валидация параметров пагинации
+        if page_size < 1:
+            page_size = 10
+        if page_size > 100:
+            page_size = 100
+
+        after = decode_cursor(cursor, CURSOR_TYPES) if cursor else None
+
+        # Лишняя запись показывает, есть ли следующая страница
+        reports = await self.report_repository.get_page(
+            limit=page_size + 1,
+            after=after,
+            status=status,
+            report_type=report_type
+        )
+
+        next_cursor = None
+        if len(reports) > page_size:
+            reports = reports[:page_size]
+            next_cursor = encode_cursor((reports[-1].created_at, reports[-1].id))
+
+        total = None
+        if include_total:
+            total = await self._count(status, report_type)
+
+        return ReportCursorListDTO(
+            reports=[self._to_dto(report) for report in reports],
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total=total
+        )
+
+    async def _count(
+        self,
+        status: Optional[ReportStatus],
+        report_type: Optional[ReportType]
+    ) -> int:
+        """Общее количество отчетов (из кеша, если он задан и значение не устарело)"""
+        key = (status, report_type)
+        if self.count_cache is not None:
+            cached = self.count_cache.get(key)
+            if cached is not None:
+                return cached
+
+        total = await self.report_repository.count(status=status, report_type=report_type)
+        if self.count_cache is not None:
+            self.count_cache.set(key, total)
+        return total
+
+    @staticmethod
+    def _to_dto(report: Report) -> ReportDTO:
+        """Конвертация сущности в DTO"""
+        return ReportDTO(
+            id=report.id,
+            name=report.name,
+            report_type=report.report_type,
+            status=report.status,
+            parameters=report.parameters,
+            file_path=report.file_path,
+            created_at=report.created_at,
+            updated_at=report.updated_at,
+            completed_at=report.completed_at,
+            error_message=report.error_message
+        )
@@ -36,7 +36,59 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    # PDF: бэкенд генерации - puppeteer (HTTP сервис) или pdfkit (wkhtmltopdf)
+    PDF_BACKEND: str = "puppeteer"
+    # Через сколько секунд клиенту повторить запрос, если рендерер перегружен (503)
+    PDF_RETRY_AFTER: int = 5
+    # pdfkit: количество параллельных процессов wkhtmltopdf и размер очереди ожидания
+    PDFKIT_MAX_WORKERS: int = 2
+    PDFKIT_MAX_QUEUE: int = 8
+    # Отдача PDF клиенту: memory (из памяти) или file (через временный файл)
+    PDF_RESPONSE_MODE: str = "memory"
+    # Сколько страниц одного запроса (например, EN и KK сертификата) рендерится одновременно
+    PDF_REQUEST_CONCURRENCY: int = 2
+    # Пакетная генерация: одновременные рендеры и максимальный размер пакета
+    PDF_BATCH_CONCURRENCY: int = 4
+    PDF_BATCH_MAX_ITEMS: int = 100
+    # Кеш сгенерированных PDF на диске (ключ - хеш шаблона и данных)
+    PDF_CACHE_ENABLED: bool = True
+    PDF_CACHE_DIR: str = ".cache/pdf"
+    PDF_CACHE_MAX_MB: int = 512
+    # Режим кеша: content (ключ по данным шаблона) или watermark (ключ по MAX(updated_at),
+    # повторная выдача без сборки данных документа)
+    PDF_CACHE_MODE: str = "content"
+    # Фоновая генерация (/jobs): воркеры, максимум ожидающих задач и время хранения результата (сек)
+    JOB_WORKERS: int = 2
+    JOB_MAX_PENDING: int = 100
+    JOB_RESULT_TTL: int = 3600
+    # Хранилище файлов отчетов /reports (имя файла - хеш содержимого)
+    REPORT_STORE_DIR: str = "storage/reports"
+    # Курсорный список отчетов: сколько секунд кешировать общее количество (0 - без кеша)
+    REPORT_COUNT_CACHE_TTL: int = 30
+
     PUPPETEER_PDF_URL: str = "http://localhost:3002/render"
+    PUPPETEER_TIMEOUT: int = 90
+    # Пул соединений к PDF рендереру (один AsyncClient на процесс)
+    PUPPETEER_MAX_CONNECTIONS: int = 10
+    PUPPETEER_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    PUPPETEER_HTTP2: bool = False
+    # Передавать HTML в рендерер потоком (chunked), не собирая строку целиком
+    PUPPETEER_STREAM_UPLOAD: bool = False
+
+    # Assets: способ передачи изображений в HTML шаблоны
+    # inline - data URI с base64, url - ссылка на маршрут /api/v1/assets, file - file:// путь (pdfkit)
+    ASSET_MODE: str = "inline"
+    # Базовый URL приложения, доступный из PDF рендерера (для ASSET_MODE=url)
+    ASSET_BASE_URL: str = "http://localhost:8000"
+    # Директория для оптимизированных вариантов изображений
+    ASSET_CACHE_DIR: str = ".cache/assets"
+    # Качество фона сертификатов: original, print (300 DPI), standard (200 DPI), draft (150 DPI)
+    CERTIFICATE_BG_QUALITY: str = "print"
+
+    # Templates: кеш байткода Jinja2 (пустое значение - отключен)
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ".cache/templates"
+    # Перечитывать измененные шаблоны без перезапуска (только для разработки)
+    TEMPLATES_AUTO_RELOAD: bool = False
 
     @property
     def database_url(self) -> str:
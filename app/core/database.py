@@ -5,6 +5,7 @@ Database connection and session management
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine
 
 # Создание async engine
 engine = create_async_engine(
@@ -15,6 +16,9 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+# Учет количества и времени SQL запросов (Server-Timing, /metrics)
+instrument_engine(engine)
+
 # Создание фабрики сессий
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -5,7 +5,9 @@ Dependency Injection Container
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.pagination import CountCache
 from app.domain.repositories.report_repository import IReportRepository
 from app.domain.services.report_service import ReportDomainService
 from app.infrastructure.database.repositories.report_repository_impl import (
@@ -16,6 +18,11 @@ from app.application.use_cases.generate_report import GenerateReportUseCase
 from app.application.use_cases.get_report import GetReportUseCase
 from app.application.use_cases.list_reports import ListReportsUseCase
 from app.application.use_cases.delete_report import DeleteReportUseCase
+from app.core.services import create_report_renderers, report_store
+
+
+# Общее количество отчетов для курсорного списка (один кеш на процесс)
+report_count_cache = CountCache(settings.REPORT_COUNT_CACHE_TTL)
 
 
 # Repository Dependencies
@@ -41,12 +48,21 @@ def get_create_report_use_case(
     return CreateReportUseCase(repository, service)
 
 
+def create_generate_report_use_case(db: AsyncSession) -> GenerateReportUseCase:
+    """Создать use case генерации отчета для сессии БД (в том числе для фоновой задачи)"""
+    return GenerateReportUseCase(
+        ReportRepositoryImpl(db),
+        ReportDomainService(),
+        report_renderers=create_report_renderers(db),
+        report_store=report_store
+    )
+
+
 def get_generate_report_use_case(
-    repository: IReportRepository = Depends(get_report_repository),
-    service: ReportDomainService = Depends(get_report_service)
+    db: AsyncSession = Depends(get_db)
 ) -> GenerateReportUseCase:
     """Получить use case генерации отчета"""
-    return GenerateReportUseCase(repository, service)
+    return create_generate_report_use_case(db)
 
 
 def get_get_report_use_case(
@@ -60,11 +76,11 @@ def get_list_reports_use_case(
     repository: IReportRepository = Depends(get_report_repository)
 ) -> ListReportsUseCase:
     """Получить use case списка отчетов"""
-    return ListReportsUseCase(repository)
+    return ListReportsUseCase(repository, count_cache=report_count_cache)
 
 
 def get_delete_report_use_case(
     repository: IReportRepository = Depends(get_report_repository)
 ) -> DeleteReportUseCase:
     """Получить use case удаления отчета"""
-    return DeleteReportUseCase(repository)
+    return DeleteReportUseCase(repository, report_store)
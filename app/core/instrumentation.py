@@ -0,0 +1,335 @@
+"""
+Instrumentation
+Метрики SQL запросов и времени выполнения в разрезе HTTP запросов, use case
+и этапов генерации документов
+"""
+import bisect
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class UseCaseScope:
+    """
+    Метрики одного вызова use case
+
+    Attributes:
+        name: Имя use case (Класс.метод)
+        queries: Количество SQL запросов, выполненных самим use case
+        db_seconds: Время выполнения этих запросов
+        seconds: Полное время вызова
+    """
+    name: str
+    queries: int = 0
+    db_seconds: float = 0.0
+    seconds: float = 0.0
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Метрики одного HTTP запроса
+
+    Attributes:
+        queries: Количество SQL запросов за время запроса
+        db_seconds: Время выполнения SQL запросов
+        use_cases: Завершившиеся вызовы use case в порядке завершения
+        started_at: Время начала (time.perf_counter)
+    """
+    queries: int = 0
+    db_seconds: float = 0.0
+    use_cases: List[UseCaseScope] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def server_timing(self) -> str:
+        """Значение заголовка Server-Timing"""
+        entries = [
+            f'db;desc="{self.queries} queries";dur={self.db_seconds * 1000:.1f}',
+        ]
+        for index, scope in enumerate(self.use_cases, start=1):
+            entries.append(
+                f'uc{index};desc="{scope.name} ({scope.queries} queries)";dur={scope.seconds * 1000:.1f}'
+            )
+        entries.append(f"app;dur={(time.perf_counter() - self.started_at) * 1000:.1f}")
+        return ", ".join(entries)
+
+
+@dataclass
+class Histogram:
+    """
+    Гистограмма длительностей в формате Prometheus
+
+    Attributes:
+        buckets: Верхние границы корзин (секунды, по возрастанию)
+        counts: Количество наблюдений в каждой корзине (не накопительное)
+        total: Сумма наблюдений
+        count: Количество наблюдений
+    """
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Учесть наблюдение"""
+        self.total += value
+        self.count += 1
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.counts[index] += 1
+
+
+@dataclass
+class UseCaseTotals:
+    """Накопленные метрики use case для /metrics"""
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+# Метрики текущего HTTP запроса (задаются middleware)
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+# Стек выполняющихся use case (запрос относится к последнему)
+_use_case_stack: ContextVar[Tuple[UseCaseScope, ...]] = ContextVar("use_case_stack", default=())
+
+# Тип документа, который генерируется в текущей задаче (задается timed_document)
+_document_type: ContextVar[Optional[str]] = ContextVar("document_type", default=None)
+
+# Границы корзин гистограмм этапов генерации документов (секунды)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Накопленные метрики процесса
+_use_case_totals: Dict[str, UseCaseTotals] = {}
+_db_totals = {"queries": 0, "seconds": 0.0}
+_stage_histograms: Dict[Tuple[str, str], Histogram] = {}
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подключить учет SQL запросов к engine
+
+    События cursor_execute вызываются в контексте задачи, выполняющей
+    запрос, поэтому запрос относится к текущим HTTP запросу и use case.
+    Время начала хранится в контексте выполнения запроса; запросы, завершившиеся
+    ошибкой, учитываются через событие handle_error.
+
+    Args:
+        engine: Async engine приложения
+    """
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(time.perf_counter() - context._query_started_at)
+        # Ошибка при чтении результата не должна учесть запрос повторно
+        context._query_started_at = None
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        context = exception_context.execution_context
+        # Ошибка до отправки запроса в курсор (например, при подключении) - запроса не было
+        started = getattr(context, "_query_started_at", None)
+        if started is not None:
+            record_query(time.perf_counter() - started)
+            context._query_started_at = None
+
+
+def record_query(seconds: float) -> None:
+    """Учесть выполненный SQL запрос"""
+    _db_totals["queries"] += 1
+    _db_totals["seconds"] += seconds
+
+    request = _request_metrics.get()
+    if request is not None:
+        request.queries += 1
+        request.db_seconds += seconds
+
+    stack = _use_case_stack.get()
+    if stack:
+        stack[-1].queries += 1
+        stack[-1].db_seconds += seconds
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestMetrics]:
+    """Собирать метрики HTTP запроса (используется middleware)"""
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+@contextmanager
+def use_case_scope(name: str) -> Iterator[UseCaseScope]:
+    """
+    Собирать метрики вызова use case
+
+    Запросы вложенного use case учитываются только в нем, время вызова -
+    и во внешнем.
+
+    Args:
+        name: Имя use case
+    """
+    scope = UseCaseScope(name=name)
+    token = _use_case_stack.set(_use_case_stack.get() + (scope,))
+    totals = _use_case_totals.setdefault(name, UseCaseTotals())
+    started = time.perf_counter()
+    try:
+        yield scope
+    except Exception:
+        totals.errors += 1
+        raise
+    finally:
+        scope.seconds = time.perf_counter() - started
+        _use_case_stack.reset(token)
+
+        totals.calls += 1
+        totals.seconds += scope.seconds
+        totals.queries += scope.queries
+        totals.db_seconds += scope.db_seconds
+
+        request = _request_metrics.get()
+        if request is not None:
+            request.use_cases.append(scope)
+
+
+def instrument_use_case(cls):
+    """
+    Декоратор класса use case: учитывать вызовы методов execute*
+
+    Args:
+        cls: Класс use case
+
+    Returns:
+        Тот же класс с обернутыми корутинами execute*
+    """
+    for attr_name, method in list(vars(cls).items()):
+        if attr_name.startswith("execute") and inspect.iscoroutinefunction(method):
+            setattr(cls, attr_name, _wrap_use_case_method(f"{cls.__name__}.{attr_name}", method))
+    return cls
+
+
+def _wrap_use_case_method(name: str, method):
+    """Обернуть метод use case в use_case_scope"""
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        with use_case_scope(name):
+            return await method(*args, **kwargs)
+    return wrapper
+
+
+def observe_stage(stage: str, seconds: float, document: Optional[str] = None) -> None:
+    """
+    Учесть длительность этапа генерации документа
+
+    Args:
+        stage: Этап (assets, cache_lookup, use_case, context, template, pdf, response, total)
+        seconds: Длительность этапа
+        document: Тип документа (по умолчанию - заданный timed_document)
+    """
+    document = document or _document_type.get()
+    if document is None:
+        # Генерация вне отслеживаемых документов (пакеты, /reports) не учитывается
+        return
+
+    histogram = _stage_histograms.get((document, stage))
+    if histogram is None:
+        histogram = _stage_histograms[(document, stage)] = Histogram(STAGE_BUCKETS)
+    histogram.observe(seconds)
+
+
+@contextmanager
+def stage_timer(stage: str, document: Optional[str] = None) -> Iterator[None]:
+    """
+    Засечь длительность этапа генерации документа
+
+    Учитываются только успешно завершившиеся этапы.
+
+    Args:
+        stage: Этап
+        document: Тип документа (по умолчанию - заданный timed_document)
+    """
+    started = time.perf_counter()
+    yield
+    observe_stage(stage, time.perf_counter() - started, document)
+
+
+def timed_document(document: str):
+    """
+    Декоратор функции генерации документа: задает тип документа для
+    stage_timer внутри нее и засекает этап total
+
+    Args:
+        document: Тип документа (report, initial_report, solution, ...)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = _document_type.set(document)
+            try:
+                with stage_timer("total"):
+                    return await func(*args, **kwargs)
+            finally:
+                _document_type.reset(token)
+        return wrapper
+    return decorator
+
+
+def render_metrics() -> str:
+    """Метрики процесса в текстовом формате Prometheus"""
+    lines = [
+        "# HELP db_queries_total SQL statements executed.",
+        "# TYPE db_queries_total counter",
+        f"db_queries_total {_db_totals['queries']}",
+        "# HELP db_query_duration_seconds_total Time spent executing SQL statements.",
+        "# TYPE db_query_duration_seconds_total counter",
+        f"db_query_duration_seconds_total {_db_totals['seconds']:.6f}",
+    ]
+
+    use_case_metrics = (
+        ("use_case_calls_total", "Use case calls.", "calls"),
+        ("use_case_errors_total", "Use case calls that raised.", "errors"),
+        ("use_case_duration_seconds_total", "Wall time spent in use cases.", "seconds"),
+        ("use_case_db_queries_total", "SQL statements issued by use cases.", "queries"),
+        ("use_case_db_duration_seconds_total", "Time spent in SQL statements issued by use cases.", "db_seconds"),
+    )
+    for metric, description, attribute in use_case_metrics:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, totals in sorted(_use_case_totals.items()):
+            value = getattr(totals, attribute)
+            formatted = f"{value:.6f}" if isinstance(value, float) else str(value)
+            lines.append(f'{metric}{{use_case="{name}"}} {formatted}')
+
+    metric = "document_stage_duration_seconds"
+    lines.append(f"# HELP {metric} Duration of document generation stages.")
+    lines.append(f"# TYPE {metric} histogram")
+    for (document, stage), histogram in sorted(_stage_histograms.items()):
+        labels = f'document="{document}",stage="{stage}"'
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{metric}_sum{{{labels}}} {histogram.total:.6f}")
+        lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,148 @@
+"""
+Keyset Pagination
+Курсорная (keyset) пагинация: курсор хранит ключ сортировки последней записи страницы
+"""
+import base64
+import json
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """
+    Страница результатов курсорной пагинации
+
+    Attributes:
+        items: Записи страницы
+        next_cursor: Курсор следующей страницы (None - страница последняя)
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class CountCache:
+    """
+    Кеш общего количества записей для курсорной пагинации
+
+    Точное COUNT(*) на большой таблице стоит полного прохода по индексу;
+    при листании курсором его достаточно пересчитывать раз в ttl секунд.
+    """
+
+    def __init__(self, ttl: int):
+        """
+        Инициализация кеша
+
+        Args:
+            ttl: Время жизни значения в секундах (0 - не кешировать)
+        """
+        self.ttl = ttl
+        self._values: Dict[Hashable, Tuple[float, int]] = {}
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """Получить количество по ключу фильтров (None - нет или устарело)"""
+        cached = self._values.get(key)
+        if cached is None or cached[0] < time.monotonic():
+            return None
+        return cached[1]
+
+    def set(self, key: Hashable, value: int) -> None:
+        """Сохранить количество по ключу фильтров"""
+        if self.ttl > 0:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Закодировать ключ сортировки записи в курсор
+
+    Args:
+        values: Значения колонок ключа сортировки (int, str, date, datetime)
+
+    Returns:
+        Непрозрачная для клиента строка (url-safe base64)
+    """
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Раскодировать курсор в ключ сортировки
+
+    Args:
+        cursor: Курсор, полученный от encode_cursor
+        types: Типы значений ключа (int, str, date, datetime)
+
+    Returns:
+        Кортеж значений ключа
+
+    Raises:
+        ValueError: Если курсор поврежден или не соответствует ключу
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return tuple(_parse_value(value, value_type) for value, value_type in zip(payload, types))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_condition(
+    columns: Sequence[Any],
+    values: Sequence[Any],
+    descending: bool = False
+) -> ColumnElement:
+    """
+    Условие "запись после курсора" для сортировки по columns
+
+    Строится в развернутом виде (a > x OR a = x AND b > y ...), а не через
+    сравнение кортежей: так условие переносимо между СУБД, а дополнительное
+    a >= x позволяет использовать индекс по первой колонке как диапазон.
+
+    Args:
+        columns: Колонки ключа сортировки (последняя должна быть уникальной)
+        values: Значения ключа последней записи предыдущей страницы
+        descending: Сортировка по убыванию
+
+    Returns:
+        Условие для WHERE
+    """
+    def after(column, value):
+        return column < value if descending else column > value
+
+    condition = after(columns[-1], values[-1])
+    for column, value in zip(reversed(columns[:-1]), reversed(values[:-1])):
+        condition = or_(after(column, value), and_(column == value, condition))
+
+    leading = columns[0] <= values[0] if descending else columns[0] >= values[0]
+    return and_(leading, condition)
+
+
+def _parse_value(value: Any, value_type: type) -> Any:
+    """Преобразовать значение курсора к типу колонки"""
+    if value_type is datetime:
+        return datetime.fromisoformat(value)
+    if value_type is date:
+        return date.fromisoformat(value)
+    if value_type is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError
+        return value
+    if not isinstance(value, value_type):
+        raise ValueError
+    return value
@@ -0,0 +1,188 @@
+"""
+Общие сервисы процесса
+Реестр изображений, рендерер шаблонов, генератор PDF, очередь задач, кеш и хранилище отчетов
+"""
+import os
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.application.services.job_queue import DocumentJobQueue
+from app.application.services.report_renderers.expiration import ExpirationReportRenderer
+from app.application.services.report_renderers.license_details import LicenseDetailsReportRenderer
+from app.application.services.report_renderers.license_summary import LicenseSummaryReportRenderer
+from app.domain.entities.report import ReportType
+from app.domain.services.report_renderer import IReportRenderer
+from app.domain.services.report_store import IReportStore
+from app.domain.services.pdf_generator import IPDFGenerator
+from app.domain.services.pdf_cache import IPdfCache
+from app.infrastructure.services.jinja2_template_renderer import Jinja2TemplateRenderer
+from app.infrastructure.services.pdfkit_generator import PdfKitGenerator
+from app.infrastructure.services.puppeteer_pdf_generator import PuppeteerPdfGenerator
+from app.infrastructure.services.asset_registry import AssetRegistry
+from app.infrastructure.services.image_variant_builder import ImageVariantBuilder
+from app.infrastructure.services.disk_pdf_cache import DiskPdfCache
+from app.infrastructure.services.disk_report_store import DiskReportStore
+
+load_dotenv()
+
+# Путь к директории templates (шаблоны и изображения)
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+
+# Префикс маршрута, по которому отдаются изображения в режиме ASSET_MODE=url
+ASSETS_ROUTE_PREFIX = "/api/v1/assets"
+
+# Реестр изображений - общий для всего процесса, загружается при старте приложения
+asset_registry = AssetRegistry(
+    TEMPLATES_DIR,
+    mode=settings.ASSET_MODE,
+    base_url=f"{settings.ASSET_BASE_URL.rstrip('/')}{ASSETS_ROUTE_PREFIX}",
+    variant_builder=ImageVariantBuilder(os.path.join(BASE_DIR, settings.ASSET_CACHE_DIR))
+)
+
+# Фоны сертификатов, для которых используются оптимизированные варианты
+CERTIFICATE_BACKGROUNDS = ("bg_certificate_en.png", "bg_certificate_kk.png")
+
+
+def preload_assets() -> List[str]:
+    """
+    Загрузить изображения шаблонов в память и подготовить варианты фонов сертификатов
+
+    Returns:
+        Список имен загруженных файлов
+    """
+    loaded = asset_registry.preload()
+    for name in CERTIFICATE_BACKGROUNDS:
+        asset_registry.get_variant_name(name, settings.CERTIFICATE_BG_QUALITY)
+    return loaded
+
+
+# Рендерер шаблонов - общий для процесса (кеш скомпилированных шаблонов не теряется)
+template_renderer = Jinja2TemplateRenderer(
+    TEMPLATES_DIR,
+    bytecode_cache_dir=(
+        os.path.join(BASE_DIR, settings.TEMPLATE_BYTECODE_CACHE_DIR)
+        if settings.TEMPLATE_BYTECODE_CACHE_DIR else None
+    ),
+    auto_reload=settings.TEMPLATES_AUTO_RELOAD
+)
+
+
+def preload_templates() -> List[str]:
+    """
+    Скомпилировать шаблоны при старте приложения
+
+    Returns:
+        Список имен скомпилированных шаблонов
+    """
+    return template_renderer.precompile()
+
+
+def create_pdf_generator() -> IPDFGenerator:
+    """Создать генератор PDF в соответствии с PDF_BACKEND"""
+    if settings.PDF_BACKEND == "pdfkit":
+        return PdfKitGenerator(
+            max_workers=settings.PDFKIT_MAX_WORKERS,
+            max_queue=settings.PDFKIT_MAX_QUEUE,
+            retry_after=settings.PDF_RETRY_AFTER,
+        )
+
+    return PuppeteerPdfGenerator(
+        service_url=settings.PUPPETEER_PDF_URL,
+        timeout=settings.PUPPETEER_TIMEOUT,
+        max_connections=settings.PUPPETEER_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.PUPPETEER_MAX_KEEPALIVE_CONNECTIONS,
+        http2=settings.PUPPETEER_HTTP2,
+        stream_upload=settings.PUPPETEER_STREAM_UPLOAD,
+    )
+
+
+# Генератор PDF - общий для процесса (пул соединений/воркеров живет все время работы)
+pdf_generator: IPDFGenerator = create_pdf_generator()
+
+
+# Очередь фоновой генерации документов - общая для процесса
+job_queue = DocumentJobQueue(
+    workers=settings.JOB_WORKERS,
+    max_pending=settings.JOB_MAX_PENDING,
+    result_ttl=settings.JOB_RESULT_TTL,
+    retry_after=settings.PDF_RETRY_AFTER,
+)
+
+
+async def init_services() -> None:
+    """Инициализировать общие сервисы (вызывается при старте приложения)"""
+    await pdf_generator.start()
+    await job_queue.start()
+
+
+async def close_services() -> None:
+    """Освободить ресурсы общих сервисов (вызывается при остановке приложения)"""
+    # Сначала останавливаем задачи, которые используют генератор PDF
+    await job_queue.stop()
+    await pdf_generator.close()
+
+
+# Кеш сгенерированных PDF - общий для процесса
+pdf_cache: Optional[IPdfCache] = (
+    DiskPdfCache(
+        os.path.join(BASE_DIR, settings.PDF_CACHE_DIR),
+        max_bytes=settings.PDF_CACHE_MAX_MB * 1024 * 1024
+    )
+    if settings.PDF_CACHE_ENABLED else None
+)
+
+# Хранилище файлов отчетов /reports - общее для процесса
+report_store: IReportStore = DiskReportStore(os.path.join(BASE_DIR, settings.REPORT_STORE_DIR))
+
+
+def create_report_renderers(db: AsyncSession) -> Dict[ReportType, IReportRenderer]:
+    """
+    Создать генераторы отчетов /reports по типам
+
+    Args:
+        db: Сессия БД, в которой генераторы читают данные
+
+    Returns:
+        Словарь тип отчета -> генератор
+    """
+    services = {
+        "db": db,
+        "template_renderer": template_renderer,
+        "pdf_generator": pdf_generator,
+        "logo_base64": load_logo_base64(),
+        "pdf_cache": pdf_cache,
+    }
+    return {
+        ReportType.LICENSE_DETAILS: LicenseDetailsReportRenderer(**services),
+        ReportType.LICENSE_SUMMARY: LicenseSummaryReportRenderer(**services),
+        ReportType.EXPIRATION_REPORT: ExpirationReportRenderer(**services),
+    }
+
+
+# Logo loader helper
+def load_logo_base64() -> str:
+    """Загрузить логотип (data URI, URL или file:// путь в зависимости от ASSET_MODE)"""
+    # Возвращает пустую строку если логотип не найден
+    return asset_registry.get_src("logo_white.png")
+
+
+# Sign image loader helper
+def load_sign_img_base64() -> str:
+    """Загрузить изображение подписи (data URI, URL или file:// путь)"""
+    # Возвращает пустую строку если изображение не найдено
+    return asset_registry.get_src("sign_img.png")
+
+
+# Background certificate images loaders
+def load_bg_certificate_en() -> str:
+    """Загрузить фон для английского сертификата (data URI, URL или file:// путь)"""
+    return asset_registry.get_src("bg_certificate_en.png", tier=settings.CERTIFICATE_BG_QUALITY)
+
+
+def load_bg_certificate_kk() -> str:
+    """Загрузить фон для казахского сертификата (data URI, URL или file:// путь)"""
+    return asset_registry.get_src("bg_certificate_kk.png", tier=settings.CERTIFICATE_BG_QUALITY)
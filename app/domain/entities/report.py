@@ -52,6 +52,12 @@ class Report:
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
 
+    def mark_as_pending(self) -> None:
+        """Поставить отчет в очередь на генерацию"""
+        self.status = ReportStatus.PENDING
+        self.error_message = None
+        self.updated_at = datetime.utcnow()
+
     def mark_as_processing(self) -> None:
         """Отметить отчет как обрабатывающийся"""
         self.status = ReportStatus.PROCESSING
@@ -3,7 +3,8 @@ Repository interface for Report
 Интерфейс репозитория - абстракция для работы с хранилищем данных
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from app.domain.entities.report import Report, ReportStatus, ReportType
 
 
@@ -61,6 +62,28 @@ class IReportRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[ReportStatus] = None,
+        report_type: Optional[ReportType] = None
+    ) -> List[Report]:
+        """
+        Получить страницу отчетов по курсору (от новых к старым)
+
+        Args:
+            limit: Максимальное количество записей
+            after: Ключ (created_at, id) последнего отчета предыдущей страницы
+            status: Фильтр по статусу
+            report_type: Фильтр по типу отчета
+
+        Returns:
+            Список отчетов, отсортированных по (created_at, id) по убыванию
+        """
+        pass
+
     @abstractmethod
     async def update(self, report: Report) -> Report:
         """
@@ -87,6 +110,19 @@ class IReportRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def is_file_referenced(self, file_path: str) -> bool:
+        """
+        Проверить, ссылается ли какой-либо отчет на файл
+
+        Args:
+            file_path: Ключ файла в хранилище отчетов
+
+        Returns:
+            True если есть отчет с таким file_path
+        """
+        pass
+
     @abstractmethod
     async def count(
         self,
@@ -0,0 +1,63 @@
+"""
+PDF Cache Service Interface
+Интерфейс кеша сгенерированных PDF документов
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class IPdfCache(ABC):
+    """Интерфейс для кеша PDF по ключу содержимого"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Получить PDF из кеша
+
+        Args:
+            key: Ключ документа (хеш содержимого)
+
+        Returns:
+            Содержимое PDF или None если документа нет в кеше
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, content: bytes) -> None:
+        """
+        Сохранить PDF в кеш
+
+        Args:
+            key: Ключ документа (хеш содержимого)
+            content: Содержимое PDF
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Получить статистику кеша
+
+        Returns:
+            Словарь с количеством попаданий, промахов и размером кеша
+        """
+        pass
+
+    async def get_or_create(self, key: str, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Получить PDF из кеша или сгенерировать и сохранить его
+
+        Args:
+            key: Ключ документа (хеш содержимого)
+            factory: Функция генерации PDF при промахе
+
+        Returns:
+            Содержимое PDF
+        """
+        content = await self.get(key)
+        if content is not None:
+            return content
+
+        content = await factory()
+        await self.put(key, content)
+        return content
@@ -2,7 +2,24 @@
 PDF Generator Service Interface
 Интерфейс сервиса для генерации PDF из HTML
 """
+import asyncio
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from typing import AsyncIterable, List
+
+
+class PdfGeneratorBusyError(Exception):
+    """Генератор PDF перегружен: очередь рендеринга заполнена"""
+
+    def __init__(self, message: str, retry_after: int):
+        """
+        Args:
+            message: Сообщение об ошибке
+            retry_after: Через сколько секунд имеет смысл повторить запрос
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class IPDFGenerator(ABC):
@@ -21,3 +38,107 @@ class IPDFGenerator(ABC):
             Exception: Ошибки при генерации PDF
         """
         pass
+
+    async def generate_pdf(self, html_content: str) -> bytes:
+        """
+        Асинхронно сгенерировать PDF из HTML строки
+
+        Реализация по умолчанию выполняет generate_from_html в отдельном потоке,
+        чтобы не блокировать event loop. Генераторы с нативной асинхронной
+        поддержкой переопределяют этот метод.
+
+        Args:
+            html_content: HTML контент для конвертации
+
+        Returns:
+            Содержимое PDF файла
+
+        Raises:
+            PdfGeneratorBusyError: Если генератор перегружен
+            Exception: Ошибки при генерации PDF
+        """
+        return await asyncio.to_thread(self._generate_to_bytes, html_content)
+
+    @property
+    def streams_html(self) -> bool:
+        """
+        Передает ли generate_pdf_stream HTML дальше по частям
+
+        Если нет, HTML все равно собирается целиком, и рендерить шаблон
+        потоком нет смысла.
+        """
+        return False
+
+    async def generate_pdf_stream(self, html_chunks: AsyncIterable[str]) -> bytes:
+        """
+        Сгенерировать PDF из HTML, поступающего частями
+
+        Реализация по умолчанию собирает HTML целиком и вызывает generate_pdf.
+        Генераторы, которые умеют передавать тело запроса потоком,
+        переопределяют этот метод.
+
+        Args:
+            html_chunks: Фрагменты HTML контента
+
+        Returns:
+            Содержимое PDF файла
+
+        Raises:
+            PdfGeneratorBusyError: Если генератор перегружен
+            Exception: Ошибки при генерации PDF
+        """
+        html_content = "".join([chunk async for chunk in html_chunks])
+        return await self.generate_pdf(html_content)
+
+    async def generate_many(self, html_contents: List[str], concurrency: int = 2) -> List[bytes]:
+        """
+        Сгенерировать несколько PDF параллельно
+
+        Не более concurrency документов рендерятся одновременно, чтобы один
+        запрос не занимал весь рендерер.
+
+        Args:
+            html_contents: HTML контент документов
+            concurrency: Максимальное количество одновременных рендеров
+
+        Returns:
+            Содержимое PDF файлов в порядке html_contents
+
+        Raises:
+            PdfGeneratorBusyError: Если генератор перегружен
+            Exception: Ошибки при генерации PDF
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def generate(html_content: str) -> bytes:
+            async with semaphore:
+                return await self.generate_pdf(html_content)
+
+        tasks = [asyncio.ensure_future(generate(html)) for html in html_contents]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Если один документ не удался, остальные рендерить бессмысленно
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def start(self) -> None:
+        """Подготовить ресурсы генератора (вызывается при старте приложения)"""
+        pass
+
+    async def close(self) -> None:
+        """Освободить ресурсы генератора (вызывается при остановке приложения)"""
+        pass
+
+    def _generate_to_bytes(self, html_content: str) -> bytes:
+        """Сгенерировать PDF через временный файл и вернуть его содержимое"""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+        temp_file.close()
+
+        try:
+            self.generate_from_html(html_content, temp_file.name)
+            with open(temp_file.name, "rb") as f:
+                return f.read()
+        finally:
+            os.unlink(temp_file.name)
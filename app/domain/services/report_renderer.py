@@ -0,0 +1,27 @@
+"""
+Report Renderer Interface
+Интерфейс генерации файла отчета определенного типа
+"""
+from abc import ABC, abstractmethod
+
+from app.domain.entities.report import Report
+
+
+class IReportRenderer(ABC):
+    """Интерфейс для генерации файла отчета по его параметрам"""
+
+    @abstractmethod
+    async def render(self, report: Report) -> bytes:
+        """
+        Сгенерировать файл отчета
+
+        Args:
+            report: Отчет с типом и параметрами
+
+        Returns:
+            Содержимое PDF файла
+
+        Raises:
+            ValueError: Если параметры отчета некорректны или данные не найдены
+        """
+        pass
@@ -6,6 +6,17 @@ from typing import Dict, Any
 from app.domain.entities.report import Report, ReportType
 
 
+# Приоритет фоновой генерации документов (parameters["document_type"] отчета CUSTOM):
+# итоговые документы клуба нужны сразу после заседания, отчеты по критериям - рабочие
+DOCUMENT_TYPE_PRIORITY = {
+    "certificate": 3,
+    "solution": 3,
+    "initial_report": 2,
+    "department_report": 2,
+    "report": 1,
+}
+
+
 class ReportDomainService:
     """
     Доменный сервис для бизнес-логики отчетов
@@ -108,6 +119,10 @@ class ReportDomainService:
         }
         priority += priority_by_type.get(report.report_type, 0)
 
+        # Документы, генерируемые через очередь задач, - по типу документа
+        if report.report_type == ReportType.CUSTOM and report.parameters:
+            priority += DOCUMENT_TYPE_PRIORITY.get(report.parameters.get("document_type"), 0)
+
         # Можно добавить другие факторы (например, время ожидания)
 
         return priority
@@ -0,0 +1,51 @@
+"""
+Report Store Interface
+Интерфейс хранилища файлов отчетов с адресацией по содержимому
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IReportStore(ABC):
+    """Интерфейс для хранения файлов отчетов по хешу содержимого"""
+
+    @abstractmethod
+    async def put(self, content: bytes) -> str:
+        """
+        Сохранить файл отчета
+
+        Одинаковое содержимое сохраняется один раз.
+
+        Args:
+            content: Содержимое файла
+
+        Returns:
+            Ключ файла (хеш содержимого)
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Получить файл отчета
+
+        Args:
+            key: Ключ файла
+
+        Returns:
+            Содержимое файла или None если файл не найден
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Удалить файл отчета
+
+        Вызывающий проверяет, что на ключ не ссылается ни один отчет:
+        одинаковое содержимое разных отчетов хранится в одном файле.
+
+        Args:
+            key: Ключ файла (отсутствующий файл не считается ошибкой)
+        """
+        pass
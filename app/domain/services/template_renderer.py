@@ -3,7 +3,7 @@ Template Renderer Service Interface
 Интерфейс сервиса для рендеринга HTML шаблонов
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 
 
 class ITemplateRenderer(ABC):
@@ -26,3 +26,39 @@ class ITemplateRenderer(ABC):
             Exception: Другие ошибки рендеринга
         """
         pass
+
+    @abstractmethod
+    def get_template_version(self, template_name: str) -> str:
+        """
+        Получить версию шаблона (меняется при изменении его исходного кода)
+
+        Args:
+            template_name: Имя файла шаблона
+
+        Returns:
+            Строка версии
+
+        Raises:
+            FileNotFoundError: Если шаблон не найден
+        """
+        pass
+
+    async def render_stream(self, template_name: str, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Отрендерить шаблон частями
+
+        Реализация по умолчанию отдает результат render одним фрагментом.
+        Рендереры с поддержкой потоковой генерации переопределяют этот метод.
+
+        Args:
+            template_name: Имя файла шаблона
+            context: Словарь с данными для шаблона
+
+        Yields:
+            Фрагменты HTML строки
+
+        Raises:
+            FileNotFoundError: Если шаблон не найден
+            Exception: Другие ошибки рендеринга
+        """
+        yield self.render(template_name, context)
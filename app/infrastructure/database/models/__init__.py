@@ -15,6 +15,7 @@ from app.infrastructure.database.models.application_criteria import ApplicationC
 from app.infrastructure.database.models.document import DocumentModel
 from app.infrastructure.database.models.application_document import ApplicationDocumentModel
 from app.infrastructure.database.models.application_report import ApplicationReportModel
+from app.infrastructure.database.models.report import ReportModel
 
 __all__ = [
     "Base",
@@ -31,4 +32,5 @@ __all__ = [
     "DocumentModel",
     "ApplicationDocumentModel",
     "ApplicationReportModel",
+    "ReportModel",
 ]
@@ -3,7 +3,7 @@ License SQLAlchemy Model
 ORM модель для лицензий
 """
 from datetime import datetime
-from sqlalchemy import Integer, String, Boolean, Date, Text, ForeignKey
+from sqlalchemy import Integer, String, Boolean, Date, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.infrastructure.database.models.base import Base, TimestampMixin
 
@@ -12,6 +12,10 @@ class LicenseModel(Base, TimestampMixin):
     """ORM модель для таблицы licences"""
 
     __tablename__ = "licences"
+    __table_args__ = (
+        # Поиск истекающих лицензий: диапазон по end_at с курсором (end_at, id)
+        Index("ix_licences_end_at_id", "end_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     season_id: Mapped[int | None] = mapped_column(
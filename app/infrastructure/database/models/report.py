@@ -2,7 +2,7 @@
 SQLAlchemy database models
 Модели базы данных
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 from app.domain.entities.report import ReportStatus, ReportType
@@ -12,6 +12,12 @@ import enum
 class ReportModel(Base):
     """Модель отчета в БД"""
     __tablename__ = "reports"
+    __table_args__ = (
+        # Курсорная пагинация списка: ORDER BY created_at DESC, id DESC
+        Index("ix_reports_created_at_id", "created_at", "id"),
+        # Проверка, ссылается ли отчет на файл хранилища, перед его удалением
+        Index("ix_reports_file_path", "file_path"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String(255), nullable=False)
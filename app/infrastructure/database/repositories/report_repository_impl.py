@@ -2,10 +2,12 @@
 Report Repository Implementation
 Реализация репозитория отчетов
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy import select, func, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import keyset_condition
 from app.domain.entities.report import Report, ReportStatus, ReportType
 from app.domain.repositories.report_repository import IReportRepository
 from app.infrastructure.database.models import ReportModel
@@ -69,6 +71,33 @@ class ReportRepositoryImpl(IReportRepository):
 
         return [self._map_to_entity(db_report) for db_report in db_reports]
 
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        status: Optional[ReportStatus] = None,
+        report_type: Optional[ReportType] = None
+    ) -> List[Report]:
+        """Получить страницу отчетов по курсору (created_at, id)"""
+        sort_key = (ReportModel.created_at, ReportModel.id)
+        stmt = select(ReportModel)
+
+        # Применение фильтров
+        if status:
+            stmt = stmt.where(ReportModel.status == status)
+        if report_type:
+            stmt = stmt.where(ReportModel.report_type == report_type)
+        if after:
+            stmt = stmt.where(keyset_condition(sort_key, after, descending=True))
+
+        # Без OFFSET: страница читается с позиции курсора по индексу (created_at, id)
+        stmt = stmt.order_by(*(column.desc() for column in sort_key)).limit(limit)
+
+        result = await self.session.execute(stmt)
+        db_reports = result.scalars().all()
+
+        return [self._map_to_entity(db_report) for db_report in db_reports]
+
     async def update(self, report: Report) -> Report:
         """Обновить отчет"""
         stmt = select(ReportModel).where(ReportModel.id == report.id)
@@ -100,6 +129,12 @@ class ReportRepositoryImpl(IReportRepository):
 
         return result.rowcount > 0
 
+    async def is_file_referenced(self, file_path: str) -> bool:
+        """Проверить, ссылается ли какой-либо отчет на файл"""
+        stmt = select(ReportModel.id).where(ReportModel.file_path == file_path).limit(1)
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
     async def count(
         self,
         status: Optional[ReportStatus] = None,
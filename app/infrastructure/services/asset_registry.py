@@ -0,0 +1,211 @@
+"""
+Asset Registry
+Реестр статических ресурсов (логотип, подпись, фоны сертификатов)
+"""
+import base64
+import mimetypes
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.infrastructure.services.image_variant_builder import ImageVariantBuilder
+
+
+# Расширения файлов, которые считаются изображениями для шаблонов
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp")
+
+# Режимы подстановки изображений в шаблоны
+ASSET_MODE_INLINE = "inline"  # data:image/...;base64,...
+ASSET_MODE_URL = "url"        # HTTP ссылка на маршрут приложения
+ASSET_MODE_FILE = "file"      # file:// путь (для pdfkit/wkhtmltopdf)
+
+
+@dataclass
+class Asset:
+    """Загруженный ресурс"""
+    name: str
+    path: str
+    mtime: float
+    mime_type: str
+    data: bytes
+    base64: str
+    data_uri: str
+
+
+class AssetRegistry:
+    """
+    Реестр ресурсов в памяти процесса
+
+    Файлы читаются и кодируются в base64 один раз; повторное чтение с диска
+    происходит только при изменении mtime файла.
+    """
+
+    def __init__(
+        self,
+        assets_dir: str,
+        mode: str = ASSET_MODE_INLINE,
+        base_url: str = "",
+        variant_builder: Optional[ImageVariantBuilder] = None
+    ):
+        """
+        Инициализация реестра
+
+        Args:
+            assets_dir: Директория с ресурсами
+            mode: Режим подстановки изображений (inline, url, file)
+            base_url: Базовый URL маршрута ресурсов (для режима url)
+            variant_builder: Построитель оптимизированных вариантов изображений
+        """
+        if mode not in (ASSET_MODE_INLINE, ASSET_MODE_URL, ASSET_MODE_FILE):
+            raise ValueError(f"Unknown asset mode: {mode}")
+
+        self.assets_dir = assets_dir
+        self.mode = mode
+        self.base_url = base_url.rstrip("/")
+        self.variant_builder = variant_builder
+        self._assets: Dict[str, Asset] = {}
+        # Пути ресурсов вне assets_dir (построенные варианты): имя -> путь
+        self._paths: Dict[str, str] = {}
+        # (имя исходника, tier) -> (mtime исходника, имя варианта)
+        self._variants: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def preload(self) -> List[str]:
+        """
+        Загрузить все изображения из директории ресурсов
+
+        Returns:
+            Список имен загруженных файлов
+        """
+        if not os.path.isdir(self.assets_dir):
+            return []
+
+        loaded = []
+        for name in sorted(os.listdir(self.assets_dir)):
+            if name.lower().endswith(IMAGE_EXTENSIONS) and self.get(name):
+                loaded.append(name)
+
+        return loaded
+
+    def get(self, name: str) -> Optional[Asset]:
+        """
+        Получить ресурс по имени файла
+
+        Args:
+            name: Имя файла в директории ресурсов
+
+        Returns:
+            Asset или None если файл не найден
+        """
+        path = self._paths.get(name) or os.path.join(self.assets_dir, name)
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            with self._lock:
+                self._assets.pop(name, None)
+            return None
+
+        asset = self._assets.get(name)
+        if asset and asset.mtime == mtime:
+            return asset
+
+        with self._lock:
+            # Файл мог быть перезагружен другим потоком, пока мы ждали блокировку
+            asset = self._assets.get(name)
+            if asset and asset.mtime == mtime:
+                return asset
+
+            with open(path, "rb") as f:
+                data = f.read()
+
+            mime_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            encoded = base64.b64encode(data).decode("utf-8")
+            asset = Asset(
+                name=name,
+                path=path,
+                mtime=mtime,
+                mime_type=mime_type,
+                data=data,
+                base64=encoded,
+                data_uri=f"data:{mime_type};base64,{encoded}"
+            )
+            self._assets[name] = asset
+
+        return asset
+
+    def get_base64(self, name: str) -> str:
+        """
+        Получить ресурс в формате base64
+
+        Args:
+            name: Имя файла в директории ресурсов
+
+        Returns:
+            Строка base64 или пустая строка если файл не найден
+        """
+        asset = self.get(name)
+        return asset.base64 if asset else ""
+
+    def get_src(self, name: str, tier: Optional[str] = None) -> str:
+        """
+        Получить значение для src/url() в шаблоне в соответствии с режимом
+
+        Args:
+            name: Имя файла в директории ресурсов
+            tier: Уровень качества оптимизированного варианта (None - оригинал)
+
+        Returns:
+            data URI, HTTP URL или file:// путь; пустая строка если файл не найден
+        """
+        if tier:
+            name = self.get_variant_name(name, tier)
+
+        asset = self.get(name)
+        if not asset:
+            return ""
+
+        if self.mode == ASSET_MODE_URL:
+            # mtime в query-параметре позволяет рендереру кешировать файл до его изменения
+            return f"{self.base_url}/{name}?v={int(asset.mtime)}"
+
+        if self.mode == ASSET_MODE_FILE:
+            return Path(asset.path).as_uri()
+
+        return asset.data_uri
+
+    def get_variant_name(self, name: str, tier: str) -> str:
+        """
+        Получить имя оптимизированного варианта изображения
+
+        Вариант строится один раз на каждую версию исходного файла и
+        регистрируется в реестре под собственным именем.
+
+        Args:
+            name: Имя исходного файла
+            tier: Уровень качества
+
+        Returns:
+            Имя варианта или исходное имя, если вариант недоступен
+        """
+        source = self.get(name)
+        if not source or not self.variant_builder:
+            return name
+
+        cached = self._variants.get((name, tier))
+        if cached and cached[0] == source.mtime:
+            return cached[1]
+
+        variant_path = self.variant_builder.build(source.path, source.data, tier)
+        variant_name = name
+        if variant_path != source.path:
+            variant_name = os.path.basename(variant_path)
+
+        with self._lock:
+            if variant_name != name:
+                self._paths[variant_name] = variant_path
+            self._variants[(name, tier)] = (source.mtime, variant_name)
+
+        return variant_name
@@ -0,0 +1,181 @@
+"""
+Disk PDF Cache
+Кеш сгенерированных PDF на локальном диске с вытеснением по LRU
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from app.domain.services.pdf_cache import IPdfCache
+
+
+# Расширение файлов кеша
+CACHE_FILE_SUFFIX = ".pdf"
+
+
+class DiskPdfCache(IPdfCache):
+    """
+    Кеш PDF в директории на диске
+
+    Файл называется по ключу документа, время изменения файла - время его
+    последнего использования. Директория может быть общей для нескольких
+    воркеров: промах индекса в памяти проверяется на диске, а при записи
+    индекс перестраивается по директории, и max_bytes ограничивает размер
+    всей директории - удаляются давно не использованные документы всех
+    воркеров.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Инициализация кеша
+
+        Args:
+            cache_dir: Директория для хранения PDF
+            max_bytes: Максимальный суммарный размер кеша в байтах
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # ключ -> размер файла; порядок - от давно использованных к недавним
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Получить PDF из кеша"""
+        # Документ мог записать другой воркер - файл читается и при промахе индекса
+        content = await asyncio.to_thread(self._read, key)
+
+        with self._lock:
+            if content is None:
+                self._misses += 1
+                # Файл удален другим воркером или вручную
+                self._forget(key)
+            else:
+                self._hits += 1
+                if key not in self._entries:
+                    self._entries[key] = len(content)
+                    self._size += len(content)
+                self._entries.move_to_end(key)
+
+        return content
+
+    async def put(self, key: str, content: bytes) -> None:
+        """Сохранить PDF в кеш и вытеснить старые документы"""
+        if len(content) > self.max_bytes:
+            return
+
+        await asyncio.to_thread(self._store, key, content)
+
+    def stats(self) -> Dict[str, Any]:
+        """Получить статистику кеша"""
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / requests, 4) if requests else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _load(self) -> None:
+        """Восстановить индекс кеша по файлам в директории"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._sync_with_disk()
+
+    def _store(self, key: str, content: bytes) -> None:
+        """Записать документ и вытеснить старые документы по размеру всей директории"""
+        self._write(key, content)
+        self._sync_with_disk()
+
+    def _sync_with_disk(self) -> None:
+        """
+        Перестроить индекс по файлам директории и вытеснить лишнее
+
+        Учитываются и документы других воркеров, поэтому max_bytes
+        ограничивает всю директорию, а не долю одного процесса.
+        """
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_FILE_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, name[:-len(CACHE_FILE_SUFFIX)], stat.st_size))
+
+        entries: "OrderedDict[str, int]" = OrderedDict()
+        for _, key, size in sorted(files):
+            entries[key] = size
+
+        with self._lock:
+            self._entries = entries
+            self._size = sum(entries.values())
+            evicted = self._evict()
+
+        for evicted_key in evicted:
+            self._remove(evicted_key)
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу документа"""
+        return os.path.join(self.cache_dir, f"{key}{CACHE_FILE_SUFFIX}")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        """Прочитать документ и отметить его использование"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            # mtime - время последнего использования, по нему строится порядок LRU
+            self._touch(path)
+            return content
+        except OSError:
+            return None
+
+    def _write(self, key: str, content: bytes) -> None:
+        """Записать документ атомарно (несколько воркеров)"""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        self._touch(path)
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Отметить использование документа (точное время, а не грубые часы файловой системы)"""
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _remove(self, key: str) -> None:
+        """Удалить файл документа"""
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def _forget(self, key: str) -> None:
+        """Удалить документ из индекса (вызывается под блокировкой)"""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    def _evict(self) -> List[str]:
+        """Вытеснить давно не использованные документы (вызывается под блокировкой)"""
+        evicted = []
+        while self._size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
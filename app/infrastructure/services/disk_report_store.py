@@ -0,0 +1,84 @@
+"""
+Disk Report Store
+Хранилище файлов отчетов на диске с адресацией по содержимому
+"""
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from typing import Optional
+
+from app.domain.services.report_store import IReportStore
+
+
+# Ключ файла - sha256 содержимого
+REPORT_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class DiskReportStore(IReportStore):
+    """
+    Хранилище отчетов в директории на диске
+
+    Файл называется по sha256 содержимого и лежит в поддиректории по первым
+    двум символам хеша. Файлы не вытесняются по размеру: их удаляют use case
+    отчетов, когда на файл больше не ссылается ни один отчет в БД.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Инициализация хранилища
+
+        Args:
+            root_dir: Директория для хранения файлов
+        """
+        self.root_dir = root_dir
+
+    async def put(self, content: bytes) -> str:
+        """Сохранить файл отчета (повторное содержимое не перезаписывается)"""
+        key = hashlib.sha256(content).hexdigest()
+        await asyncio.to_thread(self._write, key, content)
+        return key
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Получить файл отчета"""
+        if not REPORT_KEY_PATTERN.match(key):
+            return None
+        return await asyncio.to_thread(self._read, key)
+
+    async def delete(self, key: str) -> None:
+        """Удалить файл отчета"""
+        if not REPORT_KEY_PATTERN.match(key):
+            return
+        await asyncio.to_thread(self._remove, key)
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу отчета"""
+        return os.path.join(self.root_dir, key[:2], f"{key}.pdf")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        """Прочитать файл отчета"""
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _remove(self, key: str) -> None:
+        """Удалить файл отчета, если он есть"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, key: str, content: bytes) -> None:
+        """Записать файл атомарно, если его еще нет"""
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
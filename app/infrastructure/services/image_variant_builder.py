@@ -0,0 +1,112 @@
+"""
+Image Variant Builder
+Построение сжатых вариантов изображений под печать на A4
+"""
+import hashlib
+import io
+import os
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow не установлен - варианты не строятся, используются оригиналы
+    Image = None
+
+
+# Размер листа A4 в дюймах
+A4_SIZE_INCHES = (210 / 25.4, 297 / 25.4)
+
+# Уровни качества: tier -> (DPI, качество JPEG); None - оригинальный файл
+QUALITY_TIERS: Dict[str, Optional[Tuple[int, int]]] = {
+    "original": None,
+    "print": (300, 90),
+    "standard": (200, 85),
+    "draft": (150, 75),
+}
+
+
+class ImageVariantBuilder:
+    """
+    Построитель оптимизированных вариантов изображений
+
+    Вариант уменьшается до размера A4 при заданном DPI и пересжимается.
+    Результат кешируется на диске; имя файла содержит хеш исходника,
+    поэтому изменение исходного изображения автоматически дает новый вариант.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Инициализация построителя
+
+        Args:
+            cache_dir: Директория для хранения вариантов
+        """
+        self.cache_dir = cache_dir
+
+    def build(self, source_path: str, data: bytes, tier: str) -> str:
+        """
+        Получить путь к варианту изображения, построив его при необходимости
+
+        Args:
+            source_path: Путь к исходному изображению
+            data: Содержимое исходного изображения
+            tier: Уровень качества из QUALITY_TIERS
+
+        Returns:
+            Путь к варианту или к исходному файлу, если вариант не нужен или недоступен
+
+        Raises:
+            ValueError: Если уровень качества неизвестен
+        """
+        if tier not in QUALITY_TIERS:
+            raise ValueError(f"Unknown image quality tier: {tier}")
+
+        settings = QUALITY_TIERS[tier]
+        if settings is None or Image is None:
+            return source_path
+
+        dpi, quality = settings
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+
+        with Image.open(io.BytesIO(data)) as image:
+            has_alpha = self._has_transparency(image)
+            extension = "png" if has_alpha else "jpg"
+            variant_path = os.path.join(self.cache_dir, f"{stem}.{digest}.{tier}.{extension}")
+
+            if os.path.exists(variant_path):
+                return variant_path
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Уменьшаем до размера A4 при заданном DPI (с сохранением пропорций)
+            max_size = (round(A4_SIZE_INCHES[0] * dpi), round(A4_SIZE_INCHES[1] * dpi))
+            variant = image.convert("RGBA" if has_alpha else "RGB")
+            variant.thumbnail(max_size, Image.LANCZOS)
+
+            buffer = io.BytesIO()
+            if has_alpha:
+                variant.save(buffer, format="PNG", optimize=True, dpi=(dpi, dpi))
+            else:
+                variant.save(buffer, format="JPEG", quality=quality, optimize=True, dpi=(dpi, dpi))
+
+        # Если пересжатие не уменьшило файл, используем оригинал
+        if buffer.tell() >= len(data):
+            return source_path
+
+        # Пишем во временный файл и атомарно переименовываем (несколько воркеров)
+        tmp_path = f"{variant_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(tmp_path, variant_path)
+
+        return variant_path
+
+    @staticmethod
+    def _has_transparency(image) -> bool:
+        """Проверить, есть ли в изображении реально используемая прозрачность"""
+        if image.mode in ("RGBA", "LA"):
+            return image.getchannel("A").getextrema()[0] < 255
+        if image.mode == "P":
+            return "transparency" in image.info
+        return False
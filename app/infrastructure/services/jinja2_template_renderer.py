@@ -2,26 +2,120 @@
 Jinja2 Template Renderer Implementation
 Реализация рендеринга шаблонов через Jinja2
 """
+import asyncio
+import hashlib
 import os
-from typing import Any, Dict
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
 from app.domain.services.template_renderer import ITemplateRenderer
 
 
+# Расширения файлов, которые считаются шаблонами
+TEMPLATE_EXTENSIONS = (".html",)
+
+# Размер фрагмента HTML (в символах), который отдает render_stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class Jinja2TemplateRenderer(ITemplateRenderer):
-    """Рендеринг шаблонов через Jinja2"""
+    """
+    Рендеринг шаблонов через Jinja2
+
+    Рассчитан на один экземпляр на процесс: скомпилированные шаблоны хранятся
+    в кеше окружения, а байткод - на диске, чтобы новые воркеры не
+    компилировали шаблоны заново.
+    """
 
-    def __init__(self, templates_dir: str):
+    def __init__(
+        self,
+        templates_dir: str,
+        bytecode_cache_dir: Optional[str] = None,
+        auto_reload: bool = False
+    ):
         """
         Инициализация рендерера
 
         Args:
             templates_dir: Директория с шаблонами
+            bytecode_cache_dir: Директория для кеша байткода (None - без кеша)
+            auto_reload: Перечитывать измененные шаблоны (только для разработки)
         """
         if not os.path.exists(templates_dir):
             raise FileNotFoundError(f"Templates directory not found: {templates_dir}")
 
-        self.env = Environment(loader=FileSystemLoader(templates_dir))
+        loader = FileSystemLoader(templates_dir)
+
+        self.env = Environment(
+            loader=loader,
+            bytecode_cache=self._create_bytecode_cache(bytecode_cache_dir),
+            # Без auto_reload шаблон не проверяется на диске при каждом рендеринге
+            auto_reload=auto_reload
+        )
+
+        # Отдельное окружение для потокового рендеринга: шаблоны компилируются
+        # в async код, поэтому байткод хранится отдельно от синхронного
+        self.async_env = Environment(
+            loader=loader,
+            bytecode_cache=self._create_bytecode_cache(
+                os.path.join(bytecode_cache_dir, "async") if bytecode_cache_dir else None
+            ),
+            auto_reload=auto_reload,
+            enable_async=True
+        )
+
+        self.templates_dir = templates_dir
+        self.auto_reload = auto_reload
+        # Версии шаблонов: имя -> (mtime исходника, хеш исходника)
+        self._versions: Dict[str, Tuple[float, str]] = {}
+
+    def get_template_version(self, template_name: str) -> str:
+        """
+        Получить версию шаблона - хеш его исходного кода
+
+        Без auto_reload версия фиксируется при первом обращении (как и
+        скомпилированный шаблон); иначе хеш пересчитывается при изменении mtime.
+
+        Args:
+            template_name: Имя файла шаблона
+
+        Returns:
+            Строка версии
+
+        Raises:
+            FileNotFoundError: Если шаблон не найден
+        """
+        cached = self._versions.get(template_name)
+        if cached and not self.auto_reload:
+            return cached[1]
+
+        path = os.path.join(self.templates_dir, template_name)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError as e:
+            raise FileNotFoundError(f"Template not found: {template_name}") from e
+
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            version = hashlib.sha256(f.read()).hexdigest()[:16]
+
+        self._versions[template_name] = (mtime, version)
+        return version
+
+    def precompile(self) -> List[str]:
+        """
+        Скомпилировать все шаблоны заранее
+
+        Returns:
+            Список имен скомпилированных шаблонов
+        """
+        names = self.env.list_templates(filter_func=lambda name: name.endswith(TEMPLATE_EXTENSIONS))
+        for name in names:
+            self.env.get_template(name)
+            self.async_env.get_template(name)
+            self.get_template_version(name)
+        return names
 
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -42,3 +136,49 @@ class Jinja2TemplateRenderer(ITemplateRenderer):
             return template.render(**context)
         except TemplateNotFound as e:
             raise FileNotFoundError(f"Template not found: {template_name}") from e
+
+    async def render_stream(self, template_name: str, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Отрендерить шаблон частями через Template.generate_async
+
+        Мелкие фрагменты Jinja2 объединяются в блоки по STREAM_CHUNK_SIZE
+        символов; после каждого блока управление возвращается event loop.
+
+        Args:
+            template_name: Имя файла шаблона
+            context: Данные для шаблона
+
+        Yields:
+            Фрагменты HTML строки
+
+        Raises:
+            FileNotFoundError: Если шаблон не найден
+        """
+        try:
+            template = self.async_env.get_template(template_name)
+        except TemplateNotFound as e:
+            raise FileNotFoundError(f"Template not found: {template_name}") from e
+
+        buffer: List[str] = []
+        size = 0
+        async for chunk in template.generate_async(**context):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= STREAM_CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                # Рендеринг не содержит реальных await - даем поработать другим задачам
+                await asyncio.sleep(0)
+
+        if buffer:
+            yield "".join(buffer)
+
+    @staticmethod
+    def _create_bytecode_cache(bytecode_cache_dir: Optional[str]) -> Optional[FileSystemBytecodeCache]:
+        """Создать кеш байткода в директории (None - кеш отключен)"""
+        if not bytecode_cache_dir:
+            return None
+
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        return FileSystemBytecodeCache(bytecode_cache_dir)
@@ -0,0 +1,33 @@
+"""
+PDF Merger
+Объединение нескольких PDF документов в памяти
+"""
+import io
+from typing import List
+
+from PyPDF2 import PdfMerger
+
+
+def merge_pdfs(contents: List[bytes]) -> bytes:
+    """
+    Объединить PDF документы в один (без временных файлов)
+
+    Операция синхронная и нагружает CPU - из async кода ее следует
+    вызывать через asyncio.to_thread.
+
+    Args:
+        contents: Содержимое PDF документов в порядке следования
+
+    Returns:
+        Содержимое объединенного PDF
+    """
+    merger = PdfMerger()
+    try:
+        for content in contents:
+            merger.append(io.BytesIO(content))
+
+        output = io.BytesIO()
+        merger.write(output)
+        return output.getvalue()
+    finally:
+        merger.close()
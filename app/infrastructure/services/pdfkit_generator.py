@@ -2,17 +2,33 @@
 PDFKit Generator Implementation
 Реализация генерации PDF через pdfkit/wkhtmltopdf
 """
-import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sys import platform
 import pdfkit
-from app.domain.services.pdf_generator import IPDFGenerator
+from app.domain.services.pdf_generator import IPDFGenerator, PdfGeneratorBusyError
 
 
 class PdfKitGenerator(IPDFGenerator):
-    """Генерация PDF через pdfkit"""
+    """
+    Генерация PDF через pdfkit
 
-    def __init__(self):
-        """Инициализация генератора с конфигурацией для платформы"""
+    Асинхронный рендеринг выполняется в ограниченном пуле потоков: каждый
+    вызов запускает отдельный процесс wkhtmltopdf, поэтому потоки только
+    ожидают его завершения и не конкурируют за GIL. Если все воркеры заняты
+    и очередь заполнена, новые запросы сразу отклоняются (back-pressure).
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8, retry_after: int = 5):
+        """
+        Инициализация генератора с конфигурацией для платформы
+
+        Args:
+            max_workers: Количество одновременно работающих процессов wkhtmltopdf
+            max_queue: Максимальное количество рендеров, ожидающих свободного воркера
+            retry_after: Значение Retry-After (секунды) при перегрузке
+        """
         # Конфигурация для Windows
         if platform == "win32":
             path_wkhtmltopdf = r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe"
@@ -28,6 +44,28 @@ class PdfKitGenerator(IPDFGenerator):
             "quiet": "",  # Убирает лишний вывод
         }
 
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor: ThreadPoolExecutor | None = None
+        # Рендеры в работе и в очереди; уменьшается из потока воркера
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    async def start(self) -> None:
+        """Создать пул воркеров"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="pdfkit"
+            )
+
+    async def close(self) -> None:
+        """Остановить пул воркеров, отменив рендеры из очереди"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def generate_from_html(self, html_content: str, output_path: str) -> None:
         """
         Сгенерировать PDF из HTML
@@ -48,3 +86,56 @@ class PdfKitGenerator(IPDFGenerator):
             )
         except Exception as e:
             raise Exception(f"Failed to generate PDF: {str(e)}") from e
+
+    async def generate_pdf(self, html_content: str) -> bytes:
+        """
+        Сгенерировать PDF в пуле воркеров, не блокируя event loop
+
+        Args:
+            html_content: HTML контент
+
+        Returns:
+            Содержимое PDF файла
+
+        Raises:
+            PdfGeneratorBusyError: Если все воркеры заняты и очередь заполнена
+            Exception: Ошибки при генерации
+        """
+        if self._executor is None:
+            await self.start()
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                raise PdfGeneratorBusyError(
+                    "PDF renderer is busy, try again later",
+                    retry_after=self.retry_after
+                )
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(self._render_to_bytes, html_content)
+        except BaseException:
+            self._release()
+            raise
+
+        # Слот освобождается, когда wkhtmltopdf действительно завершился,
+        # даже если клиент уже отменил запрос
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _render_to_bytes(self, html_content: str) -> bytes:
+        """Сгенерировать PDF в память (без временного файла)"""
+        try:
+            return pdfkit.from_string(
+                html_content,
+                False,
+                configuration=self.config,
+                options=self.options
+            )
+        except Exception as e:
+            raise Exception(f"Failed to generate PDF: {str(e)}") from e
+
+    def _release(self) -> None:
+        """Освободить слот очереди"""
+        with self._lock:
+            self._pending -= 1
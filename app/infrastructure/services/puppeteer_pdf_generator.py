@@ -1,16 +1,86 @@
 from __future__ import annotations
 
+import json
+from typing import AsyncIterable, AsyncIterator
+
 import httpx
 from app.domain.services.pdf_generator import IPDFGenerator
 
 
 class PuppeteerPdfGenerator(IPDFGenerator):
-    def __init__(self, service_url: str, timeout: int = 90):
+    def __init__(
+        self,
+        service_url: str,
+        timeout: int = 90,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        http2: bool = False,
+        stream_upload: bool = False,
+    ):
         self.service_url = service_url
         self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        # HTTP/2 используется только если рендерер его поддерживает (для https - через ALPN)
+        self.http2 = http2
+        # Передавать HTML потоком (chunked) - рендерер должен принимать такие запросы
+        self.stream_upload = stream_upload
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        # Один долгоживущий клиент на процесс: пул соединений с keep-alive
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def streams_html(self) -> bool:
+        return self.stream_upload
+
+    async def generate_pdf(self, html_content: str) -> bytes:
+        if self._client is None:
+            await self.start()
+
+        r = await self._client.post(self.service_url, json={"html": html_content})
+        r.raise_for_status()
+        return r.content
+
+    async def generate_pdf_stream(self, html_chunks: AsyncIterable[str]) -> bytes:
+        if not self.stream_upload:
+            return await super().generate_pdf_stream(html_chunks)
+
+        if self._client is None:
+            await self.start()
+
+        # Тело {"html": ...} формируется по мере рендеринга, без полной строки в памяти
+        r = await self._client.post(
+            self.service_url,
+            content=self._json_body(html_chunks),
+            headers={"Content-Type": "application/json"},
+        )
+        r.raise_for_status()
+        return r.content
+
+    @staticmethod
+    async def _json_body(html_chunks: AsyncIterable[str]) -> AsyncIterator[bytes]:
+        yield b'{"html": "'
+        async for chunk in html_chunks:
+            # Экранирование JSON посимвольное, поэтому фрагменты кодируются независимо
+            yield json.dumps(chunk)[1:-1].encode("utf-8")
+        yield b'"}'
 
     def generate_from_html(self, html: str, output_path: str) -> None:
-        # IPDFGenerator у тебя синхронный — поэтому используем sync httpx.Client
+        # Синхронный вариант для скриптов вне event loop; в роутерах используется generate_pdf
         with httpx.Client(timeout=self.timeout) as client:
             r = client.post(self.service_url, json={"html": html})
             r.raise_for_status()
@@ -2,13 +2,26 @@
 Main application entry point
 Точка входа приложения FastAPI
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.database import init_db, close_db
+from app.core.instrumentation import render_metrics
+from app.application.services.job_queue import JobQueueFullError
+from app.domain.services.pdf_generator import PdfGeneratorBusyError
 from app.presentation.api.v1.api import api_router
+from app.presentation.api.server_timing import ServerTimingMiddleware
+from app.core.services import (
+    job_queue,
+    pdf_cache,
+    preload_assets,
+    preload_templates,
+    init_services,
+    close_services
+)
 
 
 @asynccontextmanager
@@ -20,9 +33,17 @@ async def lifespan(app: FastAPI):
     # НЕ создаем таблицы - подключаемся к существующей БД
     # await init_db()  # <- Закомментировано, так как БД уже существует
     print("Ready to use existing database")
+    # Загружаем изображения шаблонов в память один раз
+    loaded_assets = preload_assets()
+    print(f"Loaded {len(loaded_assets)} template assets (certificate background quality: {settings.CERTIFICATE_BG_QUALITY})")
+    # Компилируем шаблоны заранее, чтобы первый запрос не платил за компиляцию
+    compiled_templates = preload_templates()
+    print(f"Compiled {len(compiled_templates)} templates")
+    await init_services()
     yield
     # Shutdown
     print("Shutting down...")
+    await close_services()
     await close_db()
     print("Database connection closed")
 
@@ -46,10 +67,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing: SQL запросы и use case текущего запроса
+app.add_middleware(ServerTimingMiddleware)
+
 # Подключение роутеров
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.exception_handler(PdfGeneratorBusyError)
+@app.exception_handler(JobQueueFullError)
+async def service_busy_handler(request: Request, exc: PdfGeneratorBusyError | JobQueueFullError):
+    """PDF рендерер перегружен или очередь задач заполнена - 503, клиенту следует повторить запрос позже"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
 @app.get("/", tags=["health"])
 async def root():
     """Health check endpoint"""
@@ -70,6 +105,30 @@ async def health_check():
     }
 
 
+@app.get("/health/pdf-cache", tags=["health"])
+async def pdf_cache_stats():
+    """Статистика кеша сгенерированных PDF"""
+    if pdf_cache is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **pdf_cache.stats()}
+
+
+@app.get("/health/jobs", tags=["health"])
+async def job_queue_stats():
+    """Количество фоновых задач генерации по статусам"""
+    return job_queue.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["health"])
+async def metrics():
+    """Метрики SQL запросов и use case в формате Prometheus"""
+    return PlainTextResponse(
+        render_metrics(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -3,35 +3,33 @@ FastAPI Dependencies
 Зависимости для инжекции в эндпоинты
 """
 from dotenv import load_dotenv
-import os
-import base64
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.services import job_queue, pdf_cache, pdf_generator, report_store, template_renderer
 from app.application.use_cases.generate_report_use_case_v2 import GenerateReportUseCaseV2
 from app.application.use_cases.generate_initial_report_use_case import GenerateInitialReportUseCase
 from app.application.use_cases.generate_solution_use_case import GenerateSolutionUseCase
 from app.application.use_cases.generate_department_report_use_case import GenerateDepartmentReportUseCase
 from app.application.use_cases.generate_certificate_use_case import GenerateCertificateUseCase
+from app.application.use_cases.list_expiring_licenses import ListExpiringLicensesUseCase
+from app.application.services.job_queue import DocumentJobQueue
+from app.domain.services.report_store import IReportStore
 from app.domain.services.template_renderer import ITemplateRenderer
 from app.domain.services.pdf_generator import IPDFGenerator
-from app.infrastructure.services.jinja2_template_renderer import Jinja2TemplateRenderer
-from app.infrastructure.services.pdfkit_generator import PdfKitGenerator
-from app.infrastructure.services.puppeteer_pdf_generator import PuppeteerPdfGenerator
+from app.domain.services.pdf_cache import IPdfCache
 
 # Database dependency
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 load_dotenv()
 
+
 # Template renderer dependency
 def get_template_renderer() -> ITemplateRenderer:
     """Получить сервис рендеринга шаблонов"""
-    # Путь к директории templates
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-    templates_dir = os.path.join(base_dir, "templates")
-    return Jinja2TemplateRenderer(templates_dir)
+    return template_renderer
 
 
 TemplateRenderer = Annotated[ITemplateRenderer, Depends(get_template_renderer)]
@@ -40,14 +38,39 @@ TemplateRenderer = Annotated[ITemplateRenderer, Depends(get_template_renderer)]
 # PDF generator dependency
 def get_pdf_generator() -> IPDFGenerator:
     """Получить сервис генерации PDF"""
-    # return PdfKitGenerator()
-    print(os.getenv("PUPPETEER_PDF_URL"))
-    return PuppeteerPdfGenerator(service_url=os.getenv("PUPPETEER_PDF_URL"))
+    return pdf_generator
 
 
 PDFGenerator = Annotated[IPDFGenerator, Depends(get_pdf_generator)]
 
 
+# PDF cache dependency
+def get_pdf_cache() -> Optional[IPdfCache]:
+    """Получить кеш PDF (None если кеш отключен)"""
+    return pdf_cache
+
+
+PDFCache = Annotated[Optional[IPdfCache], Depends(get_pdf_cache)]
+
+
+# Job queue dependency
+def get_job_queue() -> DocumentJobQueue:
+    """Получить очередь фоновой генерации документов"""
+    return job_queue
+
+
+JobQueue = Annotated[DocumentJobQueue, Depends(get_job_queue)]
+
+
+# Report store dependency
+def get_report_store() -> IReportStore:
+    """Получить хранилище файлов отчетов"""
+    return report_store
+
+
+ReportStore = Annotated[IReportStore, Depends(get_report_store)]
+
+
 # Use Case dependency
 def get_generate_report_use_case(
     db: DatabaseSession
@@ -92,20 +115,6 @@ def get_generate_department_report_use_case(
 GenerateDepartmentReportUseCaseDep = Annotated[GenerateDepartmentReportUseCase, Depends(get_generate_department_report_use_case)]
 
 
-# Logo loader helper
-def load_logo_base64() -> str:
-    """Загрузить логотип в формате base64"""
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-    logo_path = os.path.join(base_dir, "templates", "logo_white.png")
-
-    if not os.path.exists(logo_path):
-        # Возвращаем пустую строку если логотип не найден
-        return ""
-
-    with open(logo_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
-
-
 # Certificate Use Case dependency
 def get_generate_certificate_use_case(
     db: DatabaseSession
@@ -117,40 +126,12 @@ def get_generate_certificate_use_case(
 GenerateCertificateUseCaseDep = Annotated[GenerateCertificateUseCase, Depends(get_generate_certificate_use_case)]
 
 
-# Sign image loader helper
-def load_sign_img_base64() -> str:
-    """Загрузить изображение подписи в формате base64"""
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-    sign_path = os.path.join(base_dir, "templates", "sign_img.png")
-
-    if not os.path.exists(sign_path):
-        # Возвращаем пустую строку если изображение не найдено
-        return ""
-
-    with open(sign_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
-
-
-# Background certificate images loaders
-def load_bg_certificate_en() -> str:
-    """Загрузить фон для английского сертификата в формате base64"""
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-    bg_path = os.path.join(base_dir, "templates", "bg_certificate_en.png")
-
-    if not os.path.exists(bg_path):
-        return ""
-
-    with open(bg_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
-
-
-def load_bg_certificate_kk() -> str:
-    """Загрузить фон для казахского сертификата в формате base64"""
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-    bg_path = os.path.join(base_dir, "templates", "bg_certificate_kk.png")
+# Expiring Licenses Use Case dependency
+def get_list_expiring_licenses_use_case(
+    db: DatabaseSession
+) -> ListExpiringLicensesUseCase:
+    """Получить Use Case для списка истекающих лицензий"""
+    return ListExpiringLicensesUseCase(db)
 
-    if not os.path.exists(bg_path):
-        return ""
 
-    with open(bg_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
+ListExpiringLicensesUseCaseDep = Annotated[ListExpiringLicensesUseCase, Depends(get_list_expiring_licenses_use_case)]
@@ -0,0 +1,163 @@
+"""
+PDF Response
+Формирование HTTP ответа с PDF документом
+"""
+import io
+import os
+import tempfile
+import zipfile
+from typing import AsyncIterator, Dict, List, Tuple
+from urllib.parse import quote
+
+from fastapi import Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+
+
+# Режимы отдачи PDF клиенту
+PDF_RESPONSE_MODE_MEMORY = "memory"  # байты из памяти, без записи на диск
+PDF_RESPONSE_MODE_FILE = "file"      # временный файл, удаляется после отправки
+
+
+def pdf_response(content: bytes, filename: str) -> Response:
+    """
+    Сформировать ответ с PDF документом в соответствии с PDF_RESPONSE_MODE
+
+    Args:
+        content: Содержимое PDF
+        filename: Имя файла для скачивания
+
+    Returns:
+        Response с PDF (или FileResponse в файловом режиме)
+    """
+    if settings.PDF_RESPONSE_MODE == PDF_RESPONSE_MODE_FILE:
+        return _file_response(content, filename)
+
+    return Response(
+        content=content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": _content_disposition(filename)}
+    )
+
+
+def zip_response(files: Dict[str, bytes], filename: str) -> Response:
+    """
+    Сформировать ответ с ZIP архивом
+
+    PDF уже сжаты внутри, поэтому файлы кладутся в архив без повторного сжатия.
+
+    Args:
+        files: Имя файла в архиве -> содержимое
+        filename: Имя архива для скачивания
+
+    Returns:
+        Response с ZIP архивом
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+
+    return Response(
+        content=buffer.getvalue(),
+        media_type="application/zip",
+        headers={"Content-Disposition": _content_disposition(filename)}
+    )
+
+
+def zip_stream_response(files: AsyncIterator[Tuple[str, bytes]], filename: str) -> StreamingResponse:
+    """
+    Сформировать потоковый ответ с ZIP архивом
+
+    Каждый файл отправляется клиенту, как только он получен, - архив целиком
+    в памяти не собирается. Если итератор файлов завершится ошибкой, ответ
+    оборвется без оглавления архива, и клиент получит поврежденный ZIP.
+
+    Args:
+        files: Асинхронный итератор пар (имя файла в архиве, содержимое)
+        filename: Имя архива для скачивания
+
+    Returns:
+        StreamingResponse с ZIP архивом
+    """
+    return StreamingResponse(
+        _zip_stream(files),
+        media_type="application/zip",
+        headers={"Content-Disposition": _content_disposition(filename)}
+    )
+
+
+class _ZipStreamBuffer:
+    """Поток без перемотки для zipfile: записанные данные забираются через drain"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Забрать накопленные данные"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _zip_stream(files: AsyncIterator[Tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    """Записывать файлы в ZIP по мере получения и отдавать готовые части архива"""
+    buffer = _ZipStreamBuffer()
+    # Без seek/tell zipfile пишет размеры файлов после данных (data descriptor)
+    archive = zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED)
+    async for name, content in files:
+        archive.writestr(name, content)
+        yield buffer.drain()
+
+    archive.close()
+    yield buffer.drain()
+
+
+class TemporaryFileResponse(FileResponse):
+    """
+    FileResponse для временного файла
+
+    Файл удаляется после отправки ответа, в том числе если клиент
+    отключился или отправка завершилась ошибкой.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+def _file_response(content: bytes, filename: str) -> FileResponse:
+    """Отдать PDF через временный файл, который удаляется после отправки"""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+    try:
+        temp_file.write(content)
+    finally:
+        temp_file.close()
+
+    return TemporaryFileResponse(
+        path=temp_file.name,
+        media_type="application/pdf",
+        filename=filename
+    )
+
+
+def _content_disposition(filename: str) -> str:
+    """Заголовок Content-Disposition для скачивания файла (как у FileResponse)"""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
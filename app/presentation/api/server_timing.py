@@ -0,0 +1,34 @@
+"""
+Server-Timing Middleware
+Заголовок Server-Timing с количеством SQL запросов и временем use case
+"""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.instrumentation import request_scope
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware: собирает метрики запроса и добавляет заголовок Server-Timing
+
+    Заголовок формируется в момент отправки начала ответа, поэтому для
+    потоковых ответов (ZIP) учитывается только работа до первого байта.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope() as metrics:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", metrics.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
@@ -3,7 +3,8 @@ API V1 Router
 Объединение всех роутеров API v1
 """
 from fastapi import APIRouter
-from app.presentation.api.v1.routers import reports, initial_reports, solutions, department_reports, certificates
+from app.presentation.api.v1.routers import reports, initial_reports, solutions, department_reports, certificates, assets, jobs, licenses
+from app.presentation.api.v1.endpoints import reports as report_endpoints
 
 api_router = APIRouter()
 
@@ -13,3 +14,8 @@ api_router.include_router(initial_reports.router)
 api_router.include_router(solutions.router)
 api_router.include_router(department_reports.router)
 api_router.include_router(certificates.router)
+api_router.include_router(assets.router)
+api_router.include_router(jobs.router)
+api_router.include_router(licenses.router)
+# CRUD отчетов с фоновой генерацией файлов по типу отчета
+api_router.include_router(report_endpoints.router)
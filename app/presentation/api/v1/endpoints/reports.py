@@ -2,14 +2,22 @@
 Report endpoints
 API endpoints для работы с отчетами
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
+from app.core.database import AsyncSessionLocal, get_db
 from app.domain.entities.report import ReportStatus, ReportType
+from app.domain.services.report_service import ReportDomainService
+from app.domain.services.report_store import IReportStore
+from app.application.services.job_queue import DocumentJobQueue, JobQueueFullError
 from app.presentation.api.v1.schemas.report_schema import (
     ReportCreateRequest,
     ReportResponse,
     ReportListResponse,
+    ReportCursorListResponse,
     GenerateReportResponse,
     MessageResponse
 )
@@ -20,12 +28,15 @@ from app.application.use_cases.list_reports import ListReportsUseCase
 from app.application.use_cases.delete_report import DeleteReportUseCase
 from app.application.dto.report_dto import CreateReportDTO
 from app.core.dependencies import (
+    create_generate_report_use_case,
     get_create_report_use_case,
     get_generate_report_use_case,
     get_get_report_use_case,
     get_list_reports_use_case,
     get_delete_report_use_case
 )
+from app.presentation.api.dependencies import get_job_queue, get_report_store
+from app.presentation.api.pdf_response import pdf_response
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -91,6 +102,47 @@ async def list_reports(
         )
 
 
+@router.get(
+    "/cursor",
+    response_model=ReportCursorListResponse,
+    summary="Получить список отчетов по курсору",
+    description=(
+        "Список отчетов от новых к старым с курсорной пагинацией: стоимость страницы "
+        "не зависит от ее глубины. Для следующей страницы передайте next_cursor; "
+        "общее количество возвращается только при include_total=true и может "
+        "отставать на REPORT_COUNT_CACHE_TTL секунд"
+    )
+)
+async def list_reports_cursor(
+    cursor: Optional[str] = Query(None, description="Курсор next_cursor из предыдущего ответа"),
+    page_size: int = Query(10, ge=1, le=100, description="Размер страницы"),
+    # Не status: имя перекрыло бы модуль fastapi.status, используемый ниже
+    report_status: Optional[ReportStatus] = Query(None, alias="status", description="Фильтр по статусу"),
+    report_type: Optional[ReportType] = Query(None, description="Фильтр по типу отчета"),
+    include_total: bool = Query(False, description="Вернуть общее количество отчетов"),
+    use_case: ListReportsUseCase = Depends(get_list_reports_use_case)
+):
+    """Получить список отчетов по курсору"""
+    try:
+        return await use_case.execute_cursor(
+            page_size=page_size,
+            cursor=cursor,
+            status=report_status,
+            report_type=report_type,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch reports: {str(e)}"
+        )
+
+
 @router.get(
     "/{report_id}",
     response_model=ReportResponse,
@@ -122,19 +174,65 @@ async def get_report(
 @router.post(
     "/{report_id}/generate",
     response_model=GenerateReportResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Сгенерировать отчет",
-    description="Запустить процесс генерации отчета"
+    description=(
+        "Поставить отчет в очередь на генерацию; статус отслеживается через GET /reports/{report_id}. "
+        "Очередь хранится в памяти процесса: если сервис перезапущен до генерации, отчет остается "
+        "в статусе PENDING - повторите запрос"
+    )
 )
 async def generate_report(
     report_id: int,
-    background_tasks: BackgroundTasks,
-    use_case: GenerateReportUseCase = Depends(get_generate_report_use_case)
+    db: AsyncSession = Depends(get_db),
+    use_case: GenerateReportUseCase = Depends(get_generate_report_use_case),
+    job_queue: DocumentJobQueue = Depends(get_job_queue)
 ):
-    """Сгенерировать отчет"""
+    """Сгенерировать отчет в фоне"""
     try:
-        # Запуск генерации в фоне
-        result = await use_case.execute(report_id)
-        return result
+        report = await use_case.enqueue(report_id)
+        # Результат фиксации статуса PENDING: фоновая задача читает отчет в своей сессии
+        status_saved = asyncio.get_running_loop().create_future()
+
+        async def run() -> None:
+            if not await status_saved:
+                return
+            async with AsyncSessionLocal() as job_db:
+                result = await create_generate_report_use_case(job_db).execute(report_id)
+                await job_db.commit()
+            if result.status == ReportStatus.FAILED:
+                raise RuntimeError(result.message)
+
+        # Задача ставится до фиксации статуса: при переполнении очереди отчет в БД не меняется.
+        # Приоритет очереди определяется типом отчета
+        try:
+            job_queue.submit(
+                name=report.name,
+                report_type=report.report_type,
+                parameters={"report_id": report_id},
+                filename=f"report_{report_id}.pdf",
+                run=run
+            )
+        except JobQueueFullError:
+            await db.rollback()
+            raise
+
+        try:
+            await db.commit()
+        except BaseException:
+            # В том числе отмена запроса - иначе задача ждала бы результат бесконечно
+            status_saved.set_result(False)
+            raise
+        status_saved.set_result(True)
+
+        return GenerateReportResponse(
+            report_id=report_id,
+            status=report.status,
+            message="Report generation queued"
+        )
+    except JobQueueFullError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -183,7 +281,8 @@ async def delete_report(
 )
 async def download_report(
     report_id: int,
-    use_case: GetReportUseCase = Depends(get_get_report_use_case)
+    use_case: GetReportUseCase = Depends(get_get_report_use_case),
+    report_store: IReportStore = Depends(get_report_store)
 ):
     """Скачать файл отчета"""
     try:
@@ -200,20 +299,14 @@ async def download_report(
                 detail="Report is not ready yet"
             )
 
-        if not report.file_path:
+        content = await report_store.get(report.file_path) if report.file_path else None
+        if content is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Report file not found"
             )
 
-        # TODO: Реализовать возврат файла
-        # from fastapi.responses import FileResponse
-        # return FileResponse(report.file_path, filename=...)
-
-        return MessageResponse(
-            message="Download endpoint",
-            detail=f"File path: {report.file_path}"
-        )
+        return pdf_response(content, filename=ReportDomainService.generate_report_filename(report))
 
     except HTTPException:
         raise
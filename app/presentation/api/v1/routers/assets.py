@@ -0,0 +1,54 @@
+"""
+Assets Router
+Раздача изображений шаблонов (логотип, подпись, фоны сертификатов)
+"""
+import os
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
+
+from app.infrastructure.services.asset_registry import IMAGE_EXTENSIONS
+from app.core.services import asset_registry
+
+router = APIRouter(prefix="/assets", tags=["assets"])
+
+
+@router.get("/{name}")
+async def get_asset(name: str):
+    """
+    Получить изображение шаблона
+
+    Используется PDF рендерером в режиме ASSET_MODE=url вместо встраивания
+    base64 в HTML. Файлы отдаются из памяти реестра ресурсов.
+
+    Args:
+        name: Имя файла изображения
+
+    Returns:
+        Response с содержимым изображения
+
+    Raises:
+        HTTPException: 404 если изображение не найдено
+    """
+    # Отдаем только изображения из корня директории ресурсов
+    if os.path.basename(name) != name or not name.lower().endswith(IMAGE_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Asset not found: {name}"
+        )
+
+    asset = asset_registry.get(name)
+    if not asset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Asset not found: {name}"
+        )
+
+    return Response(
+        content=asset.data,
+        media_type=asset.mime_type,
+        headers={
+            # URL содержит версию (mtime), поэтому ответ можно кешировать надолго
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{int(asset.mtime)}-{len(asset.data)}"'
+        }
+    )
@@ -2,128 +2,231 @@
 Certificates Router
 Эндпоинты для работы с сертификатами лицензий
 """
-import os
-import tempfile
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
-from PyPDF2 import PdfMerger
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from app.presentation.api.v1.schemas.certificate_schemas import GenerateCertificateRequest
-from app.presentation.api.dependencies import (
-    GenerateCertificateUseCaseDep,
-    TemplateRenderer,
-    PDFGenerator,
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.core.config import settings
+from app.core.instrumentation import stage_timer, timed_document
+from app.presentation.api.v1.schemas.certificate_schemas import (
+    GenerateCertificateBulkRequest,
+    GenerateCertificateRequest
+)
+from app.application.dto.certificate_dto import CertificateDataDTO
+from app.application.services.document_renderer import (
+    PDF_CACHE_MODE_WATERMARK,
+    build_document_cache_key,
+    find_cached_by_watermark,
+    iter_rendered
+)
+from app.application.use_cases.generate_certificate_use_case import GenerateCertificateUseCase
+from app.domain.services.pdf_cache import IPdfCache
+from app.domain.services.pdf_generator import IPDFGenerator, PdfGeneratorBusyError
+from app.domain.services.template_renderer import ITemplateRenderer
+from app.infrastructure.services.pdf_merger import merge_pdfs
+from app.presentation.api.pdf_response import pdf_response, zip_stream_response
+from app.core.services import (
     load_logo_base64,
     load_sign_img_base64,
     load_bg_certificate_en,
     load_bg_certificate_kk
 )
+from app.presentation.api.dependencies import (
+    GenerateCertificateUseCaseDep,
+    TemplateRenderer,
+    PDFGenerator,
+    PDFCache
+)
 
 router = APIRouter(prefix="/certificates", tags=["certificates"])
 
+# Шаблоны страниц сертификата (EN и KK версии)
+CERTIFICATE_TEMPLATES = ["certificate_template_en.html", "certificate_template_kk.html"]
 
-@router.post("/generate", response_class=FileResponse)
-async def generate_certificate(
-    request: GenerateCertificateRequest,
-    use_case: GenerateCertificateUseCaseDep,
-    template_renderer: TemplateRenderer,
-    pdf_generator: PDFGenerator
-):
+
+def build_certificate_context(certificate_data: CertificateDataDTO) -> Dict[str, Any]:
+    """Преобразовать CertificateDataDTO в словарь для шаблона"""
+    return {
+        "type_kk": certificate_data.type_kk,
+        "type_en": certificate_data.type_en,
+        "club_full_name_kk": certificate_data.club_full_name_kk,
+        "club_full_name_en": certificate_data.club_full_name_en,
+        "club_bin": certificate_data.club_bin,
+        "license_end_at": certificate_data.license_end_at,
+        "certificate_id": certificate_data.certificate_id,
+        "solution_day": certificate_data.solution_day,
+        "solution_month": certificate_data.solution_month,
+        "solution_year": certificate_data.solution_year,
+        "logo_base64": certificate_data.logo_base64,
+        "bg_image_en": certificate_data.bg_image_en,
+        "bg_image_kk": certificate_data.bg_image_kk,
+        "sign_img": certificate_data.sign_img
+    }
+
+
+async def render_certificate_pdf(
+    certificate_data: CertificateDataDTO,
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    pdf_cache: Optional[IPdfCache],
+    concurrency: int
+) -> bytes:
     """
-    Генерировать сертификат лицензии
+    Сгенерировать PDF сертификата (страницы EN и KK в одном файле)
 
-    Генерирует PDF сертификат на двух языках (EN и KK) и объединяет их в один файл.
+    Args:
+        certificate_data: Данные сертификата
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
+        concurrency: Сколько страниц сертификата рендерится одновременно
+
+    Returns:
+        Содержимое PDF файла
+    """
+    with stage_timer("context"):
+        context = build_certificate_context(certificate_data)
+
+    async def generate_pdf() -> bytes:
+        # Рендерим HTML шаблоны (EN и KK версии)
+        with stage_timer("template"):
+            html_contents = [template_renderer.render(name, context) for name in CERTIFICATE_TEMPLATES]
+
+        # Генерируем PDF для английской и казахской версий параллельно и
+        # объединяем их в памяти, не блокируя event loop
+        with stage_timer("pdf"):
+            pdf_contents = await pdf_generator.generate_many(html_contents, concurrency=concurrency)
+            return await asyncio.to_thread(merge_pdfs, pdf_contents)
+
+    if pdf_cache is None:
+        return await generate_pdf()
+
+    # Повторная генерация с теми же данными отдается из кеша
+    key = build_document_cache_key(template_renderer, pdf_generator, CERTIFICATE_TEMPLATES, context)
+    return await pdf_cache.get_or_create(key, generate_pdf)
+
+
+@timed_document("certificate")
+async def generate_certificate_pdf(
+    certificate_id: int,
+    use_case: GenerateCertificateUseCase,
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    pdf_cache: Optional[IPdfCache]
+) -> bytes:
+    """
+    Сгенерировать PDF сертификата лицензии
+
+    Используется эндпоинтом генерации и фоновыми задачами.
 
     Args:
-        request: Запрос с certificate_id
-        use_case: Use Case для генерации сертификата
+        certificate_id: ID сертификата
+        use_case: Use Case для генерации данных документа
         template_renderer: Сервис рендеринга шаблонов
         pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
 
     Returns:
-        FileResponse с PDF файлом (две страницы: EN и KK)
+        Содержимое PDF файла
 
     Raises:
-        HTTPException: 404 если сертификат не найден, 500 при ошибках генерации
+        ValueError: Если документ не найден
+        FileNotFoundError: Если шаблон не найден
+        PdfGeneratorBusyError: Если PDF рендерер перегружен
     """
-    try:
-        # Загружаем изображения
+    # Загружаем изображения
+    with stage_timer("assets"):
         logo_base64 = load_logo_base64()
         sign_img = load_sign_img_base64()
         bg_image_en = load_bg_certificate_en()
         bg_image_kk = load_bg_certificate_kk()
 
-        # Выполняем Use Case для получения данных сертификата
+    # В режиме watermark неизменные данные отдаются из кеша без сборки документа
+    with stage_timer("cache_lookup"):
+        watermark_key, cached_pdf = await find_cached_by_watermark(
+            pdf_cache if settings.PDF_CACHE_MODE == PDF_CACHE_MODE_WATERMARK else None,
+            template_renderer,
+            pdf_generator,
+            template_names=CERTIFICATE_TEMPLATES,
+            document_key=f"certificate:{certificate_id}",
+            get_watermark=lambda: use_case.get_watermark(certificate_id),
+            assets=[logo_base64, sign_img, bg_image_en, bg_image_kk]
+        )
+    if cached_pdf is not None:
+        return cached_pdf
+
+    # Выполняем Use Case для получения данных сертификата
+    with stage_timer("use_case"):
         certificate_data = await use_case.execute(
-            certificate_id=request.certificate_id,
+            certificate_id=certificate_id,
             logo_base64=logo_base64,
             bg_image_en=bg_image_en,
             bg_image_kk=bg_image_kk,
             sign_img=sign_img
         )
 
-        # Преобразуем CertificateDataDTO в словарь для шаблона
-        context = {
-            "type_kk": certificate_data.type_kk,
-            "type_en": certificate_data.type_en,
-            "club_full_name_kk": certificate_data.club_full_name_kk,
-            "club_full_name_en": certificate_data.club_full_name_en,
-            "club_bin": certificate_data.club_bin,
-            "license_end_at": certificate_data.license_end_at,
-            "certificate_id": certificate_data.certificate_id,
-            "solution_day": certificate_data.solution_day,
-            "solution_month": certificate_data.solution_month,
-            "solution_year": certificate_data.solution_year,
-            "logo_base64": certificate_data.logo_base64,
-            "bg_image_en": certificate_data.bg_image_en,
-            "bg_image_kk": certificate_data.bg_image_kk,
-            "sign_img": certificate_data.sign_img
-        }
+    pdf_content = await render_certificate_pdf(
+        certificate_data,
+        template_renderer,
+        pdf_generator,
+        pdf_cache,
+        concurrency=settings.PDF_REQUEST_CONCURRENCY
+    )
 
-        # Рендерим HTML шаблоны (EN и KK версии)
-        html_content_en = template_renderer.render("certificate_template_en.html", context)
-        html_content_kk = template_renderer.render("certificate_template_kk.html", context)
+    if watermark_key is not None:
+        await pdf_cache.put(watermark_key, pdf_content)
 
-        # Создаем временные файлы для каждой страницы
-        temp_file_en = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_file_kk = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_file_combined = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+    return pdf_content
 
-        temp_file_en.close()
-        temp_file_kk.close()
-        temp_file_combined.close()
 
-        try:
-            # Генерируем PDF для английской версии
-            pdf_generator.generate_from_html(html_content_en, temp_file_en.name)
-
-            # Генерируем PDF для казахской версии
-            pdf_generator.generate_from_html(html_content_kk, temp_file_kk.name)
-
-            # Объединяем PDF файлы
-            merger = PdfMerger()
-            merger.append(temp_file_en.name)
-            merger.append(temp_file_kk.name)
-            merger.write(temp_file_combined.name)
-            merger.close()
-
-            # Возвращаем объединенный файл
-            return FileResponse(
-                path=temp_file_combined.name,
-                media_type="application/pdf",
-                filename=f"license_certificate_{request.certificate_id}.pdf",
-                background=None  # Файл будет удален автоматически после отправки
-            )
+@router.post("/generate", response_class=Response)
+async def generate_certificate(
+    request: GenerateCertificateRequest,
+    use_case: GenerateCertificateUseCaseDep,
+    template_renderer: TemplateRenderer,
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
+):
+    """
+    Генерировать сертификат лицензии
 
-        finally:
-            # Удаляем временные файлы (EN и KK версии)
-            try:
-                os.unlink(temp_file_en.name)
-                os.unlink(temp_file_kk.name)
-                # temp_file_combined.name не удаляем, так как его использует FileResponse
-            except Exception:
-                pass
+    Генерирует PDF сертификат на двух языках (EN и KK) и объединяет их в один файл.
 
+    Args:
+        request: Запрос с certificate_id
+        use_case: Use Case для генерации сертификата
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
+
+    Returns:
+        Response с PDF файлом (две страницы: EN и KK)
+
+    Raises:
+        HTTPException: 404 если сертификат не найден, 500 при ошибках генерации
+        PdfGeneratorBusyError: Если PDF рендерер перегружен (ответ 503)
+    """
+    try:
+        pdf_content = await generate_certificate_pdf(
+            request.certificate_id,
+            use_case,
+            template_renderer,
+            pdf_generator,
+            pdf_cache
+        )
+
+        # Возвращаем объединенный файл
+        with stage_timer("response", document="certificate"):
+            return pdf_response(
+                pdf_content,
+                filename=f"license_certificate_{request.certificate_id}.pdf"
+            )
+
+    except PdfGeneratorBusyError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
     except ValueError as e:
         # Ошибка валидации (сертификат не найден и т.д.)
         raise HTTPException(
@@ -142,3 +245,103 @@ async def generate_certificate(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate certificate: {str(e)}"
         )
+
+
+@router.post("/generate-bulk", response_class=Response)
+async def generate_certificates_bulk(
+    request: GenerateCertificateBulkRequest,
+    use_case: GenerateCertificateUseCaseDep,
+    template_renderer: TemplateRenderer,
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
+):
+    """
+    Генерировать сертификаты всех клубов сезона или лицензии
+
+    Данные сертификатов загружаются двумя запросами, изображения - один раз
+    на все сертификаты. PDF генерируются параллельно (не более
+    PDF_BATCH_CONCURRENCY одновременно) и отправляются в ZIP архиве по мере
+    готовности. Сертификаты без решения по заявке пропускаются, их ID
+    перечисляются в заголовке X-Skipped-Certificates.
+
+    Если генерация не удалась после начала отправки архива, ответ обрывается
+    и клиент получает поврежденный ZIP.
+
+    Args:
+        request: Запрос с season_id или license_id
+        use_case: Use Case для генерации сертификата
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
+
+    Returns:
+        StreamingResponse с ZIP архивом сертификатов
+
+    Raises:
+        HTTPException: 404 если сертификаты не найдены, 500 при ошибках генерации
+        PdfGeneratorBusyError: Если PDF рендерер перегружен (ответ 503)
+    """
+    try:
+        # Загружаем изображения один раз для всех сертификатов
+        bulk_data = await use_case.execute_bulk(
+            logo_base64=load_logo_base64(),
+            bg_image_en=load_bg_certificate_en(),
+            bg_image_kk=load_bg_certificate_kk(),
+            sign_img=load_sign_img_base64(),
+            season_id=request.season_id,
+            license_id=request.license_id
+        )
+        if not bulk_data.certificates:
+            raise ValueError("No certificates with solutions to generate")
+
+        # Страницы одного сертификата рендерятся последовательно:
+        # параллельность ограничивается числом сертификатов в работе
+        pdf_contents = iter_rendered(
+            [
+                partial(render_certificate_pdf, certificate_data, template_renderer, pdf_generator, pdf_cache, 1)
+                for certificate_data in bulk_data.certificates.values()
+            ],
+            concurrency=settings.PDF_BATCH_CONCURRENCY
+        )
+
+        # Первый сертификат генерируем до начала ответа: ошибки шаблонов и
+        # перегрузка рендерера возвращаются клиенту обычным статусом
+        first_pdf = await pdf_contents.__anext__()
+
+    except PdfGeneratorBusyError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
+    except ValueError as e:
+        # Ошибка валидации (сертификаты не найдены и т.д.)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except FileNotFoundError as e:
+        # Шаблон не найден
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Template not found: {str(e)}"
+        )
+    except Exception as e:
+        # Другие ошибки
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate certificates: {str(e)}"
+        )
+
+    async def certificate_files() -> AsyncIterator[Tuple[str, bytes]]:
+        names = (f"license_certificate_{certificate_id}.pdf" for certificate_id in bulk_data.certificates)
+        try:
+            yield next(names), first_pdf
+            async for pdf_content in pdf_contents:
+                yield next(names), pdf_content
+        finally:
+            # Клиент отключился или генерация не удалась - отменяем рендеры в работе
+            await pdf_contents.aclose()
+
+    scope = f"season_{request.season_id}" if request.season_id is not None else f"license_{request.license_id}"
+    response = zip_stream_response(certificate_files(), filename=f"license_certificates_{scope}.zip")
+    if bulk_data.skipped_ids:
+        response.headers["X-Skipped-Certificates"] = ",".join(str(i) for i in bulk_data.skipped_ids)
+    return response
@@ -2,59 +2,89 @@
 Initial Reports Router
 Эндпоинты для работы с начальными отчетами
 """
-import tempfile
-import os
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.core.config import settings
+from app.core.instrumentation import stage_timer, timed_document
 from app.presentation.api.v1.schemas.initial_report_schemas import GenerateInitialReportRequest
+from app.application.services.document_renderer import (
+    PDF_CACHE_MODE_WATERMARK,
+    find_cached_by_watermark,
+    render_document
+)
+from app.application.use_cases.generate_initial_report_use_case import GenerateInitialReportUseCase
+from app.domain.services.pdf_cache import IPdfCache
+from app.domain.services.pdf_generator import IPDFGenerator, PdfGeneratorBusyError
+from app.domain.services.template_renderer import ITemplateRenderer
+from app.presentation.api.pdf_response import pdf_response
+from app.core.services import load_logo_base64, load_sign_img_base64
 from app.presentation.api.dependencies import (
     GenerateInitialReportUseCaseDep,
     TemplateRenderer,
     PDFGenerator,
-    load_logo_base64,
-    load_sign_img_base64
+    PDFCache
 )
 from collections import OrderedDict
 router = APIRouter(prefix="/initial-reports", tags=["initial-reports"])
 
-# response_class=FileResponse
-@router.post("/generate")
-async def generate_initial_report(
-    request: GenerateInitialReportRequest,
-    use_case: GenerateInitialReportUseCaseDep,
-    template_renderer: TemplateRenderer,
-    pdf_generator: PDFGenerator
-):
+@timed_document("initial_report")
+async def generate_initial_report_pdf(
+    report_id: int,
+    use_case: GenerateInitialReportUseCase,
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    pdf_cache: Optional[IPdfCache]
+) -> bytes:
     """
-    Генерировать начальный отчет по заявке
+    Сгенерировать PDF начального отчета по заявке
 
-    Генерирует PDF отчет на основе данных заявки и критериев.
+    Используется эндпоинтом генерации и фоновыми задачами.
 
     Args:
-        request: Запрос с report_id
-        use_case: Use Case для генерации данных отчета
+        report_id: ID отчета
+        use_case: Use Case для генерации данных документа
         template_renderer: Сервис рендеринга шаблонов
         pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
 
     Returns:
-        FileResponse с PDF файлом
+        Содержимое PDF файла
 
     Raises:
-        HTTPException: 404 если отчет не найден, 500 при ошибках генерации
+        ValueError: Если документ не найден
+        FileNotFoundError: Если шаблон не найден
+        PdfGeneratorBusyError: Если PDF рендерер перегружен
     """
-    try:
-        # Загружаем логотип
+    # Загружаем логотип
+    with stage_timer("assets"):
         logo_base64 = load_logo_base64()
         sign_img = load_sign_img_base64()
-        # Выполняем Use Case для получения данных отчета
+    # В режиме watermark неизменные данные отдаются из кеша без сборки документа
+    with stage_timer("cache_lookup"):
+        watermark_key, cached_pdf = await find_cached_by_watermark(
+            pdf_cache if settings.PDF_CACHE_MODE == PDF_CACHE_MODE_WATERMARK else None,
+            template_renderer,
+            pdf_generator,
+            template_names=["initial_report_template.html"],
+            document_key=f"initial_report:{report_id}",
+            get_watermark=lambda: use_case.get_watermark(report_id),
+            assets=[logo_base64, sign_img]
+        )
+    if cached_pdf is not None:
+        return cached_pdf
+
+    # Выполняем Use Case для получения данных отчета
+    with stage_timer("use_case"):
         report_data = await use_case.execute(
-            report_id=request.report_id,
+            report_id=report_id,
             logo_base64=logo_base64,
             sign_img=sign_img
         )
 
-        # Преобразуем InitialReportDataDTO в словарь для шаблона
+    # Преобразуем InitialReportDataDTO в словарь для шаблона
+    with stage_timer("context"):
         docs = [
             {
                 "number": doc.number,
@@ -82,24 +112,64 @@ async def generate_initial_report(
             "sign_img": sign_img,
         }
 
-        # Рендерим HTML шаблон
-        html_content = template_renderer.render("initial_report_template.html", context)
+    # Рендерим HTML шаблон и генерируем PDF (HTML передается частями, только если генератор PDF это поддерживает)
+    pdf_content = await render_document(
+        template_renderer,
+        pdf_generator,
+        "initial_report_template.html",
+        context,
+        pdf_cache=pdf_cache
+    )
 
-        # Создаем временный файл для PDF
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_file.close()
+    if watermark_key is not None:
+        await pdf_cache.put(watermark_key, pdf_content)
 
-        # Генерируем PDF
-        pdf_generator.generate_from_html(html_content, temp_file.name)
+    return pdf_content
 
-        # Возвращаем PDF файл
-        return FileResponse(
-            path=temp_file.name,
-            media_type="application/pdf",
-            filename=f"initial_report_{request.report_id}.pdf",
-            background=None  # Файл будет удален автоматически после отправки
+
+@router.post("/generate", response_class=Response)
+async def generate_initial_report(
+    request: GenerateInitialReportRequest,
+    use_case: GenerateInitialReportUseCaseDep,
+    template_renderer: TemplateRenderer,
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
+):
+    """
+    Генерировать начальный отчет по заявке
+
+    Генерирует PDF отчет на основе данных заявки и критериев.
+
+    Args:
+        request: Запрос с report_id
+        use_case: Use Case для генерации данных отчета
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
+
+    Returns:
+        Response с PDF файлом
+
+    Raises:
+        HTTPException: 404 если отчет не найден, 500 при ошибках генерации
+        PdfGeneratorBusyError: Если PDF рендерер перегружен (ответ 503)
+    """
+    try:
+        pdf_content = await generate_initial_report_pdf(
+            request.report_id,
+            use_case,
+            template_renderer,
+            pdf_generator,
+            pdf_cache
         )
 
+        # Возвращаем PDF из памяти
+        with stage_timer("response", document="initial_report"):
+            return pdf_response(pdf_content, filename=f"initial_report_{request.report_id}.pdf")
+
+    except PdfGeneratorBusyError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
     except ValueError as e:
         # Ошибка валидации (отчет не найден и т.д.)
         raise HTTPException(
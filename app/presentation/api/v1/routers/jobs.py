@@ -0,0 +1,187 @@
+"""
+Jobs Router
+Эндпоинты для фоновой генерации документов
+"""
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.core.database import AsyncSessionLocal
+from app.presentation.api.v1.schemas.job_schemas import JobResponse, SubmitJobRequest
+from app.application.services.job_queue import DocumentJob
+from app.application.use_cases.generate_certificate_use_case import GenerateCertificateUseCase
+from app.application.use_cases.generate_department_report_use_case import GenerateDepartmentReportUseCase
+from app.application.use_cases.generate_initial_report_use_case import GenerateInitialReportUseCase
+from app.application.use_cases.generate_report_use_case_v2 import GenerateReportUseCaseV2
+from app.application.use_cases.generate_solution_use_case import GenerateSolutionUseCase
+from app.domain.entities.report import ReportStatus, ReportType
+from app.presentation.api.pdf_response import pdf_response
+from app.presentation.api.dependencies import (
+    JobQueue,
+    TemplateRenderer,
+    PDFGenerator,
+    PDFCache
+)
+from app.presentation.api.v1.routers.certificates import generate_certificate_pdf
+from app.presentation.api.v1.routers.department_reports import generate_department_report_pdf
+from app.presentation.api.v1.routers.initial_reports import generate_initial_report_pdf
+from app.presentation.api.v1.routers.reports import generate_report_pdf
+from app.presentation.api.v1.routers.solutions import generate_solution_pdf
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Путь к эндпоинтам задач (роутер подключается с префиксом /api/v1)
+JOBS_ROUTE_PREFIX = "/api/v1/jobs"
+
+# Тип документа -> (Use Case, функция генерации PDF, шаблон имени файла)
+DOCUMENT_GENERATORS = {
+    "report": (GenerateReportUseCaseV2, generate_report_pdf, "report_{id}.pdf"),
+    "initial_report": (GenerateInitialReportUseCase, generate_initial_report_pdf, "initial_report_{id}.pdf"),
+    "department_report": (
+        GenerateDepartmentReportUseCase,
+        generate_department_report_pdf,
+        "department_report_{id}.pdf"
+    ),
+    "solution": (GenerateSolutionUseCase, generate_solution_pdf, "solution_{id}.pdf"),
+    "certificate": (GenerateCertificateUseCase, generate_certificate_pdf, "license_certificate_{id}.pdf"),
+}
+
+
+def build_job_response(job: DocumentJob) -> JobResponse:
+    """Преобразовать задачу в ответ API"""
+    report = job.report
+    status_url = f"{JOBS_ROUTE_PREFIX}/{job.id}"
+    return JobResponse(
+        job_id=job.id,
+        name=report.name,
+        report_type=report.report_type,
+        status=report.status,
+        priority=job.priority,
+        parameters=report.parameters or {},
+        created_at=report.created_at,
+        updated_at=report.updated_at,
+        completed_at=report.completed_at,
+        error_message=report.error_message,
+        status_url=status_url,
+        result_url=f"{status_url}/result" if report.is_completed() else None
+    )
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    request: SubmitJobRequest,
+    response: Response,
+    job_queue: JobQueue,
+    template_renderer: TemplateRenderer,
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
+):
+    """
+    Поставить генерацию документа в очередь
+
+    Документ генерируется в фоне, HTTP соединение не удерживается на время
+    рендеринга. Статус задачи доступен по status_url, готовый файл - по
+    result_url.
+
+    Args:
+        request: Запрос с типом и ID документа
+        response: Ответ (для заголовка Location)
+        job_queue: Очередь фоновой генерации
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
+
+    Returns:
+        JobResponse с задачей в статусе pending
+
+    Raises:
+        JobQueueFullError: Если очередь заполнена (ответ 503)
+    """
+    use_case_class, generate_pdf, filename = DOCUMENT_GENERATORS[request.document_type]
+    document_id = request.document_id
+
+    async def run() -> bytes:
+        # Задача выполняется после ответа - сессия запроса уже закрыта
+        async with AsyncSessionLocal() as db:
+            return await generate_pdf(
+                document_id,
+                use_case_class(db),
+                template_renderer,
+                pdf_generator,
+                pdf_cache
+            )
+
+    # Приоритет задачи определяется типом документа (parameters["document_type"]);
+    # заполненная очередь (JobQueueFullError) - 503 с Retry-After от обработчика приложения
+    job = job_queue.submit(
+        name=f"{request.document_type}:{document_id}",
+        report_type=ReportType.CUSTOM,
+        parameters=request.model_dump(),
+        filename=filename.format(id=document_id),
+        run=run
+    )
+
+    job_response = build_job_response(job)
+    response.headers["Location"] = job_response.status_url
+    return job_response
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, job_queue: JobQueue):
+    """
+    Получить состояние задачи
+
+    Args:
+        job_id: ID задачи
+        job_queue: Очередь фоновой генерации
+
+    Returns:
+        JobResponse с текущим статусом
+
+    Raises:
+        HTTPException: 404 если задача не найдена или удалена по истечении срока хранения
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    return build_job_response(job)
+
+
+@router.get("/{job_id}/result", response_class=Response)
+async def get_job_result(job_id: str, job_queue: JobQueue):
+    """
+    Получить сгенерированный документ
+
+    Args:
+        job_id: ID задачи
+        job_queue: Очередь фоновой генерации
+
+    Returns:
+        Response с PDF файлом
+
+    Raises:
+        HTTPException: 404 если задача не найдена, 409 если документ еще не готов
+            или генерация не удалась
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    if job.report.status == ReportStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job failed: {job.report.error_message}"
+        )
+
+    if not job.report.is_completed():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {job.report.status.value}"
+        )
+
+    return pdf_response(job.result, filename=job.filename)
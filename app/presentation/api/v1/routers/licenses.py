@@ -0,0 +1,54 @@
+"""
+Licenses Router
+Эндпоинты для работы с лицензиями
+"""
+from dataclasses import asdict
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.presentation.api.v1.schemas.license_schemas import ExpiringLicensesResponse
+from app.application.use_cases.list_expiring_licenses import MAX_PAGE_SIZE
+from app.presentation.api.dependencies import ListExpiringLicensesUseCaseDep
+
+router = APIRouter(prefix="/licenses", tags=["licenses"])
+
+
+@router.get("/expiring", response_model=ExpiringLicensesResponse)
+async def list_expiring_licenses(
+    use_case: ListExpiringLicensesUseCaseDep,
+    days_threshold: int = Query(..., gt=0, description="Горизонт в днях от текущей даты"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Размер страницы"),
+    cursor: Optional[str] = Query(None, description="Курсор next_cursor из предыдущего ответа")
+):
+    """
+    Получить лицензии и сертификаты, срок действия которых истекает
+
+    Строки отсортированы по дате окончания лицензии. Для следующей
+    страницы передайте next_cursor из ответа; null означает последнюю
+    страницу.
+
+    Args:
+        use_case: Use Case списка истекающих лицензий
+        days_threshold: Горизонт в днях
+        limit: Размер страницы
+        cursor: Курсор следующей страницы
+
+    Returns:
+        ExpiringLicensesResponse со строками страницы и курсором
+
+    Raises:
+        HTTPException: 400 если курсор некорректен
+    """
+    try:
+        page = await use_case.execute(days_threshold, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return ExpiringLicensesResponse(
+        items=[asdict(item) for item in page.items],
+        next_cursor=page.next_cursor
+    )
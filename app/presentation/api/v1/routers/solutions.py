@@ -2,28 +2,173 @@
 Solutions Router
 Эндпоинты для работы с решениями
 """
-import tempfile
+import asyncio
 import traceback
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, HTTPException, Response, status
 
-from app.presentation.api.v1.schemas.solution_schemas import GenerateSolutionRequest
+from app.core.config import settings
+from app.core.instrumentation import stage_timer, timed_document
+from app.presentation.api.v1.schemas.solution_schemas import (
+    GenerateSolutionRequest,
+    GenerateSolutionBatchRequest
+)
+from app.application.dto.solution_generation_dto import SolutionDataDTO
+from app.application.services.document_renderer import (
+    PDF_CACHE_MODE_WATERMARK,
+    find_cached_by_watermark,
+    render_document,
+    render_documents
+)
+from app.application.use_cases.generate_solution_use_case import BatchTooLargeError, GenerateSolutionUseCase
+from app.domain.services.pdf_cache import IPdfCache
+from app.domain.services.pdf_generator import IPDFGenerator, PdfGeneratorBusyError
+from app.domain.services.template_renderer import ITemplateRenderer
+from app.infrastructure.services.pdf_merger import merge_pdfs
+from app.presentation.api.pdf_response import pdf_response, zip_response
+from app.core.services import load_logo_base64
 from app.presentation.api.dependencies import (
     GenerateSolutionUseCaseDep,
     TemplateRenderer,
     PDFGenerator,
-    load_logo_base64
+    PDFCache
 )
 
 router = APIRouter(prefix="/solutions", tags=["solutions"])
 
 
-@router.post("/generate", response_class=FileResponse)
+def build_solution_context(solution_data: SolutionDataDTO) -> Dict[str, Any]:
+    """
+    Преобразовать SolutionDataDTO в словарь для шаблона
+
+    Args:
+        solution_data: Данные решения
+
+    Returns:
+        Контекст шаблона solution_template.html
+    """
+    return {
+        "meeting_date": solution_data.meeting_date,
+        "meeting_place": solution_data.meeting_place,
+        "department_name": solution_data.department_name,
+        "director_name": solution_data.director_name,
+        "director_position": solution_data.director_position,
+        "secretary_position": solution_data.secretary_position,
+        "control_position": solution_data.control_position,
+        "control_name": solution_data.control_name,
+        "experts": solution_data.experts,
+        "club_fullname": solution_data.club_fullname,
+        "club_shortname": solution_data.club_shortname,
+        "license": solution_data.license,
+        "season": solution_data.season,
+        "criteria": [
+            {
+                "title": criterion.title,
+                "description": criterion.description,
+                "status": criterion.status
+            }
+            for criterion in solution_data.criteria
+        ],
+        "documents": [
+            {
+                "title": article.title,
+                "docs": [
+                    {
+                        "title": doc.title,
+                        "comment": doc.comment,
+                        "deadline": doc.deadline
+                    }
+                    for doc in article.docs
+                ]
+            }
+            for article in solution_data.documents
+        ],
+        "secretary_name": solution_data.secretary_name,
+        "summary": solution_data.summary,
+        "conclusion": solution_data.conclusion,
+        "logo_base64": solution_data.logo_base64
+    }
+
+
+@timed_document("solution")
+async def generate_solution_pdf(
+    solution_id: int,
+    use_case: GenerateSolutionUseCase,
+    template_renderer: ITemplateRenderer,
+    pdf_generator: IPDFGenerator,
+    pdf_cache: Optional[IPdfCache]
+) -> bytes:
+    """
+    Сгенерировать PDF решения
+
+    Используется эндпоинтом генерации и фоновыми задачами.
+
+    Args:
+        solution_id: ID решения
+        use_case: Use Case для генерации данных документа
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF (None - без кеша)
+
+    Returns:
+        Содержимое PDF файла
+
+    Raises:
+        ValueError: Если документ не найден
+        FileNotFoundError: Если шаблон не найден
+        PdfGeneratorBusyError: Если PDF рендерер перегружен
+    """
+    # Загружаем логотип
+    with stage_timer("assets"):
+        logo_base64 = load_logo_base64()
+
+    # В режиме watermark неизменные данные отдаются из кеша без сборки документа
+    with stage_timer("cache_lookup"):
+        watermark_key, cached_pdf = await find_cached_by_watermark(
+            pdf_cache if settings.PDF_CACHE_MODE == PDF_CACHE_MODE_WATERMARK else None,
+            template_renderer,
+            pdf_generator,
+            template_names=["solution_template.html"],
+            document_key=f"solution:{solution_id}",
+            get_watermark=lambda: use_case.get_watermark(solution_id),
+            assets=[logo_base64]
+        )
+    if cached_pdf is not None:
+        return cached_pdf
+
+    # Выполняем Use Case для получения данных решения
+    with stage_timer("use_case"):
+        solution_data = await use_case.execute(
+            solution_id=solution_id,
+            logo_base64=logo_base64
+        )
+
+    # Преобразуем SolutionDataDTO в словарь для шаблона
+    with stage_timer("context"):
+        context = build_solution_context(solution_data)
+
+    # Рендерим HTML шаблон и генерируем PDF (HTML передается частями, только если генератор PDF это поддерживает)
+    pdf_content = await render_document(
+        template_renderer,
+        pdf_generator,
+        "solution_template.html",
+        context,
+        pdf_cache=pdf_cache
+    )
+
+    if watermark_key is not None:
+        await pdf_cache.put(watermark_key, pdf_content)
+
+    return pdf_content
+
+
+@router.post("/generate", response_class=Response)
 async def generate_solution(
     request: GenerateSolutionRequest,
     use_case: GenerateSolutionUseCaseDep,
     template_renderer: TemplateRenderer,
-    pdf_generator: PDFGenerator
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
 ):
     """
     Генерировать решение по заявке
@@ -35,86 +180,126 @@ async def generate_solution(
         use_case: Use Case для генерации данных решения
         template_renderer: Сервис рендеринга шаблонов
         pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
 
     Returns:
-        FileResponse с PDF файлом
+        Response с PDF файлом
 
     Raises:
         HTTPException: 404 если решение не найдено, 500 при ошибках генерации
+        PdfGeneratorBusyError: Если PDF рендерер перегружен (ответ 503)
+    """
+    try:
+        pdf_content = await generate_solution_pdf(
+            request.solution_id,
+            use_case,
+            template_renderer,
+            pdf_generator,
+            pdf_cache
+        )
+
+        # Возвращаем PDF из памяти
+        with stage_timer("response", document="solution"):
+            return pdf_response(pdf_content, filename=f"solution_{request.solution_id}.pdf")
+
+    except PdfGeneratorBusyError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
+    except ValueError as e:
+        # Ошибка валидации (решение не найдено и т.д.)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except FileNotFoundError as e:
+        # Шаблон не найден
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Template not found: {str(e)}"
+        )
+    except Exception as e:
+        traceback.print_exc()
+        # Другие ошибки
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate solution: {str(e)}"
+        )
+
+
+@router.post("/generate-batch", response_class=Response)
+async def generate_solution_batch(
+    request: GenerateSolutionBatchRequest,
+    use_case: GenerateSolutionUseCaseDep,
+    template_renderer: TemplateRenderer,
+    pdf_generator: PDFGenerator,
+    pdf_cache: PDFCache
+):
+    """
+    Генерировать решения пакетом (например, по всем заявкам заседания комиссии)
+
+    Данные всех решений загружаются постоянным числом запросов, PDF
+    генерируются параллельно (не более PDF_BATCH_CONCURRENCY одновременно).
+
+    Args:
+        request: Запрос со списком solution_ids или датой заседания
+        use_case: Use Case для генерации данных решения
+        template_renderer: Сервис рендеринга шаблонов
+        pdf_generator: Сервис генерации PDF
+        pdf_cache: Кеш сгенерированных PDF
+
+    Returns:
+        Response с ZIP архивом или объединенным PDF файлом
+
+    Raises:
+        HTTPException: 400 если пакет слишком большой, 404 если решения не найдены,
+            500 при ошибках генерации
+        PdfGeneratorBusyError: Если PDF рендерер перегружен (ответ 503)
     """
     try:
         # Загружаем логотип
         logo_base64 = load_logo_base64()
 
-        # Выполняем Use Case для получения данных решения
-        solution_data = await use_case.execute(
-            solution_id=request.solution_id,
-            logo_base64=logo_base64
+        # Выполняем Use Case для всех решений пакета
+        solutions_data = await use_case.execute_batch(
+            logo_base64=logo_base64,
+            solution_ids=request.solution_ids,
+            meeting_date=request.meeting_date,
+            max_items=settings.PDF_BATCH_MAX_ITEMS
         )
 
-        # Преобразуем SolutionDataDTO в словарь для шаблона
-        context = {
-            "meeting_date": solution_data.meeting_date,
-            "meeting_place": solution_data.meeting_place,
-            "department_name": solution_data.department_name,
-            "director_name": solution_data.director_name,
-            "director_position": solution_data.director_position,
-            "secretary_position": solution_data.secretary_position,
-            "control_position": solution_data.control_position,
-            "control_name": solution_data.control_name,
-            "experts": solution_data.experts,
-            "club_fullname": solution_data.club_fullname,
-            "club_shortname": solution_data.club_shortname,
-            "license": solution_data.license,
-            "season": solution_data.season,
-            "criteria": [
-                {
-                    "title": criterion.title,
-                    "description": criterion.description,
-                    "status": criterion.status
-                }
-                for criterion in solution_data.criteria
-            ],
-            "documents": [
-                {
-                    "title": article.title,
-                    "docs": [
-                        {
-                            "title": doc.title,
-                            "comment": doc.comment,
-                            "deadline": doc.deadline
-                        }
-                        for doc in article.docs
-                    ]
-                }
-                for article in solution_data.documents
-            ],
-            "secretary_name": solution_data.secretary_name,
-            "summary": solution_data.summary,
-            "conclusion": solution_data.conclusion,
-            "logo_base64": solution_data.logo_base64
-        }
+        # Рендерим решения параллельно с ограничением числа одновременных рендеров
+        pdf_contents = await render_documents(
+            template_renderer,
+            pdf_generator,
+            "solution_template.html",
+            [build_solution_context(solution_data) for solution_data in solutions_data.values()],
+            concurrency=settings.PDF_BATCH_CONCURRENCY,
+            pdf_cache=pdf_cache
+        )
 
-        # Рендерим HTML шаблон
-        html_content = template_renderer.render("solution_template.html", context)
+        batch_name = f"solutions_{request.meeting_date}" if request.meeting_date else "solutions"
 
-        # Создаем временный файл для PDF
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        temp_file.close()
+        if request.output == "pdf":
+            # Один PDF со всеми решениями в порядке запроса
+            pdf_content = await asyncio.to_thread(merge_pdfs, pdf_contents)
+            return pdf_response(pdf_content, filename=f"{batch_name}.pdf")
 
-        # Генерируем PDF
-        pdf_generator.generate_from_html(html_content, temp_file.name)
+        files = {
+            f"solution_{solution_id}.pdf": pdf_content
+            for solution_id, pdf_content in zip(solutions_data.keys(), pdf_contents)
+        }
+        return await asyncio.to_thread(zip_response, files, f"{batch_name}.zip")
 
-        # Возвращаем PDF файл
-        return FileResponse(
-            path=temp_file.name,
-            media_type="application/pdf",
-            filename=f"solution_{request.solution_id}.pdf",
-            background=None  # Файл будет удален автоматически после отправки
+    except PdfGeneratorBusyError:
+        # Не превращаем в 500: ответ 503 с Retry-After формирует обработчик приложения
+        raise
+    except BatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-
     except ValueError as e:
-        # Ошибка валидации (решение не найдено и т.д.)
+        # Ошибка валидации (решения не найдены и т.д.)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
@@ -130,5 +315,5 @@ async def generate_solution(
         # Другие ошибки
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate solution: {str(e)}"
+            detail=f"Failed to generate solutions: {str(e)}"
         )
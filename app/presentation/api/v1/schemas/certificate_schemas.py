@@ -2,7 +2,9 @@
 Certificate API Schemas
 Схемы для API работы с сертификатами
 """
-from pydantic import BaseModel, Field
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class GenerateCertificateRequest(BaseModel):
@@ -15,3 +17,23 @@ class GenerateCertificateRequest(BaseModel):
                 "certificate_id": 1
             }
         }
+
+
+class GenerateCertificateBulkRequest(BaseModel):
+    """Запрос на массовую генерацию сертификатов (например, на старте сезона)"""
+    season_id: Optional[int] = Field(None, description="ID сезона (сертификаты всех лицензий сезона)", gt=0)
+    license_id: Optional[int] = Field(None, description="ID лицензии", gt=0)
+
+    @model_validator(mode="after")
+    def check_selector(self) -> "GenerateCertificateBulkRequest":
+        """Должен быть указан ровно один способ выбора сертификатов"""
+        if (self.season_id is None) == (self.license_id is None):
+            raise ValueError("Specify either season_id or license_id")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "season_id": 1
+            }
+        }
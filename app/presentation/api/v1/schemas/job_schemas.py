@@ -0,0 +1,45 @@
+"""
+Job API Schemas
+Схемы для API фоновой генерации документов
+"""
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.entities.report import ReportStatus, ReportType
+
+
+# Типы документов, которые можно сгенерировать в фоне
+DocumentType = Literal["report", "initial_report", "department_report", "solution", "certificate"]
+
+
+class SubmitJobRequest(BaseModel):
+    """Запрос на фоновую генерацию документа"""
+    document_type: DocumentType = Field(..., description="Тип документа")
+    document_id: int = Field(..., description="ID документа (как в соответствующем /generate)", gt=0)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "document_type": "certificate",
+                "document_id": 1
+            }
+        }
+    )
+
+
+class JobResponse(BaseModel):
+    """Схема ответа с состоянием задачи"""
+    job_id: str
+    name: str
+    report_type: ReportType
+    status: ReportStatus
+    priority: int
+    parameters: Dict[str, Any]
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    status_url: str
+    result_url: Optional[str] = None
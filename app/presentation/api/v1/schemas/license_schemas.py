@@ -0,0 +1,30 @@
+"""
+License API Schemas
+Схемы для API работы с лицензиями
+"""
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ExpiringLicenseCertificateResponse(BaseModel):
+    """Строка списка истекающих лицензий (лицензия и выданный по ней сертификат)"""
+    license_id: int
+    license_title: str
+    season_id: Optional[int] = None
+    end_at: date
+    days_until_expiry: int
+    certificate_id: Optional[int] = None
+    certificate_type: Optional[str] = None
+    club_id: Optional[int] = None
+    club_name: Optional[str] = None
+    club_bin: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ExpiringLicensesResponse(BaseModel):
+    """Страница списка истекающих лицензий"""
+    items: List[ExpiringLicenseCertificateResponse]
+    next_cursor: Optional[str] = None
@@ -53,6 +53,14 @@ class ReportListResponse(BaseModel):
     total_pages: int
 
 
+class ReportCursorListResponse(BaseModel):
+    """Схема ответа со списком отчетов (курсорная пагинация)"""
+    reports: List[ReportResponse]
+    page_size: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
 class GenerateReportResponse(BaseModel):
     """Схема ответа на запрос генерации отчета"""
     report_id: int
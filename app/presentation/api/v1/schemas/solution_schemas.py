@@ -2,7 +2,10 @@
 Pydantic schemas for Solution API
 Схемы для API решений
 """
-from pydantic import BaseModel, Field
+from datetime import date
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class GenerateSolutionRequest(BaseModel):
@@ -15,3 +18,25 @@ class GenerateSolutionRequest(BaseModel):
                 "solution_id": 1
             }
         }
+
+
+class GenerateSolutionBatchRequest(BaseModel):
+    """Запрос на пакетную генерацию решений (например, по заседанию комиссии)"""
+    solution_ids: Optional[List[int]] = Field(None, description="ID решений", min_length=1)
+    meeting_date: Optional[date] = Field(None, description="Дата заседания комиссии")
+    output: Literal["zip", "pdf"] = Field("zip", description="ZIP архив или один объединенный PDF")
+
+    @model_validator(mode="after")
+    def check_selector(self) -> "GenerateSolutionBatchRequest":
+        """Должен быть указан ровно один способ выбора решений"""
+        if (self.solution_ids is None) == (self.meeting_date is None):
+            raise ValueError("Specify either solution_ids or meeting_date")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "meeting_date": "2024-06-14",
+                "output": "zip"
+            }
+        }
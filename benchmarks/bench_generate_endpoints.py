@@ -0,0 +1,332 @@
+"""
+Бенчмарк эндпоинтов генерации PDF
+Пропускная способность и задержки p50/p95/p99 для /reports, /initial-reports,
+/solutions, /department-reports и /certificates на наполненной тестовой БД
+и заглушке PDF сервиса; результаты сохраняются в JSON для сравнения между запусками
+
+Запуск: python -m benchmarks.bench_generate_endpoints [--clubs 300] [--docs-per-club 20]
+        [--requests 200] [--concurrency 8] [--pdf-delay 0] [--output results.json]
+        [--baseline previous.json] [--max-regression 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.stub_pdf_server import StubPdfServer
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Эндпоинт -> (путь, поле ID в теле запроса, набор ID из SeedSummary)
+ENDPOINTS = {
+    "reports": ("/api/v1/reports/generate", "report_id", "reports"),
+    "initial_reports": ("/api/v1/initial-reports/generate", "report_id", "clubs"),
+    "solutions": ("/api/v1/solutions/generate", "solution_id", "clubs"),
+    "department_reports": ("/api/v1/department-reports/generate", "report_id", "reports"),
+    "certificates": ("/api/v1/certificates/generate", "certificate_id", "clubs"),
+}
+
+# Количество SQL запросов из заголовка Server-Timing
+SERVER_TIMING_QUERIES = re.compile(r'db;desc="(\d+) queries"')
+
+# Настройки, влияющие на результат (сохраняются вместе с замерами)
+RECORDED_SETTINGS = (
+    "PDF_BACKEND",
+    "PDF_CACHE_ENABLED",
+    "PDF_CACHE_MODE",
+    "PDF_RESPONSE_MODE",
+    "PDF_REQUEST_CONCURRENCY",
+    "PUPPETEER_MAX_CONNECTIONS",
+    "PUPPETEER_STREAM_UPLOAD",
+    "ASSET_MODE",
+    "CERTIFICATE_BG_QUALITY",
+)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Перцентиль с линейной интерполяцией (q от 0 до 100)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+async def bench_endpoint(
+    client: httpx.AsyncClient,
+    stub: StubPdfServer,
+    name: str,
+    ids: List[int],
+    requests: int,
+    concurrency: int,
+    warmup: int
+) -> Dict[str, Any]:
+    """
+    Измерить один эндпоинт генерации
+
+    Запросы идут по ID сущностей по кругу, одновременно выполняется не
+    более concurrency запросов. Задержки учитываются только для успешных ответов.
+
+    Returns:
+        Результаты замера эндпоинта
+    """
+    path, id_field, _ = ENDPOINTS[name]
+
+    for i in range(warmup):
+        await client.post(path, json={id_field: ids[i % len(ids)]})
+
+    renders_before = stub.stats()["renders"]
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors: Dict[str, int] = {}
+    # Общий итератор номеров запросов: каждый воркер берет следующий свободный
+    numbers = iter(range(requests))
+
+    async def worker() -> None:
+        for number in numbers:
+            body = {id_field: ids[(warmup + number) % len(ids)]}
+            started = time.perf_counter()
+            response = await client.post(path, json=body)
+            elapsed = time.perf_counter() - started
+
+            if response.status_code != 200:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+            latencies.append(elapsed)
+            match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+
+    latencies.sort()
+    to_ms = 1000
+    return {
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "ok": len(latencies),
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_rps": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            "min": round(latencies[0] * to_ms, 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies) * to_ms, 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * to_ms, 2),
+            "p95": round(percentile(latencies, 95) * to_ms, 2),
+            "p99": round(percentile(latencies, 99) * to_ms, 2),
+            "max": round(latencies[-1] * to_ms, 2) if latencies else 0.0,
+        },
+        "sql_queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "pdf_renders_per_request": round((stub.stats()["renders"] - renders_before) / requests, 2),
+    }
+
+
+async def run(args: argparse.Namespace, stub: StubPdfServer, database_url: str) -> Dict[str, Any]:
+    """
+    Наполнить БД, поднять приложение и измерить выбранные эндпоинты
+
+    Returns:
+        Результаты запуска (метаданные и замеры по эндпоинтам)
+    """
+    # Настройки приложения читаются при импорте - окружение уже подготовлено в main()
+    from app.core.config import settings
+    from app.core.database import get_db
+    from app.core.instrumentation import instrument_engine
+    from app.main import app
+    from benchmarks.seed import seed_database
+
+    engine = create_async_engine(database_url)
+    # Количество SQL запросов попадает в Server-Timing так же, как с основной БД
+    instrument_engine(engine)
+
+    print(f"Seeding {database_url} ...")
+    seeded_at = time.perf_counter()
+    summary = await seed_database(
+        engine,
+        clubs=args.clubs,
+        docs_per_club=args.docs_per_club,
+        categories=args.categories,
+        seed=args.seed
+    )
+    print(
+        f"Seeded {summary.clubs} clubs, {summary.application_documents} application documents, "
+        f"{summary.reports} reports in {time.perf_counter() - seeded_at:.1f}s"
+    )
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_benchmark_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_benchmark_db
+
+    endpoints: Dict[str, Any] = {}
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=300) as client:
+                for name in args.endpoints:
+                    ids = list(range(1, getattr(summary, ENDPOINTS[name][2]) + 1))
+                    endpoints[name] = await bench_endpoint(
+                        client, stub, name, ids, args.requests, args.concurrency, args.warmup
+                    )
+                    print_result(name, endpoints[name])
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        await engine.dispose()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "parameters": {
+                "clubs": args.clubs,
+                "docs_per_club": args.docs_per_club,
+                "categories": args.categories,
+                "seed": args.seed,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "warmup": args.warmup,
+                "pdf_delay": args.pdf_delay,
+                "database": database_url.split("://", 1)[0],
+            },
+            "dataset": asdict(summary),
+            "settings": {name: getattr(settings, name) for name in RECORDED_SETTINGS},
+        },
+        "endpoints": endpoints,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Текущий коммит репозитория (None - не удалось определить)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    """Вывести строку результата эндпоинта"""
+    latency = result["latency_ms"]
+    errors = sum(result["errors"].values())
+    print(
+        f"{name:>20} {result['throughput_rps']:>9.1f} {latency['p50']:>9.1f} {latency['p95']:>9.1f} "
+        f"{latency['p99']:>9.1f} {result['sql_queries_per_request'] or 0:>8.1f} {errors:>7}"
+    )
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """
+    Вывести изменения относительно предыдущего запуска
+
+    Returns:
+        Наибольшее ухудшение p95 в процентах (0 - ухудшений нет)
+    """
+    print()
+    print(f"{'compared to':>20} {baseline['meta'].get('git_commit') or baseline['meta']['timestamp']}")
+    print(f"{'endpoint':>20} {'rps, %':>9} {'p50, %':>9} {'p95, %':>9} {'p99, %':>9}")
+
+    def change(current: float, previous: float) -> float:
+        return (current - previous) / previous * 100 if previous else 0.0
+
+    worst = 0.0
+    for name, result in results["endpoints"].items():
+        previous = baseline["endpoints"].get(name)
+        if previous is None:
+            continue
+        p95_change = change(result["latency_ms"]["p95"], previous["latency_ms"]["p95"])
+        worst = max(worst, p95_change)
+        print(
+            f"{name:>20} {change(result['throughput_rps'], previous['throughput_rps']):>+9.1f} "
+            f"{change(result['latency_ms']['p50'], previous['latency_ms']['p50']):>+9.1f} "
+            f"{p95_change:>+9.1f} "
+            f"{change(result['latency_ms']['p99'], previous['latency_ms']['p99']):>+9.1f}"
+        )
+    return worst
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of the PDF generation endpoints")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--clubs", type=int, default=300)
+    parser.add_argument("--docs-per-club", type=int, default=20)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--pdf-delay", type=float, default=0.0, help="Stub renderer delay, seconds")
+    parser.add_argument("--pdf-cache", action="store_true", help="Keep the PDF cache enabled")
+    parser.add_argument(
+        "--database-url",
+        help="Empty database to seed (default: temporary SQLite file via aiosqlite)"
+    )
+    parser.add_argument("--output", help="Results JSON (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", help="Previous results JSON to compare with")
+    parser.add_argument(
+        "--max-regression", type=float,
+        help="Exit with code 1 if p95 of any endpoint grew by more than this many percent"
+    )
+    args = parser.parse_args()
+
+    stub = StubPdfServer(delay=args.pdf_delay)
+    stub.start()
+
+    # Приложение обращается к заглушке; кеш PDF по умолчанию выключен, чтобы
+    # каждый запрос проходил весь конвейер генерации
+    os.environ["PDF_BACKEND"] = "puppeteer"
+    os.environ["PUPPETEER_PDF_URL"] = stub.url
+    os.environ["PDF_CACHE_ENABLED"] = str(args.pdf_cache)
+
+    print(f"{'endpoint':>20} {'rps':>9} {'p50, ms':>9} {'p95, ms':>9} {'p99, ms':>9} {'queries':>8} {'errors':>7}")
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-") as tmp_dir:
+            database_url = args.database_url or f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+            results = asyncio.run(run(args, stub, database_url))
+    finally:
+        stub.shutdown()
+        stub.server_close()
+
+    output = args.output or os.path.join(
+        BENCHMARKS_DIR, "results", f"generate_endpoints_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            worst = compare(results, json.load(f))
+        if args.max_regression is not None and worst > args.max_regression:
+            print(f"\np95 regression {worst:.1f}% exceeds {args.max_regression}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Микро-бенчмарк агрегации документов решения
+Запуск: python -m benchmarks.bench_solution_aggregator [--docs 100 500 1000] [--repeat 200]
+"""
+import argparse
+import random
+import timeit
+from datetime import date
+from types import SimpleNamespace
+
+from app.application.dto.report_generation_dto import CategoryExpertMapping
+from app.application.services.solution_aggregator import aggregate_solution_documents
+
+
+CATEGORY_VALUES = ["legal", "financial", "sport", "infrastructure", "social", "admin"]
+
+
+def build_fixture(docs_count: int, categories_count: int = 12, seed: int = 42):
+    """Построить документы и критерии заявки в памяти (без БД)"""
+    rnd = random.Random(seed)
+
+    categories = [
+        SimpleNamespace(
+            id=i,
+            title_ru=f"Категория {i}",
+            value=CATEGORY_VALUES[i % len(CATEGORY_VALUES)]
+        )
+        for i in range(1, categories_count + 1)
+    ]
+
+    criteria_by_category = {
+        category.id: SimpleNamespace(
+            id=100 + category.id,
+            checked_by=f"Эксперт {category.id}"
+        )
+        for category in categories
+    }
+
+    documents = []
+    for i in range(docs_count):
+        category = rnd.choice(categories)
+        failed = rnd.random() < 0.25
+        documents.append(
+            SimpleNamespace(
+                category_id=category.id,
+                category=category,
+                document=SimpleNamespace(title_ru=f"Документ {i}"),
+                is_final_passed=None if failed else True,
+                control_comment="Замечание" if failed and rnd.random() < 0.5 else None,
+                industry_comment="Комментарий отрасли",
+                deadline=date(2025, 6, 1) if rnd.random() < 0.8 else None
+            )
+        )
+
+    return documents, criteria_by_category
+
+
+def run(docs_counts, repeat: int) -> None:
+    """Запустить бенчмарк для разных объемов документов"""
+    expert_mapper = CategoryExpertMapping()
+
+    print("=" * 60)
+    print("  aggregate_solution_documents")
+    print("=" * 60)
+    print(f"{'docs':>8} {'mean, ms':>12} {'best, ms':>12} {'docs/s':>14}")
+
+    for docs_count in docs_counts:
+        documents, criteria_by_category = build_fixture(docs_count)
+
+        timer = timeit.Timer(
+            lambda: aggregate_solution_documents(documents, criteria_by_category, expert_mapper)
+        )
+        timings = timer.repeat(repeat=5, number=repeat)
+
+        mean_ms = sum(timings) / len(timings) / repeat * 1000
+        best_ms = min(timings) / repeat * 1000
+        docs_per_sec = docs_count / (best_ms / 1000) if best_ms else 0
+
+        print(f"{docs_count:>8} {mean_ms:>12.3f} {best_ms:>12.3f} {docs_per_sec:>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark for solution aggregation")
+    parser.add_argument("--docs", type=int, nargs="+", default=[60, 200, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    run(args.docs, args.repeat)
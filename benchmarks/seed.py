@@ -0,0 +1,250 @@
+"""
+Наполнение тестовой БД для бенчмарков
+Детерминированные данные через модели приложения: клубы, заявки, документы,
+отчеты, решения и сертификаты
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.database.models import (
+    ApplicationCriteriaModel,
+    ApplicationDocumentModel,
+    ApplicationModel,
+    ApplicationReportModel,
+    Base,
+    CategoryDocumentModel,
+    ClubModel,
+    DocumentModel,
+    LeagueModel,
+    LicenseModel,
+    SeasonModel,
+    UserModel,
+)
+from app.infrastructure.database.models.application_initial_report import ApplicationInitialReportModel
+from app.infrastructure.database.models.application_solution import ApplicationSolutionModel
+from app.infrastructure.database.models.application_step import ApplicationStepModel
+from app.infrastructure.database.models.license_certificate import LicenseCertificateModel
+
+
+CATEGORY_VALUES = ["legal", "financial", "sport", "infrastructure", "social", "admin"]
+
+# Документов в справочнике на одну категорию
+DOCUMENTS_PER_CATEGORY = 5
+
+# Размер пачки строк в одном INSERT
+INSERT_CHUNK = 1000
+
+
+@dataclass
+class SeedSummary:
+    """
+    Объем созданных данных (ID сущностей идут подряд с 1)
+
+    Attributes:
+        clubs: Клубы (и заявки, решения, сертификаты, начальные отчеты - по одному на клуб)
+        application_documents: Документы заявок
+        reports: Отчеты департаментов (application_reports)
+    """
+    clubs: int
+    application_documents: int
+    reports: int
+
+
+async def seed_database(
+    engine: AsyncEngine,
+    clubs: int = 300,
+    docs_per_club: int = 20,
+    categories: int = 12,
+    seed: int = 42
+) -> SeedSummary:
+    """
+    Создать схему и наполнить пустую БД
+
+    Args:
+        engine: Async engine тестовой БД
+        clubs: Количество клубов (на каждый - заявка, решение, сертификат)
+        docs_per_club: Документов в заявке клуба
+        categories: Количество категорий документов (критериев заявки)
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        Объем созданных данных
+    """
+    rnd = random.Random(seed)
+    stamp = {"created_at": datetime(2025, 1, 1), "updated_at": datetime(2025, 1, 1)}
+
+    rows: Dict[Any, List[Dict[str, Any]]] = {
+        UserModel: [
+            {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "phone": "+77000000000",
+                "username": f"user{i}",
+                "password": "-",
+                "first_name": f"Имя{i}",
+                "last_name": f"Фамилия{i}",
+                "patronymic": None,
+                "position": "Эксперт" if i % 2 else None,
+                "is_active": True,
+                "verified": True,
+                **stamp
+            }
+            for i in range(1, 21)
+        ],
+        SeasonModel: [{
+            "id": 1, "title_ru": "2025", "title_kk": "2025", "value": "2025",
+            "start": date(2025, 1, 1), "end": date(2025, 12, 31), "is_active": True, **stamp
+        }],
+        LeagueModel: [{
+            "id": 1, "title_ru": "Премьер-лига", "title_kk": "Премьер-лига", "value": "premier",
+            "is_active": True, "level": 1, **stamp
+        }],
+        LicenseModel: [{
+            "id": 1, "season_id": 1, "league_id": 1,
+            "title_ru": "Лицензия Премьер-лиги 2025", "title_kk": "Лицензия 2025",
+            "start_at": date(2025, 1, 1), "end_at": date(2025, 12, 31), "is_active": True, **stamp
+        }],
+        CategoryDocumentModel: [
+            {
+                "id": c,
+                "title_ru": f"Категория {c}",
+                "title_kk": f"Санат {c}",
+                "value": f"{CATEGORY_VALUES[(c - 1) % len(CATEGORY_VALUES)]}_{c}",
+                "level": 1,
+                **stamp
+            }
+            for c in range(1, categories + 1)
+        ],
+        DocumentModel: [
+            {
+                "id": (c - 1) * DOCUMENTS_PER_CATEGORY + k,
+                "category_id": c,
+                "title_ru": f"Документ {c}.{k}",
+                "title_kk": f"Құжат {c}.{k}",
+                **stamp
+            }
+            for c in range(1, categories + 1)
+            for k in range(1, DOCUMENTS_PER_CATEGORY + 1)
+        ],
+    }
+    for model in (ClubModel, ApplicationModel, ApplicationCriteriaModel, ApplicationDocumentModel,
+                  ApplicationReportModel, ApplicationInitialReportModel, ApplicationSolutionModel,
+                  ApplicationStepModel, LicenseCertificateModel):
+        rows[model] = []
+
+    document_id = 0
+    criteria_id = 0
+    for club_id in range(1, clubs + 1):
+        rows[ClubModel].append({
+            "id": club_id,
+            "full_name_ru": f"Футбольный клуб {club_id}",
+            "full_name_kk": f"Футбол клубы {club_id}",
+            "full_name_en": f"Football Club {club_id}",
+            "short_name_ru": f"ФК {club_id}",
+            "short_name_kk": f"ФК {club_id}",
+            "bin": f"{club_id:012d}",
+            "foundation_date": date(2000, 1, 1),
+            "legal_address": "г. Астана",
+            "actual_address": "г. Астана",
+            "verified": True,
+            **stamp
+        })
+        # Заявка клуба: ID заявки совпадает с ID клуба
+        rows[ApplicationModel].append({
+            "id": club_id, "user_id": 1, "license_id": 1, "club_id": club_id, "category_id": 1,
+            "is_ready": True, "is_active": True, **stamp
+        })
+
+        criteria_ids = {}
+        for category_id in range(1, categories + 1):
+            criteria_id += 1
+            criteria_ids[category_id] = criteria_id
+            rows[ApplicationCriteriaModel].append({
+                "id": criteria_id,
+                "application_id": club_id,
+                "category_id": category_id,
+                "status_id": 1,
+                "uploaded_by_id": 1,
+                "first_checked_by_id": 2,
+                "checked_by_id": rnd.randint(1, 20),
+                "checked_by": f"Эксперт {category_id}",
+                "control_checked_by_id": 3,
+                "is_ready": True,
+                "is_first_passed": True,
+                "is_industry_passed": True,
+                "is_final_passed": True,
+                "can_reupload_after_ending": False,
+                **stamp
+            })
+
+        documents_by_category: Dict[int, List[int]] = {}
+        for _ in range(docs_per_club):
+            document_id += 1
+            category_id = rnd.randint(1, categories)
+            documents_by_category.setdefault(category_id, []).append(document_id)
+            failed = rnd.random() < 0.25
+            rows[ApplicationDocumentModel].append({
+                "id": document_id,
+                "application_id": club_id,
+                "category_id": category_id,
+                "document_id": (category_id - 1) * DOCUMENTS_PER_CATEGORY + rnd.randint(1, DOCUMENTS_PER_CATEGORY),
+                "uploaded_by_id": 1,
+                "first_checked_by_id": 2,
+                "is_first_passed": True,
+                "checked_by_id": 3,
+                "is_industry_passed": rnd.random() < 0.8,
+                "industry_comment": "Замечаний нет",
+                "control_checked_by_id": 4,
+                "is_final_passed": not failed,
+                "control_comment": "Требуется доработка" if failed else None,
+                "deadline": date(2025, 6, 1),
+                **stamp
+            })
+
+        club_documents = [
+            str(doc_id) for doc_ids in documents_by_category.values() for doc_id in doc_ids
+        ]
+        for category_id in range(1, categories + 1):
+            rows[ApplicationReportModel].append({
+                "application_id": club_id,
+                "criteria_id": criteria_ids[category_id],
+                "status": 1,
+                "list_documents": [str(doc_id) for doc_id in documents_by_category.get(category_id, [])],
+                **stamp
+            })
+        rows[ApplicationInitialReportModel].append({
+            "id": club_id, "application_id": club_id, "criteria_id": criteria_ids[1], "status": 1, **stamp
+        })
+        rows[ApplicationSolutionModel].append({
+            "id": club_id,
+            "application_id": club_id,
+            "meeting_date": date(2025, 3, 1),
+            "list_documents": club_documents,
+            "list_criteria": [{"title": "Категория 1", "type": "Замечание", "deadline": "01.06.2025"}],
+            **stamp
+        })
+        rows[ApplicationStepModel].append({
+            "id": club_id, "application_id": club_id, "application_criteria_id": criteria_ids[1],
+            "status_id": 9, "responsible_id": 5, "is_passed": True, "result": "Принято", **stamp
+        })
+        rows[LicenseCertificateModel].append({
+            "id": club_id, "application_id": club_id, "license_id": 1, "club_id": club_id, **stamp
+        })
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Порядок вставки соответствует внешним ключам
+        for model, model_rows in rows.items():
+            for start in range(0, len(model_rows), INSERT_CHUNK):
+                await conn.execute(insert(model), model_rows[start:start + INSERT_CHUNK])
+
+    return SeedSummary(
+        clubs=clubs,
+        application_documents=document_id,
+        reports=len(rows[ApplicationReportModel])
+    )
@@ -0,0 +1,135 @@
+"""
+Заглушка PDF сервиса Puppeteer для бенчмарков
+Контракт /render: POST {"html": "..."} -> application/pdf (тело может передаваться chunked)
+Запуск отдельно: python -m benchmarks.stub_pdf_server [--port 3002] [--delay 0.2]
+"""
+import argparse
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+from PyPDF2 import PdfWriter
+
+
+def build_stub_pdf() -> bytes:
+    """Одностраничный пустой PDF формата A4"""
+    writer = PdfWriter()
+    writer.add_blank_page(595, 842)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class StubPdfHandler(BaseHTTPRequestHandler):
+    """Обработчик POST /render: читает HTML и возвращает заготовленный PDF"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/render":
+            self._send(404, b"Not found", "text/plain")
+            return
+
+        body = self._read_body()
+        try:
+            html = json.loads(body)["html"]
+        except (ValueError, KeyError, TypeError):
+            self._send(400, b"Expected JSON body with 'html'", "text/plain")
+            return
+
+        server: StubPdfServer = self.server
+        if server.delay:
+            # Имитация времени рендеринга Chromium
+            time.sleep(server.delay)
+        server.record(len(html))
+        self._send(200, server.pdf, "application/pdf")
+
+    def _read_body(self) -> bytes:
+        """Прочитать тело запроса (Content-Length или chunked)"""
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+            if size == 0:
+                # Пропускаем завершающие заголовки (trailer) до пустой строки
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _send(self, status: int, content: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        # Журнал каждого запроса искажает замеры
+        pass
+
+
+class StubPdfServer(ThreadingHTTPServer):
+    """
+    Многопоточный HTTP сервер заглушки
+
+    Attributes:
+        delay: Искусственная задержка ответа в секундах
+        pdf: Возвращаемый PDF
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0):
+        super().__init__((host, port), StubPdfHandler)
+        self.delay = delay
+        self.pdf = build_stub_pdf()
+        self._lock = threading.Lock()
+        self._renders = 0
+        self._html_bytes = 0
+
+    @property
+    def url(self) -> str:
+        """URL эндпоинта /render для PUPPETEER_PDF_URL"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/render"
+
+    def record(self, html_size: int) -> None:
+        """Учесть обработанный запрос рендеринга"""
+        with self._lock:
+            self._renders += 1
+            self._html_bytes += html_size
+
+    def stats(self) -> Dict[str, int]:
+        """Количество рендеров и суммарный объем полученного HTML"""
+        with self._lock:
+            return {"renders": self._renders, "html_bytes": self._html_bytes}
+
+    def start(self) -> threading.Thread:
+        """Запустить сервер в фоновом потоке"""
+        thread = threading.Thread(target=self.serve_forever, name="stub-pdf-server", daemon=True)
+        thread.start()
+        return thread
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub of the Puppeteer /render service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3002)
+    parser.add_argument("--delay", type=float, default=0.0, help="Artificial render delay, seconds")
+    args = parser.parse_args()
+
+    server = StubPdfServer(args.host, args.port, args.delay)
+    print(f"Stub PDF server listening on {server.url} (delay {args.delay}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
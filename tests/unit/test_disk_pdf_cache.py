@@ -0,0 +1,86 @@
+"""
+Тесты DiskPdfCache: вытеснение по LRU и общая директория нескольких воркеров
+"""
+import pytest
+
+from app.infrastructure.services.disk_pdf_cache import DiskPdfCache
+
+
+def document(marker: bytes, size: int = 100) -> bytes:
+    """PDF-заглушка заданного размера"""
+    return marker * size
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(tmp_path):
+    """При превышении max_bytes удаляется давно не использованный документ"""
+    cache = DiskPdfCache(str(tmp_path), max_bytes=250)
+
+    await cache.put("a", document(b"a"))
+    await cache.put("b", document(b"b"))
+    # Чтение делает "a" недавно использованным - вытесняется "b"
+    assert await cache.get("a") == document(b"a")
+    await cache.put("c", document(b"c"))
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == document(b"a")
+    assert await cache.get("c") == document(b"c")
+    assert not (tmp_path / "b.pdf").exists()
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size_bytes"] == 200
+
+
+@pytest.mark.asyncio
+async def test_skips_documents_larger_than_cache(tmp_path):
+    """Документ больше всего кеша не сохраняется и не вытесняет остальные"""
+    cache = DiskPdfCache(str(tmp_path), max_bytes=150)
+
+    await cache.put("a", document(b"a"))
+    await cache.put("huge", document(b"h", 200))
+
+    assert await cache.get("huge") is None
+    assert await cache.get("a") == document(b"a")
+
+
+@pytest.mark.asyncio
+async def test_restores_lru_order_after_restart(tmp_path):
+    """Порядок использования восстанавливается по времени изменения файлов"""
+    cache = DiskPdfCache(str(tmp_path), max_bytes=250)
+    await cache.put("a", document(b"a"))
+    await cache.put("b", document(b"b"))
+    await cache.get("a")
+
+    restarted = DiskPdfCache(str(tmp_path), max_bytes=250)
+    await restarted.put("c", document(b"c"))
+
+    assert await restarted.get("b") is None
+    assert await restarted.get("a") == document(b"a")
+
+
+@pytest.mark.asyncio
+async def test_serves_document_written_by_another_worker(tmp_path):
+    """Документ, записанный другим воркером, отдается без повторной генерации"""
+    worker_1 = DiskPdfCache(str(tmp_path), max_bytes=1000)
+    worker_2 = DiskPdfCache(str(tmp_path), max_bytes=1000)
+
+    await worker_1.put("a", document(b"a"))
+
+    assert await worker_2.get("a") == document(b"a")
+    assert worker_2.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limits_whole_directory_across_workers(tmp_path):
+    """max_bytes ограничивает всю директорию, а не долю каждого воркера"""
+    worker_1 = DiskPdfCache(str(tmp_path), max_bytes=250)
+    worker_2 = DiskPdfCache(str(tmp_path), max_bytes=250)
+
+    await worker_1.put("a", document(b"a"))
+    await worker_2.put("b", document(b"b"))
+    await worker_1.put("c", document(b"c"))
+
+    files = sorted(path.name for path in tmp_path.glob("*.pdf"))
+    assert files == ["b.pdf", "c.pdf"]
+    assert await worker_2.get("a") is None
@@ -0,0 +1,29 @@
+"""
+Тесты instrument_engine: учет успешных и завершившихся ошибкой SQL запросов
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.instrumentation import instrument_engine, request_scope
+
+
+@pytest.mark.asyncio
+async def test_counts_successful_and_failed_statements():
+    """Запрос, завершившийся ошибкой, учитывается наравне с успешными"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine)
+
+    try:
+        with request_scope() as metrics:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 2"))
+    finally:
+        await engine.dispose()
+
+    assert metrics.queries == 3
+    assert metrics.db_seconds > 0
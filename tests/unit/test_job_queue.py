@@ -0,0 +1,87 @@
+"""
+Тесты DocumentJobQueue: порядок выполнения по приоритету типа документа
+"""
+import asyncio
+
+import pytest
+
+from app.application.services.job_queue import DocumentJobQueue, JobQueueFullError
+from app.domain.entities.report import ReportStatus, ReportType
+
+
+def submit_document(queue: DocumentJobQueue, document_type: str, run):
+    """Поставить задачу так же, как POST /jobs"""
+    return queue.submit(
+        name=f"{document_type}:1",
+        report_type=ReportType.CUSTOM,
+        parameters={"document_type": document_type, "document_id": 1},
+        filename=f"{document_type}_1.pdf",
+        run=run
+    )
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_dequeued_by_document_priority():
+    """Задачи выполняются по приоритету типа документа, при равном - по порядку поступления"""
+    queue = DocumentJobQueue(workers=1, max_pending=10, result_ttl=60, retry_after=5)
+    await queue.start()
+
+    executed = []
+    blocker_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocker():
+        blocker_started.set()
+        await release.wait()
+        return b""
+
+    def recorder(name: str):
+        async def run():
+            executed.append(name)
+            return b""
+        return run
+
+    try:
+        # Единственный воркер занят - остальные задачи копятся в очереди
+        submit_document(queue, "report", blocker)
+        await blocker_started.wait()
+
+        submitted = ["report", "department_report", "solution", "initial_report", "certificate"]
+        jobs = [submit_document(queue, document_type, recorder(document_type)) for document_type in submitted]
+        release.set()
+
+        async def all_finished():
+            while not all(job.report.status == ReportStatus.COMPLETED for job in jobs):
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(all_finished(), timeout=5)
+    finally:
+        await queue.stop()
+
+    assert executed == ["solution", "certificate", "department_report", "initial_report", "report"]
+    assert jobs[0].priority < jobs[1].priority < jobs[2].priority
+
+
+@pytest.mark.asyncio
+async def test_submit_raises_when_queue_is_full():
+    """Переполнение очереди - JobQueueFullError с Retry-After"""
+    queue = DocumentJobQueue(workers=1, max_pending=1, result_ttl=60, retry_after=7)
+    await queue.start()
+    release = asyncio.Event()
+
+    async def wait():
+        await release.wait()
+        return b""
+
+    try:
+        submit_document(queue, "solution", wait)
+        # Даем воркеру взять первую задачу - вторая остается в очереди
+        await asyncio.sleep(0)
+        submit_document(queue, "solution", wait)
+
+        with pytest.raises(JobQueueFullError) as error:
+            submit_document(queue, "solution", wait)
+        assert error.value.retry_after == 7
+    finally:
+        release.set()
+        await queue.stop()
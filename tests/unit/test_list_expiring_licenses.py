@@ -0,0 +1,87 @@
+"""
+Тесты ListExpiringLicensesUseCase: постраничный обход по курсору
+"""
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.use_cases.list_expiring_licenses import ListExpiringLicensesUseCase
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.club import ClubModel
+from app.infrastructure.database.models.license import LicenseModel
+from app.infrastructure.database.models.license_certificate import LicenseCertificateModel
+
+
+TODAY = date(2025, 6, 1)
+
+# (license_id, certificate_id) в порядке сортировки (end_at, license_id, certificate_id или 0)
+EXPECTED_ROWS = [(1, None), (2, 11), (2, 12), (2, 13), (3, None), (4, 10)]
+
+
+def license_model(license_id: int, end_at: date) -> LicenseModel:
+    """Лицензия, истекающая end_at"""
+    return LicenseModel(
+        id=license_id,
+        title_ru=f"Лицензия {license_id}",
+        title_kk=f"Лицензия {license_id}",
+        start_at=date(2025, 1, 1),
+        end_at=end_at,
+        is_active=True
+    )
+
+
+@asynccontextmanager
+async def seeded_session():
+    """SQLite в памяти: лицензии без сертификатов и с несколькими сертификатами"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [ClubModel.__table__, LicenseModel.__table__, LicenseCertificateModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        same_day = TODAY + timedelta(days=5)
+        db.add(ClubModel(
+            id=1, full_name_ru="Клуб", full_name_kk="Клуб", short_name_ru="К", short_name_kk="К",
+            bin="000000000001", foundation_date=date(2000, 1, 1), legal_address="-", actual_address="-",
+            verified=True
+        ))
+        db.add_all([
+            license_model(1, same_day),
+            license_model(2, same_day),
+            license_model(3, same_day),
+            license_model(4, TODAY + timedelta(days=10)),
+            # За горизонтом и уже истекшая - не попадают в выборку
+            license_model(5, TODAY + timedelta(days=40)),
+            license_model(6, TODAY - timedelta(days=1)),
+        ])
+        db.add_all([
+            LicenseCertificateModel(id=certificate_id, application_id=1, license_id=license_id, club_id=1)
+            for certificate_id, license_id in ((13, 2), (11, 2), (12, 2), (10, 4), (14, 5))
+        ])
+        await db.commit()
+        yield db
+    await engine.dispose()
+
+
+async def collect_pages(use_case: ListExpiringLicensesUseCase, limit: int):
+    """Пройти все страницы по курсору"""
+    rows, cursor = [], None
+    while True:
+        page = await use_case.execute(30, limit=limit, cursor=cursor, today=TODAY)
+        rows.extend((item.license_id, item.certificate_id) for item in page.items)
+        if page.next_cursor is None:
+            return rows
+        cursor = page.next_cursor
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 2, 4, 100])
+async def test_pages_cover_licenses_with_and_without_certificates(limit):
+    """Лицензии без сертификатов (certificate_id = 0 в курсоре) не теряются и не повторяются"""
+    async with seeded_session() as db:
+        rows = await collect_pages(ListExpiringLicensesUseCase(db), limit)
+
+    assert rows == EXPECTED_ROWS
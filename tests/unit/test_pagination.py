@@ -0,0 +1,108 @@
+"""
+Тесты курсорной пагинации: кодирование курсора, условие keyset и кеш количества
+"""
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+
+from app.core import pagination
+from app.core.pagination import CountCache, decode_cursor, encode_cursor, keyset_condition
+
+
+metadata = MetaData()
+rows_table = Table(
+    "rows",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("a", Integer),
+    Column("b", Integer),
+)
+
+
+@pytest.fixture
+def connection():
+    """SQLite в памяти с повторяющимися значениями первых колонок ключа"""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.connect() as conn:
+        rows = [
+            {"id": index, "a": index % 3, "b": index % 2}
+            for index in range(1, 13)
+        ]
+        conn.execute(insert(rows_table), rows)
+        yield conn
+    engine.dispose()
+
+
+def test_cursor_round_trip():
+    """Курсор восстанавливает значения ключа с исходными типами"""
+    values = (date(2025, 3, 1), datetime(2025, 3, 1, 12, 30, 5), 42, "Лицензия")
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, (date, datetime, int, str)) == values
+
+
+@pytest.mark.parametrize("cursor, types", [
+    ("not base64!", (int,)),
+    (encode_cursor([1, 2]), (int,)),
+    (encode_cursor([True]), (int,)),
+    (encode_cursor(["2025-13-01"]), (date,)),
+    (encode_cursor([1]), (str,)),
+    (encode_cursor([None]), (date,)),
+])
+def test_malformed_cursor_raises_value_error(cursor, types):
+    """Поврежденный или чужой курсор - ValueError"""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, types)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_condition_returns_rows_after_cursor(connection, descending):
+    """Для каждой записи условие отбирает ровно записи, следующие за ней в сортировке"""
+    columns = (rows_table.c.a, rows_table.c.b, rows_table.c.id)
+    order = [column.desc() if descending else column.asc() for column in columns]
+    ordered = connection.execute(select(*columns).order_by(*order)).all()
+
+    for position, row in enumerate(ordered):
+        after = connection.execute(
+            select(*columns).where(keyset_condition(columns, tuple(row), descending)).order_by(*order)
+        ).all()
+        assert after == ordered[position + 1:]
+
+
+def test_keyset_condition_bounds_leading_column():
+    """Первая колонка дополнительно ограничена диапазоном для использования индекса"""
+    columns = (rows_table.c.a, rows_table.c.id)
+
+    ascending = str(keyset_condition(columns, (1, 5)).compile(compile_kwargs={"literal_binds": True}))
+    descending = str(keyset_condition(columns, (1, 5), descending=True).compile(compile_kwargs={"literal_binds": True}))
+
+    assert ascending.startswith("rows.a >= 1 AND")
+    assert descending.startswith("rows.a <= 1 AND")
+
+
+def test_count_cache_expires_after_ttl(monkeypatch):
+    """Значение отдается до истечения ttl и сбрасывается после"""
+    now = [100.0]
+    monkeypatch.setattr(pagination.time, "monotonic", lambda: now[0])
+    cache = CountCache(ttl=30)
+
+    cache.set(("pending",), 7)
+    now[0] += 29
+    assert cache.get(("pending",)) == 7
+    assert cache.get(("completed",)) is None
+
+    now[0] += 2
+    assert cache.get(("pending",)) is None
+
+
+def test_count_cache_disabled_with_zero_ttl():
+    """ttl=0 - значения не кешируются"""
+    cache = CountCache(ttl=0)
+
+    cache.set(("pending",), 7)
+
+    assert cache.get(("pending",)) is None
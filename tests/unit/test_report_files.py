@@ -0,0 +1,98 @@
+"""
+Тесты удаления файлов отчетов: файл удаляется, когда на него больше не ссылается ни один отчет
+"""
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.use_cases.delete_report import DeleteReportUseCase
+from app.application.use_cases.generate_report import GenerateReportUseCase
+from app.domain.entities.report import Report, ReportStatus, ReportType
+from app.domain.services.report_renderer import IReportRenderer
+from app.domain.services.report_service import ReportDomainService
+from app.infrastructure.database.models.report import ReportModel
+from app.infrastructure.database.repositories.report_repository_impl import ReportRepositoryImpl
+from app.infrastructure.services.disk_report_store import DiskReportStore
+
+
+class SequenceRenderer(IReportRenderer):
+    """Генератор, возвращающий заданное содержимое по очереди"""
+
+    def __init__(self, *contents: bytes):
+        self.contents = list(contents)
+
+    async def render(self, report: Report) -> bytes:
+        return self.contents.pop(0)
+
+
+@asynccontextmanager
+async def report_repository():
+    """Репозиторий отчетов на SQLite в памяти"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: ReportModel.__table__.create(sync_conn))
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        yield ReportRepositoryImpl(db)
+    await engine.dispose()
+
+
+async def create_report(repository: ReportRepositoryImpl) -> Report:
+    """Отчет, готовый к генерации"""
+    return await repository.create(Report(
+        name="Лицензии",
+        report_type=ReportType.LICENSE_DETAILS,
+        parameters={"license_ids": [1]}
+    ))
+
+
+def generate_use_case(repository, store, *contents: bytes) -> GenerateReportUseCase:
+    """Use case генерации с генератором заданного содержимого"""
+    return GenerateReportUseCase(
+        repository,
+        ReportDomainService(),
+        report_renderers={ReportType.LICENSE_DETAILS: SequenceRenderer(*contents)},
+        report_store=store
+    )
+
+
+@pytest.mark.asyncio
+async def test_regeneration_removes_previous_file(tmp_path):
+    """Перегенерация с другим содержимым удаляет файл предыдущей генерации"""
+    store = DiskReportStore(str(tmp_path))
+    async with report_repository() as repository:
+        report = await create_report(repository)
+        use_case = generate_use_case(repository, store, b"first", b"second")
+
+        first = await use_case.execute(report.id)
+        second = await use_case.execute(report.id)
+
+    assert second.status == ReportStatus.COMPLETED
+    assert await store.get(first.file_path) is None
+    assert await store.get(second.file_path) == b"second"
+
+
+@pytest.mark.asyncio
+async def test_shared_file_kept_until_last_report_deleted(tmp_path):
+    """Файл с одинаковым содержимым удаляется вместе с последним ссылающимся отчетом"""
+    store = DiskReportStore(str(tmp_path))
+    async with report_repository() as repository:
+        report_1 = await create_report(repository)
+        report_2 = await create_report(repository)
+        use_case = generate_use_case(repository, store, b"same", b"same", b"other")
+        shared = (await use_case.execute(report_1.id)).file_path
+        await use_case.execute(report_2.id)
+
+        # Перегенерация одного отчета не удаляет файл, на который ссылается второй
+        await use_case.execute(report_1.id)
+        assert await store.get(shared) == b"same"
+
+        delete = DeleteReportUseCase(repository, store)
+        await delete.execute(report_2.id)
+        assert await store.get(shared) is None
+
+        other = (await repository.get_by_id(report_1.id)).file_path
+        await delete.execute(report_1.id)
+        assert await store.get(other) is None